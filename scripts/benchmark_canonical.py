@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""Benchmark attribute resolution of plugins in a project with 500 plugins."""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from meltano.core.behavior.canonical import Canonical
+from meltano.core.plugin import PluginType
+from meltano.core.plugin.project_plugin import ProjectPlugin
+
+PLUGIN_COUNT = 500
+ATTRS = (
+    "type",
+    "name",
+    "namespace",
+    "label",
+    "logo_url",
+    "variant",
+    "pip_url",
+    "executable",
+    "capabilities",
+    "settings",
+)
+
+
+def make_plugins(count: int) -> list[ProjectPlugin]:
+    """Create custom plugins, each with a plugin inheriting from it.
+
+    Args:
+        count: The total number of plugins to create.
+
+    Returns:
+        The inheriting plugins, whose attributes go through the fallback chain.
+    """
+    plugins = []
+    for idx in range(count // 2):
+        parent = ProjectPlugin(
+            PluginType.EXTRACTORS,
+            f"tap-custom-{idx}",
+            namespace=f"tap_custom_{idx}",
+            pip_url=f"tap-custom-{idx}",
+            executable=f"tap-custom-{idx}",
+            capabilities=["catalog", "discover", "state"],
+            settings=[{"name": f"setting_{num}"} for num in range(20)],
+        )
+        child = ProjectPlugin(
+            PluginType.EXTRACTORS,
+            f"tap-custom-{idx}--inherited",
+            inherit_from=parent.name,
+        )
+        child.parent = parent
+        plugins.append(child)
+    return plugins
+
+
+def read_attrs(plugins: list[ProjectPlugin]) -> None:
+    """Read the commonly used attributes of every plugin.
+
+    Args:
+        plugins: The plugins to read the attributes of.
+    """
+    for plugin in plugins:
+        for attr in ATTRS:
+            getattr(plugin, attr)
+
+
+def read_attrs_uncached(plugins: list[ProjectPlugin]) -> None:
+    """Read the commonly used attributes of every plugin, resolving each again.
+
+    Args:
+        plugins: The plugins to read the attributes of.
+    """
+    for plugin in plugins:
+        for attr in ATTRS:
+            plugin._resolved = (None, {})  # noqa: WPS437
+            getattr(plugin, attr)
+
+
+def read_attrs_creating_objects(plugins: list[ProjectPlugin]) -> None:
+    """Read the commonly used attributes of every plugin, creating objects in between.
+
+    Resolving settings and plugins creates `Canonical` objects all the time,
+    which must not invalidate the attributes resolved by other objects.
+
+    Args:
+        plugins: The plugins to read the attributes of.
+    """
+    for plugin in plugins:
+        Canonical(name=plugin.name)
+        for attr in ATTRS:
+            getattr(plugin, attr)
+
+
+def create_objects(plugins: list[ProjectPlugin]) -> None:
+    """Only create the objects `read_attrs_creating_objects` creates, for comparison.
+
+    Args:
+        plugins: The plugins to create an object for.
+    """
+    for plugin in plugins:
+        Canonical(name=plugin.name)
+
+
+def main(rounds: int = 20) -> None:
+    """Run the benchmark and print the time per round.
+
+    Args:
+        rounds: The number of times to read the attributes of all plugins.
+    """
+    plugins = make_plugins(PLUGIN_COUNT)
+    benchmarks = (
+        ("uncached", read_attrs_uncached),
+        ("cached", read_attrs),
+        ("cached, creating objects", read_attrs_creating_objects),
+        ("creating objects only", create_objects),
+    )
+    for label, func in benchmarks:
+        seconds = timeit.timeit(lambda: func(plugins), number=rounds)  # noqa: B023
+        print(f"{label:>24}: {seconds / rounds * 1000:.2f} ms per round")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+"""Benchmark merging Singer states with tens of thousands of bookmarks."""
+
+from __future__ import annotations
+
+import json
+import sys
+import timeit
+
+from meltano.core.utils import merge
+
+STREAM_COUNT = 50
+PARTITION_COUNT = 1000
+
+
+def make_state(count: int, offset: int) -> dict:
+    """Create a Singer state with a bookmark per partition of every stream.
+
+    Args:
+        count: The number of partitions per stream.
+        offset: The offset of the partition numbers and bookmark values.
+
+    Returns:
+        The state, as stored for a state ID.
+    """
+    return {
+        "singer_state": {
+            "bookmarks": {
+                f"stream_{stream}": {
+                    "partitions": {
+                        f"partition_{idx}": {
+                            "replication_key": "updated_at",
+                            "replication_key_value": f"2022-01-01T00:00:{idx % 60:02}",
+                        }
+                        for idx in range(offset, offset + count)
+                    }
+                }
+                for stream in range(STREAM_COUNT)
+            }
+        }
+    }
+
+
+def merge_recursive(src: dict, dest: dict) -> dict:
+    """Merge like `merge` did before it was made iterative, for comparison.
+
+    Args:
+        src: The dictionary to merge into `dest`.
+        dest: The dictionary to merge into.
+
+    Returns:
+        The `dest` dictionary.
+    """
+    for key, value in src.items():
+        if isinstance(value, dict):
+            merge_recursive(value, dest.setdefault(key, {}))
+        else:
+            dest[key] = value
+    return dest
+
+
+def main(rounds: int = 5) -> None:
+    """Run the benchmark and print the time per merge.
+
+    Args:
+        rounds: The number of merges to time per implementation.
+    """
+    # States are decoded from JSON before every merge, like when read from a backend
+    partial = json.dumps(make_state(PARTITION_COUNT // 2, PARTITION_COUNT // 4))
+    completed = json.dumps(make_state(PARTITION_COUNT, 0))
+    implementations = (
+        ("recursive", merge_recursive),
+        ("copy", merge),
+        ("adopt", lambda src, dest: merge(src, dest, adopt=True)),
+    )
+    for label, func in implementations:
+        seconds = 0.0
+        for _ in range(rounds):
+            src, dest = json.loads(partial), json.loads(completed)
+            seconds += timeit.timeit(lambda: func(src, dest), number=1)  # noqa: B023
+        print(f"{label:>9}: {seconds / rounds * 1000:.2f} ms per merge")
+
+    # Partial state for streams without completed state is adopted wholesale
+    for label, func in implementations:
+        seconds = 0.0
+        for _ in range(rounds):
+            src = json.loads(completed)
+            seconds += timeit.timeit(lambda: func(src, {}), number=1)  # noqa: B023
+        print(f"{label:>9}: {seconds / rounds * 1000:.2f} ms per merge into empty")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
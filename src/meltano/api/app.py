@@ -12,6 +12,7 @@ from werkzeug.middleware.dispatcher import DispatcherMiddleware
 from meltano import __version__ as meltano_version
 from meltano.api import config as api_config
 from meltano.api.headers import VERSION_HEADER
+from meltano.api.project_cache import project_cache
 from meltano.api.security.auth import HTTP_READONLY_CODE
 from meltano.core.db import project_engine
 from meltano.core.logging.utils import FORMAT, setup_logging
@@ -20,6 +21,7 @@ from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.oauth.app import create_app as create_oauth_service
 
 STATUS_SERVER_ERROR = 500
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
 
 setup_logging()
 
@@ -146,6 +148,12 @@ def create_app(config: dict = {}) -> Flask:  # noqa: WPS210,WPS213,B006
         res.headers[VERSION_HEADER] = meltano_version
         return res
 
+    @app.teardown_request
+    def invalidate_project_cache(exception):
+        # Requests that may have written to the project drop the cached services
+        if request.method not in SAFE_METHODS:
+            project_cache.invalidate()
+
     @app.errorhandler(STATUS_SERVER_ERROR)
     def internal_error(exception):
         logger.info(f"Error: {exception}")
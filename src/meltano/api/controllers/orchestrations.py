@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import os
 import shutil
+from pathlib import Path
 
 import sqlalchemy
 from flask import Response, jsonify, request, send_file
@@ -16,27 +19,27 @@ from meltano.api.executor import run_schedule
 from meltano.api.json import freeze_keys
 from meltano.api.models import db
 from meltano.api.models.subscription import Subscription
+from meltano.api.project_cache import project_cache
 from meltano.api.security.auth import block_if_readonly
 from meltano.core.behavior.canonical import Canonical
 from meltano.core.job import JobFinder
 from meltano.core.logging import (
-    JobLoggingService,
+    COMPRESSED_SUFFIX,
     MissingJobLogException,
     SizeThresholdJobLogException,
 )
 from meltano.core.plugin import PluginRef
+from meltano.core.plugin.project_plugin import ProjectPlugin
 from meltano.core.plugin.settings_service import PluginSettingsService
 from meltano.core.plugin_discovery_service import PluginNotFoundError
 from meltano.core.plugin_invoker import invoker_factory
 from meltano.core.plugin_test_service import PluginTestServiceFactory
 from meltano.core.project import Project
-from meltano.core.project_plugins_service import ProjectPluginsService
-from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.schedule_service import (
     ScheduleAlreadyExistsError,
     ScheduleDoesNotExistError,
-    ScheduleService,
 )
+from meltano.core.setting import Setting
 from meltano.core.setting_definition import SettingKind
 from meltano.core.settings_service import FeatureFlags
 from meltano.core.utils import slugify
@@ -45,6 +48,8 @@ from .errors import InvalidFileNameError
 from .upload_helper import InvalidFileSizeError, InvalidFileTypeError, UploadHelper
 from .utils import enforce_secure_filename
 
+HTTP_NOT_MODIFIED = 304
+
 
 def get_config_with_metadata(settings):
     """Get configuration including metadata.
@@ -118,6 +123,40 @@ def validate_plugin_config(
     return True
 
 
+def configuration_etag(plugin: ProjectPlugin) -> str:
+    """Compute the ETag of a plugin's configuration.
+
+    The ETag is a fingerprint of everything the configuration is computed from:
+    the project files, the `.env` file, the plugin lock files, the `discovery.yml`
+    manifests, the environment variables, the active environment and the
+    settings stored in the system database.
+
+    Args:
+        plugin: The plugin to compute the ETag for.
+
+    Returns:
+        The ETag.
+    """
+    project = project_cache.project
+    environment = project.active_environment
+    db_settings = (
+        db.session.query(
+            Setting.namespace, Setting.name, Setting.value, Setting.enabled
+        )
+        .order_by(Setting.namespace, Setting.name)
+        .all()
+    )
+    fingerprint = (
+        plugin.type,
+        plugin.name,
+        environment and environment.name,
+        project_cache.signature,
+        sorted(os.environ.items()),
+        [tuple(row) for row in db_settings],
+    )
+    return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+
 orchestrations_bp = APIBlueprint("orchestrations", __name__)  # noqa: N816
 orchestrationsAPI = Api(  # noqa: N816
     orchestrations_bp,
@@ -208,14 +247,14 @@ def job_state() -> Response:
     poll_payload = request.get_json()
     state_ids = poll_payload["state_ids"]
 
+    latest_jobs = JobFinder.latest_for_state_ids(db.session, state_ids)
+
     jobs = []
     for state_id in state_ids:
-        finder = JobFinder(state_id)
-        state_job = finder.latest(db.session)
         # Validate existence first as a job may not be queued yet as a result of
         # another prerequisite async process (dbt installation for example)
-        if state_job:
-            state_job_success = finder.latest_success(db.session)
+        if state_id in latest_jobs:
+            state_job, state_job_success = latest_jobs[state_id]
             jobs.append(
                 {
                     "state_id": state_id,
@@ -242,9 +281,8 @@ def job_log(state_id) -> Response:
     Returns:
         JSON containing the jobs log entries
     """
-    project = Project.find()
     try:
-        log_service = JobLoggingService(project)
+        log_service = project_cache.job_logging_service()
         log = log_service.get_latest_log(state_id)
         has_log_exceeded_max_size = False
     except SizeThresholdJobLogException:
@@ -281,9 +319,17 @@ def download_job_log(state_id) -> Response:
     Returns:
         A plain text file of the job log.
     """
-    project = Project.find()
-    log_service = JobLoggingService(project)
-    return send_file(log_service.get_downloadable_log(state_id), mimetype="text/plain")
+    log_service = project_cache.job_logging_service()
+    log_path = Path(log_service.get_downloadable_log(state_id))
+    if log_path.suffix == COMPRESSED_SUFFIX:
+        # Decompress on the fly so that downloads are always plain text
+        return send_file(
+            log_service.open_log(log_path, binary=True),
+            mimetype="text/plain",
+            as_attachment=True,
+            download_name=log_path.stem,
+        )
+    return send_file(log_path, mimetype="text/plain")
 
 
 @orchestrations_bp.route("/run", methods=["POST"])
@@ -364,27 +410,39 @@ def get_plugin_configuration(plugin_ref) -> Response:
     Returns:
         JSON contain the plugin configuration.
     """
-    project = Project.find()
-
-    plugins_service = ProjectPluginsService(project)
-    plugin = plugins_service.get_plugin(plugin_ref)
-
-    settings = PluginSettingsService(
-        project, plugin, plugins_service=plugins_service, show_hidden=False
-    )
+    plugin = project_cache.plugins_service().get_plugin(plugin_ref)
+    etag = configuration_etag(plugin)
+    if request.if_none_match.contains(etag):
+        response = Response(status=HTTP_NOT_MODIFIED)
+        response.set_etag(etag)
+        return response
+
+    environment = project_cache.project.active_environment
+    payloads = project_cache.configuration_payloads()
+    payload_key = (plugin.type, plugin.name, environment and environment.name)
+    cached_payload = payloads.get(payload_key)
+    if cached_payload and cached_payload[0] == etag:
+        payload = cached_payload[1]
+    else:
+        settings = project_cache.plugin_settings_service(plugin)
 
-    try:
-        settings_group_validation = plugin.settings_group_validation
-    except PluginNotFoundError:
-        settings_group_validation = []
+        try:
+            settings_group_validation = plugin.settings_group_validation
+        except PluginNotFoundError:
+            settings_group_validation = []
 
-    return jsonify(
-        {
+        payload = {
             **get_config_with_metadata(settings),
             "settings": Canonical.as_canonical(settings.definitions(extras=False)),
             "settings_group_validation": settings_group_validation,
         }
-    )
+        payloads[payload_key] = (etag, payload)
+
+    response = jsonify(payload)
+    response.set_etag(etag)
+    # Clients must revalidate, as the configuration can change at any time
+    response.cache_control.no_cache = True
+    return response
 
 
 @orchestrations_bp.route("/<plugin_ref:plugin_ref>/configuration", methods=["PUT"])
@@ -398,14 +456,10 @@ def save_plugin_configuration(plugin_ref) -> Response:
     Returns:
         JSON contain the saved configuration.
     """
-    project = Project.find()
+    project = project_cache.project
     payload = request.get_json()
-    plugins_service = ProjectPluginsService(project)
-    plugin = plugins_service.get_plugin(plugin_ref)
-
-    settings = PluginSettingsService(
-        project, plugin, plugins_service=plugins_service, show_hidden=False
-    )
+    plugin = project_cache.plugins_service().get_plugin(plugin_ref)
+    settings = project_cache.plugin_settings_service(plugin)
 
     config = payload.get("config", {})
     for name, value in config.items():
@@ -433,10 +487,11 @@ def test_plugin_configuration(plugin_ref) -> Response:  # noqa: WPS210
     Returns:
         JSON with the job sucess status.
     """
-    project = Project.find()
-    plugins_service = ProjectPluginsService(project)
+    project = project_cache.project
+    plugins_service = project_cache.plugins_service()
     plugin = plugins_service.get_plugin(plugin_ref)
 
+    # Not cached, as the config to test is set as an override
     settings = PluginSettingsService(
         project, plugin, plugins_service=plugins_service, show_hidden=False
     )
@@ -481,17 +536,20 @@ def get_pipeline_schedules():
     Returns:
         JSON containing the pipline schedules.
     """
-    project = Project.find()
-    schedule_service = ScheduleService(project)
-    schedules = list(map(dict, schedule_service.schedules()))
+    schedules = list(map(dict, project_cache.schedules()))
 
     jobs_in_list = False
-    with ProjectSettingsService(project).feature_flag(
+    with project_cache.settings_service().feature_flag(
         FeatureFlags.ENABLE_API_SCHEDULED_JOB_LIST, raise_error=False
     ) as allow:
         if allow:
             jobs_in_list = True
 
+    latest_jobs = JobFinder.latest_for_state_ids(
+        db.session,
+        (schedule["name"] for schedule in schedules if not schedule.get("job")),
+    )
+
     formatted_schedules = []
 
     for schedule in schedules:
@@ -500,16 +558,15 @@ def get_pipeline_schedules():
             # as the UI is not job aware yet.
             formatted_schedules.append(schedule)
         elif not schedule.get("job"):  # a legacy elt task
-            finder = JobFinder(schedule["name"])
-            state_job = finder.latest(db.session)
+            state_job, state_job_success = latest_jobs.get(
+                schedule["name"], (None, None)
+            )
             schedule["has_error"] = state_job.has_error() if state_job else False
             schedule["is_running"] = state_job.is_running() if state_job else False
             schedule["state_id"] = schedule["name"]
             schedule["started_at"] = state_job.started_at if state_job else None
             schedule["ended_at"] = state_job.ended_at if state_job else None
             schedule["trigger"] = state_job.trigger if state_job else None
-
-            state_job_success = finder.latest_success(db.session)
             schedule["has_ever_succeeded"] = (
                 state_job_success.is_success() if state_job_success else None
             )
@@ -541,8 +598,7 @@ def save_pipeline_schedule() -> Response:
     transform = payload["transform"]
     interval = payload["interval"]
 
-    project = Project.find()
-    schedule_service = ScheduleService(project)
+    schedule_service = project_cache.schedule_service()
 
     schedule = schedule_service.add_elt(
         db.session, slug, extractor, loader, transform, interval
@@ -565,8 +621,7 @@ def update_pipeline_schedule() -> Response:
         JSON containing the updated pipeline schedules and status.
     """
     payload = request.get_json()
-    project = Project.find()
-    schedule_service = ScheduleService(project)
+    schedule_service = project_cache.schedule_service()
 
     plugin_namespace = payload["plugin_namespace"]
     schedule = schedule_service.find_namespace_schedule(plugin_namespace)
@@ -596,8 +651,7 @@ def delete_pipeline_schedule() -> Response:
         JSON containing the deleted pipelinea and status.
     """
     payload = request.get_json()
-    project = Project.find()
-    schedule_service = ScheduleService(project)
+    schedule_service = project_cache.schedule_service()
 
     name = payload["name"]
     schedule_service.remove(name)
@@ -8,6 +8,7 @@ import logging
 from flask import jsonify, request
 
 from meltano.api.api_blueprint import APIBlueprint
+from meltano.api.project_cache import project_cache
 from meltano.api.security.auth import block_if_readonly
 from meltano.core.error import PluginInstallError
 from meltano.core.plugin import PluginType
@@ -22,7 +23,6 @@ from meltano.core.plugin_install_service import (
 )
 from meltano.core.project import Project
 from meltano.core.project_add_service import ProjectAddService
-from meltano.core.project_plugins_service import ProjectPluginsService
 
 
 def plugin_def_json(plugin_def):
@@ -85,8 +85,7 @@ def installed():
     Returns:
         Json of all installed plugins.
     """
-    project = Project.find()
-    plugins_service = ProjectPluginsService(project)
+    plugins_service = project_cache.plugins_service()
 
     def _plugin_json(plugin: ProjectPlugin):
         plugin_json = {"name": plugin.name}
@@ -141,9 +140,9 @@ def install_batch():  # noqa: WPS210
         JSON cotaining all plugins installed.
     """
     payload = request.get_json()
-    project = Project.find()
+    project = project_cache.project
 
-    plugins_service = ProjectPluginsService(project)
+    plugins_service = project_cache.plugins_service()
     plugin = plugins_service.find_plugin(
         payload["name"], plugin_type=PluginType(payload["plugin_type"])
     )
@@ -182,9 +181,9 @@ def install():
     plugin_type = PluginType(payload["plugin_type"])
     plugin_name = payload["name"]
 
-    project = Project.find()
+    project = project_cache.project
 
-    plugins_service = ProjectPluginsService(project)
+    plugins_service = project_cache.plugins_service()
     plugin = plugins_service.find_plugin(plugin_name, plugin_type=plugin_type)
 
     # This was added to assist api_worker threads
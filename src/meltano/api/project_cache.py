@@ -0,0 +1,219 @@
+"""Worker-level cache of the project and its core services for the Meltano API."""
+
+from __future__ import annotations
+
+import threading
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Callable, Hashable
+
+from meltano.core.logging import JobLoggingService
+from meltano.core.plugin.project_plugin import ProjectPlugin
+from meltano.core.plugin.settings_service import PluginSettingsService
+from meltano.core.project import Project
+from meltano.core.project_plugins_service import ProjectPluginsService
+from meltano.core.project_settings_service import ProjectSettingsService
+from meltano.core.schedule import Schedule
+from meltano.core.schedule_service import ScheduleService
+
+
+class ProjectCache:
+    """Cache of the project and its core services, shared by API requests.
+
+    Building the services parses `meltano.yml` and its included files and
+    resolves the plugin parents, which is too slow to do on every request.
+    The cached services are dropped whenever `meltano.yml`, an included file,
+    the `.env` file, a plugin lock file, a `discovery.yml` manifest or a
+    directory holding any of these files is modified, and after every request
+    that may have written to the project.
+    """
+
+    def __init__(self):
+        """Create a new, empty project cache."""
+        self._lock = threading.RLock()
+        self._project: Project | None = None
+        self._watched_paths: list[Path] = []
+        self._signature: tuple | None = None
+        self._services: dict[Hashable, Any] = {}
+
+    @property
+    def project(self) -> Project:
+        """Get the current project, dropping the cached services if it changed.
+
+        Returns:
+            The current project.
+        """
+        with self._lock:
+            return self._refresh()
+
+    @property
+    def signature(self) -> tuple:
+        """Get the modification times and sizes of the project files.
+
+        Returns:
+            The modification times and sizes of the watched project files.
+        """
+        with self._lock:
+            self._refresh()
+            return self._signature
+
+    def invalidate(self) -> None:
+        """Drop the cached services, so they are built again on next use."""
+        with self._lock:
+            self._project = None
+            self._services.clear()
+
+    def plugins_service(self) -> ProjectPluginsService:
+        """Get the cached plugins service.
+
+        Returns:
+            The `ProjectPluginsService` of the current project.
+        """
+        return self._service(self._plugins_service)
+
+    def settings_service(self) -> ProjectSettingsService:
+        """Get the cached project settings service.
+
+        Returns:
+            The `ProjectSettingsService` of the current project.
+        """
+        return self._service(self._settings_service)
+
+    def plugin_settings_service(self, plugin: ProjectPlugin) -> PluginSettingsService:
+        """Get the cached settings service of a plugin, with hidden settings omitted.
+
+        Args:
+            plugin: The plugin to get the settings service for.
+
+        Returns:
+            The `PluginSettingsService` of the plugin.
+        """
+        return self._service(
+            lambda project: self._cached(
+                ("plugin_settings", plugin.type, plugin.name),
+                lambda: PluginSettingsService(
+                    project,
+                    plugin,
+                    plugins_service=self._plugins_service(project),
+                    show_hidden=False,
+                ),
+            )
+        )
+
+    def schedule_service(self) -> ScheduleService:
+        """Get the cached schedule service.
+
+        Returns:
+            The `ScheduleService` of the current project.
+        """
+        return self._service(
+            lambda project: self._cached(
+                "schedules",
+                lambda: ScheduleService(
+                    project, plugins_service=self._plugins_service(project)
+                ),
+            )
+        )
+
+    def job_logging_service(self) -> JobLoggingService:
+        """Get the cached job logging service.
+
+        Returns:
+            The `JobLoggingService` of the current project.
+        """
+        return self._service(
+            lambda project: self._cached(
+                "job_logging",
+                lambda: JobLoggingService(
+                    project, settings=self._settings_service(project)
+                ),
+            )
+        )
+
+    def configuration_payloads(self) -> dict[tuple, tuple[str, dict]]:
+        """Get the rendered plugin configurations, dropped along with the services.
+
+        Returns:
+            A mapping from plugin type, plugin name and environment name to the
+            ETag and payload of the plugin configuration.
+        """
+        return self._service(
+            lambda project: self._cached("configuration_payloads", dict)
+        )
+
+    def schedules(self) -> list[Schedule]:
+        """Get the schedules of the current project.
+
+        Returns:
+            A copy of the list of schedules, read from the cached `meltano.yml`.
+        """
+        config_service = self.plugins_service().config_service
+        return config_service.current_meltano_yml.schedules.copy()
+
+    def _service(self, getter: Callable[[Project], Any]) -> Any:
+        with self._lock:
+            return getter(self.project)
+
+    def _cached(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        if key not in self._services:
+            self._services[key] = factory()
+        return self._services[key]
+
+    def _plugins_service(self, project: Project) -> ProjectPluginsService:
+        return self._cached("plugins", lambda: ProjectPluginsService(project))
+
+    def _settings_service(self, project: Project) -> ProjectSettingsService:
+        return self._cached(
+            "settings",
+            lambda: ProjectSettingsService(
+                project, config_service=self._plugins_service(project).config_service
+            ),
+        )
+
+    def _refresh(self) -> Project:
+        project = Project.find()
+        if project is not self._project or self._signature != self._stat():
+            self._reset(project)
+        return project
+
+    def _reset(self, project: Project) -> None:
+        project.clear_cache()
+        self._services.clear()
+        self._project = project
+        self._watched_paths = [project.meltanofile, project.dotenv]
+
+        include_paths = []
+        # A broken `meltano.yml` is reported by the services that parse it
+        with suppress(Exception):
+            include_paths = project.project_files.include_paths
+        self._watched_paths.extend(include_paths)
+        # New included files matching the patterns modify their directory
+        self._watched_paths.extend({path.parent for path in include_paths})
+
+        # Plugin definitions are resolved from the lock files and the manifests
+        plugins_dir = project.root_plugins_dir(make_dirs=False)
+        lock_paths = sorted(plugins_dir.glob("*/*.lock"))
+        self._watched_paths.extend(lock_paths)
+        self._watched_paths.extend(sorted({path.parent for path in lock_paths}))
+        self._watched_paths.extend(
+            (
+                project.root_dir("discovery.yml"),
+                project.meltano_dir("cache", "discovery.yml", make_dirs=False),
+            )
+        )
+
+        self._signature = self._stat()
+
+    def _stat(self) -> tuple:
+        signature = []
+        for path in self._watched_paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+
+project_cache = ProjectCache()
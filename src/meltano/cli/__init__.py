@@ -24,6 +24,7 @@ from meltano.cli.cli import (  # isort:skip
 from meltano.cli import (  # isort:skip # noqa: WPS235
     add,
     config,
+    discover_catalogs,
     discovery,
     dragon,
     elt,
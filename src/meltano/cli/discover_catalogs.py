@@ -0,0 +1,103 @@
+"""CLI command `meltano discover-catalogs`."""
+
+from __future__ import annotations
+
+from contextlib import closing
+
+import click
+
+from meltano.cli import activate_environment, cli
+from meltano.cli.params import pass_project
+from meltano.cli.utils import CliError, InstrumentedCmd
+from meltano.core.catalog_discovery_service import (
+    CatalogDiscoveryResult,
+    CatalogDiscoveryService,
+    CatalogDiscoveryStatus,
+)
+from meltano.core.db import project_engine
+from meltano.core.plugin import PluginType
+from meltano.core.project import Project
+from meltano.core.project_plugins_service import ProjectPluginsService
+from meltano.core.utils import click_run_async
+
+
+def discovery_status_update(result: CatalogDiscoveryResult):
+    """Print the result of discovering the catalog of an extractor.
+
+    Used as the callback for CatalogDiscoveryService.
+
+    Args:
+        result: The result of the discovery.
+    """
+    name = result.plugin.name
+    if result.status is CatalogDiscoveryStatus.SUCCESS:
+        click.secho(
+            f"Discovered catalog of extractor '{name}' in {result.duration:.2f}s",
+            fg="green",
+        )
+    elif result.status is CatalogDiscoveryStatus.SKIPPED:
+        click.secho(f"Skipped extractor '{name}': {result.message}", fg="yellow")
+    else:
+        click.secho(
+            f"Failed to discover catalog of extractor '{name}' "
+            + f"after {result.duration:.2f}s: {result.message}",
+            fg="red",
+        )
+
+
+@cli.command(
+    cls=InstrumentedCmd,
+    name="discover-catalogs",
+    short_help="Discover and cache the catalogs of extractors.",
+)
+@click.argument("extractor", nargs=-1)
+@click.option(
+    "--parallelism",
+    "-p",
+    type=click.INT,
+    default=None,
+    help="Limit the number of catalogs to discover in parallel. Defaults to the number of cores.",
+)
+@pass_project(migrate=True)
+@click.pass_context
+@click_run_async
+async def discover_catalogs(
+    ctx: click.Context,
+    project: Project,
+    extractor: tuple[str, ...],
+    parallelism: int | None,
+):
+    """
+    Discover the catalogs of all extractors, or of the given extractors, concurrently.
+
+    Each catalog is written to the catalog cache of its extractor, so that
+    later runs do not need to discover it again.
+
+    \b\nRead more at https://docs.meltano.com/reference/command-line-interface#discover-catalogs
+    """
+    activate_environment(ctx, project)
+    plugins_service = ProjectPluginsService(project)
+    if extractor:
+        plugins = [
+            plugins_service.find_plugin(name, PluginType.EXTRACTORS)
+            for name in extractor
+        ]
+    else:
+        plugins = plugins_service.get_plugins_of_type(PluginType.EXTRACTORS)
+
+    click.echo(f"Discovering catalogs of {len(plugins)} extractors...")
+    discovery_service = CatalogDiscoveryService(
+        project, plugins_service=plugins_service, parallelism=parallelism
+    )
+    _, Session = project_engine(project)  # noqa: N806
+    with closing(Session()) as session:
+        results = await discovery_service.discover_catalogs(
+            session, plugins, status_cb=discovery_status_update
+        )
+
+    failed = [result for result in results if not result.successful]
+    if failed:
+        raise CliError(
+            f"Failed to discover the catalogs of {len(failed)} of {len(results)} extractors"
+        )
+    click.secho(f"Discovered catalogs of {len(results)} extractors", fg="green")
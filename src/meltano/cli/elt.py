@@ -208,10 +208,11 @@ async def dump_file(context_builder, dumpable):
         plugin_type, file_id = DUMPABLES[dumpable]
         invoker = elt_context.invoker_for(plugin_type)
 
+        stdout = click.get_binary_stream("stdout")
         async with invoker.prepared(elt_context.session):
-            content = await invoker.dump(file_id)
+            await invoker.dump_to(file_id, stdout)
 
-        click.echo(content)
+        stdout.write(b"\n")
     except FileNotFoundError as err:
         raise CliError(f"Could not find {dumpable} file for this pipeline") from err
     except Exception as err:
@@ -229,16 +230,20 @@ async def _run_job(tracker, project, job, session, context_builder, force=False)
                 + "To ignore this check use the '--force' option."
             )
 
-    async with job.run(session):
-        job_logging_service = JobLoggingService(project)
-        log_file = job_logging_service.generate_log_name(job.job_name, job.run_id)
-
-        output_logger = OutputLogger(log_file)
-        context_builder.set_base_output_logger(output_logger)
+    job_logging_service = JobLoggingService(project)
+    state_id, run_id = job.job_name, job.run_id
+    try:
+        async with job.run(session):
+            output_logger = job_logging_service.output_logger(job.job_name, job.run_id)
+            context_builder.set_base_output_logger(output_logger)
 
-        log = logger.bind(name="meltano", run_id=str(job.run_id), state_id=job.job_name)
+            log = logger.bind(
+                name="meltano", run_id=str(job.run_id), state_id=job.job_name
+            )
 
-        await _run_elt(tracker, log, context_builder, output_logger)
+            await _run_elt(tracker, log, context_builder, output_logger)
+    finally:
+        job_logging_service.finalize_logs(state_id, run_id)
 
 
 @asynccontextmanager
@@ -58,6 +58,11 @@ logger = logging.getLogger(__name__)
     is_flag=True,
     help="Execute plugins using containers where possible.",
 )
+@click.option(
+    "--force-init",
+    is_flag=True,
+    help="Run plugin initialization, like creating the Airflow or Superset metadata database, even if it was already done.",
+)
 @click.pass_context
 @pass_project(migrate=True)
 def invoke(
@@ -69,6 +74,7 @@ def invoke(
     plugin_name: str,
     plugin_args: tuple[str, ...],
     containers: bool = False,
+    force_init: bool = False,
     print_var: str | None = None,
 ):
     """
@@ -105,7 +111,9 @@ def invoke(
         tracker.track_command_event(CliEvent.completed)
         return
 
-    invoker = invoker_factory(project, plugin, plugins_service=plugins_service)
+    invoker = invoker_factory(
+        project, plugin, plugins_service=plugins_service, force_init=force_init
+    )
     try:
         exit_code = asyncio.run(
             _invoke(
@@ -200,10 +208,11 @@ def do_list_commands(plugin):
 
 async def dump_file(invoker: PluginInvoker, file_id: str):
     """Dump file."""
+    stdout = click.get_binary_stream("stdout")
     try:
-        content = await invoker.dump(file_id)
+        await invoker.dump_to(file_id, stdout)
     except FileNotFoundError as err:
         raise CliError(f"Could not find {file_id}") from err
     except Exception as err:
         raise CliError(f"Could not dump {file_id}: {err}") from err
-    print(content)  # noqa: WPS421
+    stdout.write(b"\n")
@@ -70,8 +70,9 @@ class pass_project:  # noqa: N801
 
                 try:
                     migration_service = MigrationService(engine)
-                    migration_service.upgrade(silent=True)
-                    migration_service.seed(project)
+                    if not migration_service.is_up_to_date():
+                        migration_service.upgrade(silent=True)
+                        migration_service.seed(project)
                 except MigrationError as err:
                     raise CliError(str(err))
 
@@ -163,6 +163,7 @@ async def _run_blocks(
                 success=False,
                 err=err,
                 exit_codes=err.exitcodes,
+                stderr=err.stderr or None,
             )
             with tracker.with_contexts(tracking_ctx):
                 tracker.track_block_event(blk_name, BlockEvents.failed)
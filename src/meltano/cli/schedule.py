@@ -6,12 +6,12 @@ import json
 import sys
 
 import click
-from sqlalchemy.orm import Session
 
 from meltano.cli import activate_explicitly_provided_environment, cli
 from meltano.cli.params import pass_project
 from meltano.cli.utils import InstrumentedDefaultGroup, PartialInstrumentedCmd
 from meltano.core.db import project_engine
+from meltano.core.job import Job, JobFinder
 from meltano.core.job.stale_job_failer import fail_stale_jobs
 from meltano.core.project import Project
 from meltano.core.schedule import Schedule
@@ -145,12 +145,11 @@ def _format_job_list_output(entry: Schedule, job: TaskSets) -> dict:
     }
 
 
-def _format_elt_list_output(entry: Schedule, session: Session) -> dict:
+def _format_elt_list_output(entry: Schedule, last_successful_run: Job | None) -> dict:
     start_date = coerce_datetime(entry.start_date)
     if start_date:
         start_date = start_date.date().isoformat()
 
-    last_successful_run = entry.last_successful_run(session)
     last_successful_run_ended_at = (
         last_successful_run.ended_at.isoformat() if last_successful_run else None
     )
@@ -204,9 +203,14 @@ def list(ctx, format):  # noqa: WPS125
                     )
 
         elif format == "json":
+            schedules = schedule_service.schedules()
+            latest_jobs = JobFinder.latest_for_state_ids(
+                session, (entry.name for entry in schedules if not entry.job)
+            )
+
             job_schedules = []
             elt_schedules = []
-            for json_schedule in schedule_service.schedules():
+            for json_schedule in schedules:
                 if json_schedule.job:
                     job_schedules.append(
                         _format_job_list_output(
@@ -214,8 +218,11 @@ def list(ctx, format):  # noqa: WPS125
                         )
                     )
                 else:
+                    _, last_successful_run = latest_jobs.get(
+                        json_schedule.name, (None, None)
+                    )
                     elt_schedules.append(
-                        _format_elt_list_output(json_schedule, session)
+                        _format_elt_list_output(json_schedule, last_successful_run)
                     )
             click.echo(
                 json.dumps(
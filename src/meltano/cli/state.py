@@ -12,12 +12,13 @@ import structlog
 
 from meltano.cli import activate_explicitly_provided_environment, cli
 from meltano.cli.params import pass_project
-from meltano.cli.utils import InstrumentedCmd, InstrumentedGroup
+from meltano.cli.utils import CliError, InstrumentedCmd, InstrumentedGroup
 from meltano.core.block.parser import BlockParser
 from meltano.core.db import project_engine
 from meltano.core.job import Payload
 from meltano.core.project import Project
 from meltano.core.state_service import InvalidJobStateError, StateService
+from meltano.core.state_store import STATE_BATCH_SIZE
 
 STATE_SERVICE_KEY = "state_service"
 
@@ -109,7 +110,7 @@ def meltano_state(project: Project, ctx: click.Context):
     activate_explicitly_provided_environment(ctx, project)
     _, sessionmaker = project_engine(project)
     session = sessionmaker()
-    ctx.obj[STATE_SERVICE_KEY] = StateService(session)  # noqa: WPS204
+    ctx.obj[STATE_SERVICE_KEY] = StateService(session, project=project)  # noqa: WPS204
 
 
 @meltano_state.command(cls=InstrumentedCmd, name="list")
@@ -309,3 +310,106 @@ def clear_state(ctx: click.Context, project: Project, state_id: str, force: bool
         state_service_from_state_id(project, state_id) or ctx.obj[STATE_SERVICE_KEY]
     )
     state_service.clear_state(state_id)
+
+
+@meltano_state.command(cls=InstrumentedCmd, name="export")
+@click.option("--pattern", type=str, help="Filter state IDs by pattern.")
+@click.option(
+    "--output-file",
+    type=click.File("w"),
+    default="-",
+    help="File to write the exported state to, as NDJSON. Defaults to stdout.",
+)
+@pass_project(migrate=True)
+@click.pass_context
+def export_state(
+    ctx: click.Context,
+    project: Project,
+    pattern: str | None,
+    output_file,
+):
+    """Export state for all state IDs, or those matching a pattern, as NDJSON."""
+    state_service: StateService = ctx.obj[STATE_SERVICE_KEY]
+    count = 0
+    for state_id, state in state_service.export_state(pattern):
+        output_file.write(json.dumps({"state_id": state_id, "state": state}))
+        output_file.write("\n")
+        count += 1
+    logger.info(f"Exported state for {count} state IDs.")
+
+
+def _read_ndjson_states(input_file):
+    for line_number, line in enumerate(input_file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            yield record["state_id"], record["state"]
+        except (json.JSONDecodeError, KeyError, TypeError) as err:
+            raise CliError(
+                f"Invalid state record on line {line_number}: {err}"
+            ) from err
+
+
+@meltano_state.command(cls=InstrumentedCmd, name="import")
+@prompt_for_confirmation(
+    prompt="This will overwrite state for all imported state IDs. Continue?"
+)
+@click.option(
+    "--input-file",
+    type=click.File("r"),
+    default="-",
+    help="NDJSON file to import state from, as written by `meltano state export`. Defaults to stdin.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=STATE_BATCH_SIZE,
+    show_default=True,
+    help="Number of states to write per transaction.",
+)
+@pass_project(migrate=True)
+@click.pass_context
+def import_state(
+    ctx: click.Context,
+    project: Project,
+    input_file,
+    batch_size: int,
+    force: bool,
+):
+    """Import state from NDJSON, as written by `meltano state export`."""
+    state_service: StateService = ctx.obj[STATE_SERVICE_KEY]
+    try:
+        count = state_service.import_state(
+            _read_ndjson_states(input_file), batch_size=batch_size
+        )
+    except InvalidJobStateError as err:
+        raise CliError(str(err)) from err
+    logger.info(
+        f"State for {count} state IDs was successfully imported at {dt.utcnow():%Y-%m-%d %H:%M:%S}."  # noqa: WPS323
+    )
+
+
+@meltano_state.command(cls=InstrumentedCmd, name="compact")
+@prompt_for_confirmation(
+    prompt="This will overwrite state for all state IDs with job run history. Continue?"
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=STATE_BATCH_SIZE,
+    show_default=True,
+    help="Number of state IDs to rebuild per transaction.",
+)
+@pass_project(migrate=True)
+@click.pass_context
+def compact_state(
+    ctx: click.Context,
+    project: Project,
+    batch_size: int,
+    force: bool,
+):
+    """Rebuild the current state of all state IDs from the job run history."""
+    state_service: StateService = ctx.obj[STATE_SERVICE_KEY]
+    count = state_service.compact_state(batch_size=batch_size)
+    logger.info(f"State for {count} state IDs was successfully compacted.")
@@ -50,6 +50,71 @@ class IdHashBox:
 CANONICAL_PARSE_CACHE_SIZE = 4096
 
 
+# The attributes holding the rules to resolve attributes that are not set
+RESOLUTION_ATTRS = frozenset(("_fallback_to", "_fallbacks", "_defaults"))
+
+
+def _invalidating(container_cls: type, methods: tuple[str, ...]) -> type:
+    """Create a subclass of a container that invalidates resolved attributes.
+
+    Args:
+        container_cls: The container class to subclass.
+        methods: The names of the methods that modify the container.
+
+    Returns:
+        A subclass bumping the version of the `Canonical` instance owning it
+        whenever it is modified.
+    """
+
+    def init(self, *args, owner: Canonical | None = None):
+        container_cls.__init__(self, *args)  # noqa: WPS609
+        self._owner = owner
+
+    def invalidate(method_name: str):
+        method = getattr(container_cls, method_name)
+
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            # The owner is not known yet while unpickling or copying
+            owner = getattr(self, "_owner", None)
+            if owner is not None:
+                owner._version += 1  # noqa: WPS437
+            return result
+
+        return wrapper
+
+    namespace = {method_name: invalidate(method_name) for method_name in methods}
+    namespace["__init__"] = init
+    return type(
+        f"Invalidating{container_cls.__name__.title()}", (container_cls,), namespace
+    )
+
+
+# The containers holding the fallback and default rules of `Canonical` instances
+_FallbackSet = _invalidating(
+    set,
+    (
+        "add",
+        "clear",
+        "discard",
+        "pop",
+        "remove",
+        "update",
+        "difference_update",
+        "intersection_update",
+        "symmetric_difference_update",
+        "__ior__",
+        "__iand__",
+        "__isub__",
+        "__ixor__",
+    ),
+)
+_DefaultsDict = _invalidating(
+    dict,
+    ("__setitem__", "__delitem__", "clear", "pop", "popitem", "setdefault", "update"),
+)
+
+
 class Canonical:  # noqa: WPS214 (too many methods)
     """Defines an object that can be represented as a subset of its attributes.
 
@@ -69,6 +134,11 @@ class Canonical:  # noqa: WPS214 (too many methods)
             args: Arguments to initialize with.
             attrs: Keyword arguments to initialize with.
         """
+        # Bumped whenever an attribute or a resolution rule of this instance changes
+        self._version = 0
+        # Attribute values resolved through fallbacks and defaults, along with
+        # the resolution version they were resolved at
+        self._resolved = (None, {})
         self._dict = CommentedMap()
 
         super().__init__(*args)
@@ -80,8 +150,8 @@ class Canonical:  # noqa: WPS214 (too many methods)
         self._flattened = {"extras"}
 
         self._fallback_to = None
-        self._fallbacks = set()
-        self._defaults = {}
+        self._fallbacks = _FallbackSet(owner=self)
+        self._defaults = _DefaultsDict(owner=self)
 
     @classmethod
     def as_canonical(
@@ -209,6 +279,9 @@ class Canonical:  # noqa: WPS214 (too many methods)
     def __getattr__(self, attr: str) -> Any:
         """Return the value of the given attribute.
 
+        Values resolved through fallbacks and defaults are cached until this
+        instance, or an instance it falls back to, is modified.
+
         Args:
             attr: Attribute to return.
 
@@ -221,14 +294,63 @@ class Canonical:  # noqa: WPS214 (too many methods)
         try:
             value = self._dict[attr]
         except KeyError as err:
-            if self._fallback_to and not attr.startswith("_"):
-                return getattr(self._fallback_to, attr)
+            if attr.startswith("_") or not self._fallback_to:
+                raise AttributeError(attr) from err
+            is_set = False
+        else:
+            if value is not None:
+                return value
+            is_set = True
 
-            raise AttributeError(attr) from err
+        version = self._resolution_version()
+        if version is None:
+            return self._resolve(attr, is_set)
 
-        if value is not None:
-            return value
+        resolved_version, resolved = self._resolved
+        if version != resolved_version:
+            resolved = {}
+            self._resolved = (version, resolved)
+        elif attr in resolved:
+            return resolved[attr]
 
+        resolved[attr] = self._resolve(attr, is_set)
+        return resolved[attr]
+
+    def _resolution_version(self) -> tuple | None:
+        """Get the versions of this instance and of the instances it falls back to.
+
+        Returns:
+            The versions along the fallback chain, or None if the fallback
+            cannot tell when it changes, so resolved values cannot be cached.
+        """
+        fallback = self._fallback_to
+        if fallback is None:
+            return (self._version,)
+
+        # Looked up on the type, as fallbacks may delegate unknown attributes
+        fallback_version = getattr(type(fallback), "_resolution_version", None)
+        if fallback_version is None:
+            return None
+
+        version = fallback_version(fallback)
+        if version is None:
+            return None
+        return (self._version, version)
+
+    def _resolve(self, attr: str, is_set: bool) -> Any:
+        """Resolve an attribute that is not set, or set to `None`.
+
+        Args:
+            attr: Attribute to resolve.
+            is_set: Whether the attribute is set to `None`.
+
+        Returns:
+            Value of the attribute from the fallback or the defaults.
+        """
+        if not is_set:
+            return getattr(self._fallback_to, attr)
+
+        value = None
         if attr in self._fallbacks and self._fallback_to:
             value = getattr(self._fallback_to, attr)
 
@@ -252,6 +374,9 @@ class Canonical:  # noqa: WPS214 (too many methods)
         else:
             self._dict[attr] = value
 
+        if not attr.startswith("_") or attr in RESOLUTION_ATTRS:
+            self._version += 1
+
     def __getitem__(self, attr: str) -> Any:
         """Return the value of the given attribute.
 
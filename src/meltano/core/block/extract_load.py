@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager, closing
 from typing import AsyncIterator
 
@@ -14,7 +15,12 @@ from meltano.core.db import project_engine
 from meltano.core.elt_context import PluginContext
 from meltano.core.job import Job, JobFinder
 from meltano.core.job.stale_job_failer import fail_stale_jobs
-from meltano.core.logging import JobLoggingService, OutputLogger
+from meltano.core.logging import (
+    BufferedLogSink,
+    JobLoggingService,
+    OutputLogger,
+    OutputTail,
+)
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.project_plugin import ProjectPlugin
 from meltano.core.plugin.settings_service import PluginSettingsService
@@ -32,6 +38,9 @@ from .singer import SingerBlock
 
 logger = structlog.getLogger(__name__)
 
+# Number of lines of the stderr of each block kept to report failures
+STDERR_TAIL_LINES = 20
+
 
 class BlockSetHasNoStateError(Exception):
     """Occurs when state_service is accessed for ExtractLoadBlocks instance for which no block has state."""
@@ -51,6 +60,7 @@ class ELBContext:  # noqa: WPS230
         update_state: bool | None = True,
         state_id_suffix: str | None = None,
         base_output_logger: OutputLogger | None = None,
+        catalog_cache: dict | None = None,
     ):
         """Use an ELBContext to pass information on to ExtractLoadBlocks.
 
@@ -64,6 +74,8 @@ class ELBContext:  # noqa: WPS230
             update_state: Whether to update the state of the job.
             state_id_suffix: The state ID suffix to use.
             base_output_logger: The base logger to use.
+            catalog_cache: Catalogs discovered and processed by extractors,
+                shared by the block sets of one invocation.
         """
         self.project = project
         self.plugins_service = plugins_service or ProjectPluginsService(project)
@@ -83,6 +95,7 @@ class ELBContext:  # noqa: WPS230
         self.catalog = None
 
         self.base_output_logger = base_output_logger
+        self.catalog_cache = catalog_cache
 
     @property
     def elt_run_dir(self) -> str:
@@ -92,7 +105,9 @@ class ELBContext:  # noqa: WPS230
             The run directory for the current job.
         """
         if self.job:
-            return self.project.job_dir(self.job.job_name, str(self.job.run_id))
+            return self.project.job_dir(
+                self.job.job_name, str(self.job.run_id), make_dirs=False
+            )
 
 
 class ELBContextBuilder:
@@ -126,6 +141,7 @@ class ELBContextBuilder:
         self._blocks = []
 
         self._base_output_logger = None
+        self._catalog_cache = None
 
     def with_job(self, job: Job):
         """Set the associated job for the context.
@@ -190,21 +206,37 @@ class ELBContextBuilder:
         self._state_id_suffix = state_id_suffix
         return self
 
+    def with_catalog_cache(self, catalog_cache: dict):
+        """Set the catalog cache shared with the other block sets of the invocation.
+
+        Args:
+            catalog_cache: The shared catalog cache.
+
+        Returns:
+            self
+        """
+        self._catalog_cache = catalog_cache
+        return self
+
     def make_block(
         self,
         plugin: ProjectPlugin,
         plugin_args: list[str] | None = None,
+        config_override: dict | None = None,
     ) -> SingerBlock:
         """Create a new `SingerBlock` object, from a plugin.
 
         Args:
             plugin: The plugin to be executed.
             plugin_args: The arguments to be passed to the plugin.
+            config_override: Setting values overriding the plugin's configuration.
 
         Returns:
             The new `SingerBlock` object.
         """
-        ctx = self.plugin_context(plugin, env=self._env.copy())
+        ctx = self.plugin_context(
+            plugin, env=self._env.copy(), config_override=config_override
+        )
 
         block = SingerBlock(
             block_ctx=ctx,
@@ -221,12 +253,14 @@ class ELBContextBuilder:
         self,
         plugin: ProjectPlugin,
         env: dict | None = None,
+        config_override: dict | None = None,
     ) -> PluginContext:
         """Create context object for a plugin.
 
         Args:
             plugin: The plugin to create the context for.
             env: Environment override dictionary.
+            config_override: Setting values overriding the plugin's configuration.
 
         Returns:
             A new `PluginContext` object.
@@ -238,6 +272,7 @@ class ELBContextBuilder:
                 plugin,
                 plugins_service=self.plugins_service,
                 env_override=env,
+                config_override=config_override,
             ),
             session=self.session,
         )
@@ -271,7 +306,9 @@ class ELBContextBuilder:
             The run directory for the current job.
         """
         if self._job:
-            return self.project.job_dir(self._job.job_name, str(self._job.run_id))
+            return self.project.job_dir(
+                self._job.job_name, str(self._job.run_id), make_dirs=False
+            )
 
     def context(self) -> ELBContext:
         """Create an ELBContext object from the current builder state.
@@ -289,6 +326,7 @@ class ELBContextBuilder:
             update_state=self._state_update,
             state_id_suffix=self._state_id_suffix,
             base_output_logger=self._base_output_logger,
+            catalog_cache=self._catalog_cache,
         )
 
 
@@ -313,7 +351,9 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
             config_service=self.context.plugins_service.config_service,
         )
 
-        self.output_logger = OutputLogger(None)
+        self.output_logger = OutputLogger(
+            None, sink=BufferedLogSink.from_settings(self.project_settings_service)
+        )
 
         if not self.context.project.active_environment:
             self.context.job = None
@@ -323,17 +363,16 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
                 self.context.project, self.context.state_id_suffix, self.head, self.tail
             )
             self.context.job = Job(job_name=state_id)
-            job_logging_service = JobLoggingService(self.context.project)
-            log_file = job_logging_service.generate_log_name(
-                self.context.job.job_name, self.context.job.run_id
-            )
-            self.output_logger = OutputLogger(log_file)
+            self.output_logger = JobLoggingService(
+                self.context.project, settings=self.project_settings_service
+            ).output_logger(self.context.job.job_name, self.context.job.run_id)
 
         self._process_futures = None
         self._stdout_futures = None
         self._stderr_futures = None
         self._errors = []
         self._state_service = None
+        self.stderr_tails: dict[str, OutputTail] = {}
 
     def has_state(self) -> bool:
         """Check to see if any block in this BlockSet has 'state' capability.
@@ -358,7 +397,9 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
         """
         if not self._state_service:
             if self.has_state():
-                self._state_service = StateService(self.context.session)
+                self._state_service = StateService(
+                    self.context.session, project=self.context.project
+                )
             else:
                 raise BlockSetHasNoStateError()
         return self._state_service
@@ -443,19 +484,29 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
 
     async def execute(self) -> None:
         """Build the IO chain and execute the actual ELT task."""
-        async with self._start_blocks():
-            await self._link_io()
-            manager = ELBExecutionManager(self)
-            await manager.run()
+        try:
+            async with self._start_blocks():
+                await self._link_io()
+                manager = ELBExecutionManager(self)
+                await manager.run()
+        finally:
+            self.output_logger.flush()
 
     async def run(self) -> None:
         """Run the ELT task."""
         if self.context.job:
             # TODO: legacy `meltano elt` style logging should be deprecated
+            # The job is detached from its session once the run is over
+            state_id, run_id = self.context.job.job_name, self.context.job.run_id
             legacy_log_handler = self.output_logger.out("meltano", logger)
-            with legacy_log_handler.redirect_logging():
-                await self.run_with_job()
-                return
+            try:
+                with legacy_log_handler.redirect_logging():
+                    await self.run_with_job()
+            finally:
+                JobLoggingService(
+                    self.context.project, settings=self.project_settings_service
+                ).finalize_logs(state_id, run_id)
+            return
         else:
             logger.warning(
                 "No active environment, proceeding with stateless run! See https://docs.meltano.com/reference/command-line-interface#run for details."
@@ -563,17 +614,46 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
     async def _start_blocks(self) -> AsyncIterator[None]:
         """Start the blocks in the block set.
 
+        Every block is prepared and started independently of the others, so that
+        e.g. a slow target start-up overlaps with the catalog discovery of the tap.
+        Output is only proxied once the blocks are linked, so anything a producer
+        writes before its consumer has started is held back by the pipe.
+
         Yields:
             None
         """
         try:  # noqa:  WPS229
-            for block in self.blocks:
-                await block.pre(self.context)
-                await block.start()
+            # Let every block finish starting before cleaning up after a failed one
+            started = await asyncio.gather(
+                *(self._start_block(block) for block in self.blocks),
+                return_exceptions=True,
+            )
+            failed = [result for result in started if isinstance(result, BaseException)]
+            if failed:
+                for block in self.blocks:
+                    await block.stop()
+                raise failed[0]
             yield
         finally:
             await self._cleanup()
 
+    async def _start_block(self, block: IOBlock) -> None:
+        """Prepare and start a block, logging how long each step took.
+
+        Args:
+            block: The block to start.
+        """
+        start_time = time.monotonic()
+        await block.pre(self.context)
+        prepared_time = time.monotonic()
+        await block.start()
+        logger.debug(
+            "Started block",
+            string_id=block.string_id,
+            pre_duration=round(prepared_time - start_time, 3),
+            start_duration=round(time.monotonic() - prepared_time, 3),
+        )
+
     async def _cleanup(self) -> None:
         for block in self.blocks:
             await block.post()
@@ -606,6 +686,8 @@ class ExtractLoadBlocks(BlockSet):  # noqa: WPS214
                     logger_base.bind(stdio="stderr"),
                 )
             )
+            self.stderr_tails[block.string_id] = OutputTail(max_lines=STDERR_TAIL_LINES)
+            block.stderr_link(self.stderr_tails[block.string_id])
             if block.consumer:
                 if idx != 0 and self.blocks[idx - 1].producer:
                     self.blocks[idx - 1].stdout_link(
@@ -631,6 +713,7 @@ class ELBExecutionManager:
             "elt.buffer_size"
         )
         self.line_length_limit = self.stream_buffer_size // 2
+        self.max_line_size = self.elb.project_settings_service.get("elt.max_line_size")
 
         self._producer_code = None
         self._consumer_code = None
@@ -645,9 +728,29 @@ class ELBExecutionManager:
         """
         await self._wait_for_process_completion(self.elb.head)
         _check_exit_codes(
-            self._producer_code, self._consumer_code, self._intermediate_codes
+            self._producer_code,
+            self._consumer_code,
+            self._intermediate_codes,
+            stderr=self._failed_stderr(),
         )
 
+    def _failed_stderr(self) -> dict[str, str]:
+        """Get the end of the stderr of the blocks that exited with an error.
+
+        Returns:
+            The last lines of stderr by block string ID.
+        """
+        exit_codes = {
+            self.elb.head.string_id: self._producer_code,
+            self.elb.tail.string_id: self._consumer_code,
+            **self._intermediate_codes,
+        }
+        return {
+            string_id: self.elb.stderr_tails[string_id].getvalue()
+            for string_id, exit_code in exit_codes.items()
+            if exit_code and string_id in self.elb.stderr_tails
+        }
+
     async def _complete_upstream(self) -> None:
         """Wait for the upstream blocks to complete."""
         producer = self.elb.head
@@ -707,6 +810,7 @@ class ELBExecutionManager:
                     output_futures_failed.exception(),
                     line_length_limit=self.line_length_limit,
                     stream_buffer_size=self.stream_buffer_size,
+                    max_line_size=self.max_line_size,
                 )
             raise output_futures_failed.exception()
         else:
@@ -725,6 +829,7 @@ class ELBExecutionManager:
             await self._handle_head_completed(current_head, start_idx)
         else:
             logger.warning("Intermediate block in sequence failed.")
+            await self._complete_intermediate(start_idx)
             await self._stop_all_blocks(start_idx)
             raise RunnerError(
                 "Unexpected completion sequence in ExtractLoadBlock set. Intermediate block (likely a mapper) failed.",
@@ -732,8 +837,22 @@ class ELBExecutionManager:
                     PluginType.EXTRACTORS: 1,
                     PluginType.LOADERS: 1,
                 },
+                stderr=self._failed_stderr(),
             )
 
+    async def _complete_intermediate(self, start_idx: int) -> None:
+        """Record the exit codes and wait for the stderr of the finished intermediate blocks.
+
+        Args:
+            start_idx: index of the current head block.
+        """
+        for block in self.elb.blocks[start_idx + 1 : -1]:  # noqa: WPS362
+            if block.process_future.done():
+                self._intermediate_codes[
+                    block.string_id
+                ] = block.process_future.result()
+                await asyncio.wait([block.proxy_stderr()])
+
     async def _handle_head_completed(
         self, current_head: IOBlock, start_idx: int
     ) -> None:
@@ -774,7 +893,10 @@ class ELBExecutionManager:
 
 
 def _check_exit_codes(  # noqa: WPS238
-    producer_code: int, consumer_code: int, intermediate_codes: dict[str, int]
+    producer_code: int,
+    consumer_code: int,
+    intermediate_codes: dict[str, int],
+    stderr: dict[str, str] | None = None,
 ) -> None:
     """Check exit codes for failures, and raise the appropriate RunnerError if needed.
 
@@ -782,6 +904,7 @@ def _check_exit_codes(  # noqa: WPS238
         producer_code: exit code of the producer (tap)
         consumer_code: exit code of the consumer (target)
         intermediate_codes: exit codes of the intermediate blocks (mappers)
+        stderr: the end of the stderr of the failed blocks, to report with the error
 
     Raises:
         RunnerError: if the producer, consumer, or mapper exit codes are non-zero
@@ -790,13 +913,18 @@ def _check_exit_codes(  # noqa: WPS238
         raise RunnerError(
             "Extractor and loader failed",
             {PluginType.EXTRACTORS: producer_code, PluginType.LOADERS: consumer_code},
+            stderr=stderr,
         )
 
     if producer_code:
-        raise RunnerError("Extractor failed", {PluginType.EXTRACTORS: producer_code})
+        raise RunnerError(
+            "Extractor failed", {PluginType.EXTRACTORS: producer_code}, stderr=stderr
+        )
 
     if consumer_code:
-        raise RunnerError("Loader failed", {PluginType.LOADERS: consumer_code})
+        raise RunnerError(
+            "Loader failed", {PluginType.LOADERS: consumer_code}, stderr=stderr
+        )
 
     failed_mappers = []
     for mapper_id in intermediate_codes.keys():
@@ -804,7 +932,7 @@ def _check_exit_codes(  # noqa: WPS238
             failed_mappers.append({mapper_id: intermediate_codes[mapper_id]})
 
     if failed_mappers:
-        raise RunnerError("Mappers failed", failed_mappers)
+        raise RunnerError("Mappers failed", failed_mappers, stderr=stderr)
 
 
 def generate_state_id(
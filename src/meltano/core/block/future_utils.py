@@ -3,11 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 from asyncio import Task
 
-from meltano.core.runner import RunnerError
-from meltano.core.utils import human_size
+from meltano.core.runner import RunnerError, log_line_length_limit_error
 
 
 def all_done(tasks: list[Task], done: set[Task]) -> bool:
@@ -39,7 +37,10 @@ def first_failed_future(exception_future: Task, done: set[Task]) -> Task | None:
 
 
 def handle_producer_line_length_limit_error(
-    exception: Exception, line_length_limit: int, stream_buffer_size: int
+    exception: Exception,
+    line_length_limit: int,
+    stream_buffer_size: int,
+    max_line_size: int | None = None,
 ):
     """
     Handle and wrap asyncio.LimitOverrunError's from producers, emitting an useful log line along the way.
@@ -55,13 +56,5 @@ def handle_producer_line_length_limit_error(
     if not isinstance(exception, asyncio.LimitOverrunError):
         return
 
-    logging.error(
-        f"The extractor generated a message exceeding the message size limit of {human_size(line_length_limit)} (half the buffer size of {human_size(stream_buffer_size)})."
-    )
-    logging.error(
-        "To let this message be processed, increase the 'elt.buffer_size' setting to at least double the size of the largest expected message, and try again."
-    )
-    logging.error(
-        "To learn more, visit https://docs.meltano.com/reference/settings#eltbuffer_size"
-    )
+    log_line_length_limit_error(line_length_limit, stream_buffer_size, max_line_size)
     raise RunnerError("Output line length limit exceeded") from exception
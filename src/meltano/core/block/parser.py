@@ -10,7 +10,9 @@ import structlog
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.error import PluginNotFoundError
 from meltano.core.plugin.project_plugin import ProjectPlugin
+from meltano.core.plugin.singer.mapper import MappingConflictError, fuse_mappings
 from meltano.core.project_plugins_service import ProjectPluginsService
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.task_sets_service import TaskSetsService
 
 from .blockset import BlockSet, BlockSetValidationError
@@ -94,6 +96,8 @@ class BlockParser:  # noqa: D101
 
         self._plugins_service = ProjectPluginsService(project)
         self._plugins: list[ProjectPlugin] = []
+        # Shared by all block sets, to discover each extractor only once
+        self._catalog_cache: dict = {}
 
         self._commands: dict[int, str] = {}
         self._mappings_ref: dict[int, str] = {}
@@ -260,6 +264,7 @@ class BlockParser:  # noqa: D101
             .with_full_refresh(self._full_refresh)
             .with_no_state_update(self._no_state_update)
             .with_state_id_suffix(self._state_id_suffix)
+            .with_catalog_cache(self._catalog_cache)
         )
 
         if self._plugins[offset].type != PluginType.EXTRACTORS:
@@ -276,6 +281,12 @@ class BlockParser:  # noqa: D101
 
         blocks.append(builder.make_block(self._plugins[offset]))
 
+        fuse_mappers = ProjectSettingsService(
+            self.project, config_service=self._plugins_service.config_service
+        ).get("elt.fuse_mappers")
+        # Consecutive mappings of the same mapper, waiting to be turned into blocks
+        pending_mappings: list[ProjectPlugin] = []
+
         for idx, plugin in enumerate(self._plugins[offset + 1 :]):  # noqa: E203
             next_block = idx + 1
 
@@ -310,14 +321,16 @@ class BlockParser:  # noqa: D101
                     raise BlockSetValidationError(
                         f"Expected unique mappings name not the mapper plugin name: {plugin.name}."
                     )
-                else:
-                    blocks.append(
-                        builder.make_block(
-                            plugin,
-                        )
-                    )
+                if pending_mappings and pending_mappings[-1].name != plugin.name:
+                    blocks.extend(self._make_mapper_blocks(builder, pending_mappings))
+                    pending_mappings = []
+                pending_mappings.append(plugin)
+                if not fuse_mappers:
+                    blocks.extend(self._make_mapper_blocks(builder, pending_mappings))
+                    pending_mappings = []
             elif plugin.type == PluginType.LOADERS:
                 self.log.debug("blocks", offset=offset, idx=next_block)
+                blocks.extend(self._make_mapper_blocks(builder, pending_mappings))
                 blocks.append(builder.make_block(plugin))
                 elb = ExtractLoadBlocks(builder.context(), blocks)
                 return elb, idx + 2
@@ -331,3 +344,43 @@ class BlockParser:  # noqa: D101
                     f"Expected {PluginType.MAPPERS} or {PluginType.LOADERS}."
                 )
         raise BlockSetValidationError("Found no end in block set!")
+
+    def _make_mapper_blocks(
+        self, builder: ELBContextBuilder, mappings: list[ProjectPlugin]
+    ) -> list[SingerBlock]:
+        """Create the blocks for consecutive mappings of the same mapper.
+
+        When there is more than one mapping, they are fused into a single block
+        running one mapper process with the composed mapping config, unless
+        their configs conflict.
+
+        Args:
+            builder: The builder of the block set.
+            mappings: The mapping plugins, in the order they are run.
+
+        Returns:
+            The mapper blocks.
+        """
+        if len(mappings) < 2:
+            return [builder.make_block(mapping) for mapping in mappings]
+
+        mapping_names = [
+            mapping.extra_config.get("_mapping_name") for mapping in mappings
+        ]
+        try:
+            fused_mapping = fuse_mappings(mappings)
+        except MappingConflictError as err:
+            self.log.warning(
+                "Mappings can not be fused, running them as separate processes",
+                plugin_name=mappings[0].name,
+                mappings=mapping_names,
+                reason=str(err),
+            )
+            return [builder.make_block(mapping) for mapping in mappings]
+
+        self.log.info(
+            "Fusing mappings into a single mapper process",
+            plugin_name=mappings[0].name,
+            mappings=mapping_names,
+        )
+        return [builder.make_block(mappings[0], config_override=fused_mapping)]
@@ -145,7 +145,13 @@ class InvokerBase:  # noqa: WPS230, WPS214
             outputs = self._merge_outputs(self.invoker.StdioSource.STDOUT, self.outputs)
             self._stdout_future = asyncio.ensure_future(
                 # forward subproc stdout to downstream (i.e. targets stdin, loggers)
-                capture_subprocess_output(self.process_handle.stdout, *outputs)
+                capture_subprocess_output(
+                    self.process_handle.stdout,
+                    *outputs,
+                    max_line_size=self.project_settings_service.get(
+                        "elt.max_line_size"
+                    ),
+                )
             )
         return self._stdout_future
 
@@ -0,0 +1,142 @@
+"""Discover the catalogs of many extractors concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from enum import Enum
+from multiprocessing import cpu_count
+from typing import Any, Callable, Iterable, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from meltano.core.plugin.error import PluginLacksCapabilityError
+from meltano.core.plugin.project_plugin import ProjectPlugin
+from meltano.core.plugin_invoker import invoker_factory
+from meltano.core.project import Project
+from meltano.core.project_plugins_service import ProjectPluginsService
+from meltano.core.utils import noop
+
+
+class CatalogDiscoveryStatus(Enum):
+    """The outcome of discovering the catalog of an extractor."""
+
+    SUCCESS = "success"
+    SKIPPED = "skipped"
+    ERROR = "error"
+
+
+class CatalogDiscoveryResult(NamedTuple):
+    """The outcome of discovering the catalog of an extractor."""
+
+    plugin: ProjectPlugin
+    status: CatalogDiscoveryStatus
+    duration: float
+    message: str | None = None
+
+    @property
+    def successful(self) -> bool:
+        """Whether the catalog was discovered, or did not need to be.
+
+        Returns:
+            True unless discovery failed.
+        """
+        return self.status != CatalogDiscoveryStatus.ERROR
+
+
+class CatalogDiscoveryService:
+    """Discover the catalogs of extractors, several at a time.
+
+    The catalog of each extractor is discovered like before it is run, so it is
+    written to the catalog cache of the extractor and reused by later runs for
+    as long as the cache key of the extractor is unchanged.
+    """
+
+    def __init__(
+        self,
+        project: Project,
+        plugins_service: ProjectPluginsService = None,
+        parallelism: int | None = None,
+    ):
+        """Create a new catalog discovery service.
+
+        Args:
+            project: The Meltano project.
+            plugins_service: The project plugins service.
+            parallelism: The maximum number of discoveries to run at once.
+                Defaults to the number of cores, values below 1 mean no limit.
+        """
+        self.project = project
+        self.plugins_service = plugins_service or ProjectPluginsService(project)
+        if parallelism is None:
+            self.parallelism = cpu_count()
+        elif parallelism < 1:
+            self.parallelism = sys.maxsize
+        else:
+            self.parallelism = parallelism
+
+    async def discover_catalogs(
+        self,
+        session: Session,
+        plugins: Iterable[ProjectPlugin],
+        status_cb: Callable[[CatalogDiscoveryResult], Any] = noop,
+    ) -> list[CatalogDiscoveryResult]:
+        """Discover the catalogs of the given extractors.
+
+        Args:
+            session: The system database session.
+            plugins: The extractors to discover the catalogs of.
+            status_cb: Called with the result of each extractor once it is done.
+
+        Returns:
+            The results, in the order of the given extractors.
+        """
+        semaphore = asyncio.Semaphore(self.parallelism)
+
+        async def discover(plugin: ProjectPlugin) -> CatalogDiscoveryResult:
+            async with semaphore:
+                result = await self.discover_catalog(session, plugin)
+            status_cb(result)
+            return result
+
+        return await asyncio.gather(*(discover(plugin) for plugin in plugins))
+
+    async def discover_catalog(
+        self, session: Session, plugin: ProjectPlugin
+    ) -> CatalogDiscoveryResult:
+        """Discover the catalog of an extractor and apply its catalog rules.
+
+        Args:
+            session: The system database session.
+            plugin: The extractor to discover the catalog of.
+
+        Returns:
+            The result of the discovery.
+        """
+        start = time.monotonic()
+        try:
+            invoker = invoker_factory(
+                self.project, plugin, plugins_service=self.plugins_service
+            )
+            async with invoker.prepared(session):
+                await plugin.discover_catalog(invoker)
+                # The cache key is written once the catalog rules are applied
+                try:
+                    plugin.apply_catalog_rules(invoker)
+                except PluginLacksCapabilityError:
+                    pass
+        except PluginLacksCapabilityError as err:
+            return CatalogDiscoveryResult(
+                plugin,
+                CatalogDiscoveryStatus.SKIPPED,
+                time.monotonic() - start,
+                str(err),
+            )
+        except Exception as err:
+            return CatalogDiscoveryResult(
+                plugin, CatalogDiscoveryStatus.ERROR, time.monotonic() - start, str(err)
+            )
+        return CatalogDiscoveryResult(
+            plugin, CatalogDiscoveryStatus.SUCCESS, time.monotonic() - start
+        )
@@ -12,24 +12,60 @@ class DiscoveryFile(Canonical):
     def __init__(self, version=1, **plugins):
         """Create a new DiscoveryFile.
 
+        Plugin definitions are only built when plugins of their type are first
+        accessed, since most invocations only need a single plugin type.
+
         Args:
             version: The version of the discovery file.
             plugins: The plugins to add to the discovery file.
         """
         super().__init__(version=int(version))
 
+        self._raw_plugins = {}
         for ptype in PluginType:
             self[ptype] = []
 
         for plugin_type, raw_plugins in plugins.items():
-            for raw_plugin in raw_plugins:
-                plugin_def = PluginDefinition(
-                    plugin_type,
-                    raw_plugin.pop("name"),
-                    raw_plugin.pop("namespace"),
-                    **raw_plugin,
-                )
-                self[plugin_type].append(plugin_def)
+            self._raw_plugins[PluginType(plugin_type)] = raw_plugins
+
+    def __getattr__(self, attr):
+        """Return the value of the given attribute.
+
+        Args:
+            attr: Attribute to return.
+
+        Returns:
+            Value of the given attribute, building plugin definitions if needed.
+        """
+        if attr in self.__dict__.get("_raw_plugins", {}):
+            self._materialize(attr)
+        return super().__getattr__(attr)
+
+    def __iter__(self):
+        """Return an iterator over the attributes set on the current instance.
+
+        Yields:
+            An iterator over the attributes set on the current instance.
+        """
+        self.materialize()
+        yield from super().__iter__()
+
+    def materialize(self):
+        """Build the plugin definitions of all plugin types not accessed yet."""
+        for plugin_type in list(self._raw_plugins):
+            self._materialize(plugin_type)
+
+    def _materialize(self, plugin_type):
+        raw_plugins = self._raw_plugins.pop(plugin_type)
+        self[plugin_type].extend(
+            PluginDefinition(
+                plugin_type,
+                raw_plugin.pop("name"),
+                raw_plugin.pop("namespace"),
+                **raw_plugin,
+            )
+            for raw_plugin in raw_plugins
+        )
 
     @classmethod
     def file_version(cls, attrs):
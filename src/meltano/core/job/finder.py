@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import aliased
 
 from .job import HEARTBEAT_VALID_MINUTES, HEARTBEATLESS_JOB_VALID_HOURS, Job, State
 
 
+class LatestJobs(NamedTuple):
+    """The latest job and the latest successful job for a state ID."""
+
+    latest: Job
+    latest_success: Job | None
+
+
 class JobFinder:
     """Query builder for the `Job` model for a certain `elt_uri`."""
 
@@ -131,6 +142,62 @@ class JobFinder:
             .first()
         )
 
+    @classmethod
+    def latest_for_state_ids(
+        cls, session, state_ids: Iterable[str]
+    ) -> dict[str, LatestJobs]:
+        """Get the latest and latest successful jobs for many state IDs at once.
+
+        Equivalent to calling `latest` and `latest_success` for every state ID,
+        but runs a single query, ranking the jobs of each state ID.
+
+        Args:
+            session: the session to use in querying the db
+            state_ids: the state IDs to get the jobs for
+
+        Returns:
+            The latest jobs by state ID, for the state IDs with any job
+        """
+        state_ids = set(state_ids)
+        if not state_ids:
+            return {}
+
+        is_success = (Job.state == State.SUCCESS) & Job.ended_at.isnot(None)
+        ranked = (
+            session.query(
+                Job,
+                func.row_number()
+                .over(partition_by=Job.job_name, order_by=Job.started_at.desc())
+                .label("latest_rank"),
+                func.row_number()
+                .over(
+                    partition_by=Job.job_name,
+                    order_by=(case((is_success, 0), else_=1), Job.ended_at.desc()),
+                )
+                .label("success_rank"),
+            )
+            .filter(Job.job_name.in_(state_ids))
+            .subquery()
+        )
+        ranked_job = aliased(Job, ranked)
+        rows = session.query(
+            ranked_job, ranked.c.latest_rank, ranked.c.success_rank
+        ).filter((ranked.c.latest_rank == 1) | (ranked.c.success_rank == 1))
+
+        latest = {}
+        latest_success = {}
+        for job, latest_rank, success_rank in rows:
+            if latest_rank == 1:
+                latest[job.job_name] = job
+            # Without successful jobs, the first ranked job is not successful
+            if success_rank == 1 and job.is_success() and job.ended_at is not None:
+                latest_success[job.job_name] = job
+
+        return {
+            state_id: LatestJobs(job, latest_success.get(state_id))
+            for state_id, job in latest.items()
+        }
+
     @classmethod
     def all_stale(cls, session):
         """Return all stale states.
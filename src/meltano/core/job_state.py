@@ -2,13 +2,15 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Iterable, Iterator
 
 from sqlalchemy import Column, types
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, Session
 
-from meltano.core.job import JobFinder, Payload
+from meltano.core.job import Job, JobFinder, Payload
 from meltano.core.models import SystemModel
 from meltano.core.sqlalchemy import JSONEncodedDict
 from meltano.core.utils import merge
@@ -73,3 +75,55 @@ class JobState(SystemModel):
             partial_state=partial_state,
             completed_state=completed_state,
         )
+
+    @classmethod
+    def all_from_job_history(
+        cls, session: Session, batch_size: int
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Build the state of every state_id from job run history.
+
+        Equivalent to calling `from_job_history` for every state_id with state
+        in its job run history, but in a single pass over the runs ordered by
+        state_id and end time, reading the runs of `batch_size` state_ids at once.
+
+        Args:
+            session: the session to use in finding job history
+            batch_size: the number of state_ids to read the job history of at once
+
+        Yields:
+            Tuples of state_id and the state built from its job run history
+        """
+        with_payload = (Job.payload_flags != 0, Job.ended_at.isnot(None))
+        state_ids = [
+            state_id
+            for (state_id,) in session.query(Job.job_name)
+            .filter(*with_payload)
+            .distinct()
+            .order_by(Job.job_name)
+        ]
+        for start in range(0, len(state_ids), batch_size):
+            # Read the whole batch before yielding, as the caller may commit
+            # the session in between.
+            runs = (
+                session.query(Job.job_name, Job.payload_flags, Job.payload)
+                .filter(Job.job_name.in_(state_ids[start : start + batch_size]))
+                .filter(*with_payload)
+                .order_by(Job.job_name, Job.ended_at)
+                .all()
+            )
+            for state_id, state_id_runs in groupby(runs, key=itemgetter(0)):
+                yield state_id, cls._replay(state_id_runs)
+
+    @staticmethod
+    def _replay(runs: Iterable[tuple[str, int, dict]]) -> dict[str, Any]:
+        state: dict[str, Any] = {}
+        for _, payload_flags, payload in runs:
+            # A completed job replaces the state, incomplete jobs since then
+            # are merged into it, like in `from_job_history`.
+            if payload_flags & Payload.STATE:
+                state = {}
+            elif not payload_flags & Payload.INCOMPLETE_STATE:
+                continue
+            if SINGER_STATE_KEY in payload:
+                state = merge(payload, state, adopt=True)
+        return state
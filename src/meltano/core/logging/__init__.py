@@ -3,9 +3,12 @@ from __future__ import annotations
 
 from .formatters import console_log_formatter, json_formatter, key_value_formatter
 from .job_logging_service import (
+    COMPRESSED_SUFFIX,
     JobLoggingService,
     MissingJobLogException,
     SizeThresholdJobLogException,
 )
+from .log_sink import BufferedLogSink
 from .output_logger import OutputLogger
+from .output_tail import OutputTail
 from .utils import DEFAULT_LEVEL, LEVELS, capture_subprocess_output, setup_logging
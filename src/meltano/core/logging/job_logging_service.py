@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import gzip
 import logging
 import os
-from contextlib import contextmanager
+import shutil
+import stat
+import time
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Iterable, Iterator
 
 from meltano.core.project import Project
+from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.utils import makedirs, slugify
 
+from .log_sink import BufferedLogSink
+from .output_logger import OutputLogger
+
 MAX_FILE_SIZE = 2097152  # 2MB max
 
+# Logs of a run, compressed or not, and their rotated backups, e.g. `elt.log.1.gz`
+LOG_GLOB = "*.log*"
+COMPRESSED_SUFFIX = ".gz"
+
 
 class MissingJobLogException(Exception):
     """Occurs when `JobLoggingService` can not find a requested log."""
@@ -19,8 +33,20 @@ class SizeThresholdJobLogException(Exception):
 
 
 class JobLoggingService:
-    def __init__(self, project: Project):
+    def __init__(self, project: Project, settings: ProjectSettingsService = None):
         self.project = project
+        self._settings = settings
+
+    @property
+    def settings(self) -> ProjectSettingsService:
+        """Get the project settings used for log rotation, compression and retention.
+
+        Returns:
+            A `ProjectSettingsService` for this service's project.
+        """
+        if self._settings is None:
+            self._settings = ProjectSettingsService(self.project)
+        return self._settings
 
     @makedirs
     def logs_dir(self, state_id, *joinpaths):
@@ -52,18 +78,130 @@ class JobLoggingService:
             with open(os.devnull, "w") as log_file:
                 yield log_file
 
+    def output_logger(self, state_id: str, run_id: str) -> OutputLogger:
+        """Create an `OutputLogger` writing to the log of a run.
+
+        The log is rotated within the run according to the `elt.logs.max_bytes`
+        and `elt.logs.backup_count` settings, and written from a background
+        thread if `elt.logs.buffered` is enabled.
+
+        Args:
+            state_id: The state ID of the job.
+            run_id: The run ID of the job.
+
+        Returns:
+            An `OutputLogger` for the run's log file.
+        """
+        return OutputLogger(
+            self.generate_log_name(state_id, run_id),
+            max_bytes=self.settings.get("elt.logs.max_bytes") or 0,
+            backup_count=self.settings.get("elt.logs.backup_count") or 0,
+            sink=BufferedLogSink.from_settings(self.settings),
+        )
+
+    def finalize_logs(self, state_id: str, run_id: str) -> None:
+        """Compress the logs of a finished run and apply the retention policy.
+
+        Args:
+            state_id: The state ID of the job.
+            run_id: The run ID of the job.
+        """
+        if self.settings.get("elt.logs.compression") == "gzip":
+            for log_path in self.logs_dir(state_id, str(run_id)).glob(LOG_GLOB):
+                if log_path.suffix != COMPRESSED_SUFFIX:
+                    self.compress_log(log_path)
+
+        self.prune_logs(
+            state_id,
+            keep_last=self.settings.get("elt.logs.keep_last"),
+            max_age=self.settings.get("elt.logs.max_age"),
+        )
+
+    def compress_log(self, log_path: Path) -> Path:
+        """Compress a log file with gzip, replacing the original file.
+
+        Args:
+            log_path: The log file to compress.
+
+        Returns:
+            The path of the compressed log file.
+        """
+        compressed_path = log_path.with_name(f"{log_path.name}{COMPRESSED_SUFFIX}")
+        try:
+            with log_path.open("rb") as src, gzip.open(compressed_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        except OSError:
+            logging.error(f"Could not compress log file {str(log_path)!r}")
+            with suppress(FileNotFoundError):
+                compressed_path.unlink()
+            return log_path
+
+        # Keep the modification time, which orders the logs of a run
+        log_stat = log_path.stat()
+        os.utime(compressed_path, ns=(log_stat.st_atime_ns, log_stat.st_mtime_ns))
+        log_path.unlink()
+        return compressed_path
+
+    def prune_logs(
+        self, state_id: str, keep_last: int | None = None, max_age: int | None = None
+    ) -> int:
+        """Delete the logs of old runs for the provided `state_id`.
+
+        Args:
+            state_id: The state ID of the job.
+            keep_last: Number of most recent runs to keep the logs of.
+            max_age: Maximum age (in days) of the runs to keep the logs of.
+
+        Returns:
+            The number of run log directories that were deleted.
+        """
+        if not keep_last and not max_age:
+            return 0
+
+        run_dirs = self._run_dirs([self.logs_dir(state_id)])
+
+        expired = []
+        if keep_last:
+            expired.extend(run_dirs[keep_last:])
+            run_dirs = run_dirs[:keep_last]
+        if max_age:
+            cutoff = time.time() - max_age * 86400
+            expired.extend(path for path in run_dirs if path.stat().st_mtime < cutoff)
+
+        for run_dir in expired:
+            shutil.rmtree(run_dir, ignore_errors=True)
+
+        return len(expired)
+
+    def open_log(self, log_path: Path, binary: bool = False):
+        """Open a log file for reading, decompressing it if needed.
+
+        Args:
+            log_path: The log file to open.
+            binary: Whether to open the log file in binary mode.
+
+        Returns:
+            A file object.
+        """
+        mode = "rb" if binary else "rt"
+        if log_path.suffix == COMPRESSED_SUFFIX:
+            return gzip.open(log_path, mode)
+        return log_path.open(mode)
+
     def get_latest_log(self, state_id):
         """Get the contents of the most recent log for any ELT job that ran with the provided `state_id`."""
         try:
-            latest_log = next(iter(self.get_all_logs(state_id)))
+            latest_log = next(self._logs(state_id))
+
+            with self.open_log(latest_log) as f:
+                log = f.read(MAX_FILE_SIZE + 1)
 
-            if latest_log.stat().st_size > MAX_FILE_SIZE:
+            if len(log) > MAX_FILE_SIZE:
                 raise SizeThresholdJobLogException(
                     f"The log file size exceeds '{MAX_FILE_SIZE}'"
                 )
 
-            with latest_log.open() as f:
-                return f.read()
+            return log
         except StopIteration:
             raise MissingJobLogException(
                 f"Could not find any log for job with id '{state_id}'"
@@ -74,9 +212,12 @@ class JobLoggingService:
             )
 
     def get_downloadable_log(self, state_id):
-        """Get the `*.log` file of the most recent log for any ELT job that ran with the provided `state_id`."""
+        """Get the `*.log` file of the most recent log for any ELT job that ran with the provided `state_id`.
+
+        Compressed logs are returned as-is, with a `.log.gz` extension.
+        """
         try:
-            latest_log = next(iter(self.get_all_logs(state_id)))
+            latest_log = next(self._logs(state_id))
             return str(latest_log.resolve())
         except StopIteration:
             raise MissingJobLogException(
@@ -90,20 +231,65 @@ class JobLoggingService:
     def get_all_logs(self, state_id):
         """Get all the log files for any ELT job that ran with the provided `state_id`.
 
-        The result is ordered so that the most recent is first on the list.
+        Rotated backups of the logs are included. The result is ordered so that
+        the logs of the most recent run are first on the list, with the current
+        log of a run before its backups.
         """
-        log_files = []
-        for logs_dir in self.logs_dirs(state_id):
-            log_files.extend(list(logs_dir.glob("**/*.log")))
+        return list(self._logs(state_id))
+
+    def _logs(self, state_id: str) -> Iterator[Path]:
+        # Only the run directories are listed upfront, so that getting the
+        # latest log only lists the logs of the most recent run
+        for run_dir in self._run_dirs(self.logs_dirs(state_id)):
+            yield from self._newest_first(run_dir.glob(LOG_GLOB), self._log_sort_key)
 
-        log_files.sort(key=lambda path: os.stat(path).st_ctime_ns, reverse=True)
+    def _run_dirs(self, logs_dirs: Iterable[Path]) -> list[Path]:
+        """Get the run directories within the given directories, newest first.
+
+        Args:
+            logs_dirs: The directories holding a directory per run.
+
+        Returns:
+            The run directories, ordered by modification time.
+        """
+        entries = (entry for logs_dir in logs_dirs for entry in logs_dir.iterdir())
+        return self._newest_first(entries, self._run_dir_sort_key)
 
-        return log_files
+    @staticmethod
+    def _newest_first(paths: Iterable[Path], sort_key) -> list[Path]:
+        keyed = []
+        for path in paths:
+            # Paths may be deleted concurrently, e.g. by the retention policy
+            with suppress(FileNotFoundError):
+                key = sort_key(path)
+                if key is not None:
+                    keyed.append((key, path))
+        keyed.sort(key=lambda entry: entry[0], reverse=True)
+        return [path for _, path in keyed]
+
+    @staticmethod
+    def _run_dir_sort_key(path: Path) -> int | None:
+        path_stat = path.stat()
+        return path_stat.st_mtime_ns if stat.S_ISDIR(path_stat.st_mode) else None
+
+    @staticmethod
+    def _log_sort_key(log_path: Path) -> tuple[int, int]:
+        # Backups rotated within the same clock tick sort after the current log
+        name = log_path.name
+        if name.endswith(COMPRESSED_SUFFIX):
+            name = name[: -len(COMPRESSED_SUFFIX)]
+        _, _, backup_index = name.rpartition(".log.")
+        rotation = int(backup_index) if backup_index.isdigit() else 0
+        return log_path.stat().st_mtime_ns, -rotation
 
     def delete_all_logs(self, state_id):
-        """Delete all the log files for any ELT job that ran with the provided `state_id`."""
-        for log_path in self.get_all_logs(state_id):
-            log_path.unlink()
+        """Delete all the log files for any ELT job that ran with the provided `state_id`.
+
+        Rotated backups of the logs are deleted as well.
+        """
+        for logs_dir in self.logs_dirs(state_id):
+            for log_path in logs_dir.glob("**/*.log*"):
+                log_path.unlink()
 
     def legacy_logs_dir(self, state_id, *joinpaths):
         job_dir = self.project.run_dir("elt").joinpath(slugify(state_id), *joinpaths)
@@ -0,0 +1,212 @@
+"""Batched, asynchronous sink for high-volume plugin output."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from meltano.core.settings_service import SettingsService
+
+    from .output_logger import Out
+
+logger = structlog.stdlib.get_logger(__name__)
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 500
+
+_STOP = object()
+
+
+class _OutState:
+    """Per-`Out` bookkeeping used for sampling and rate limiting."""
+
+    def __init__(self):
+        self.last_line = None
+        self.repeats = 0
+        self.window_start = 0.0
+        self.window_count = 0
+        self.rate_limited = 0
+
+
+class BufferedLogSink:  # noqa: WPS230
+    """Queue lines written to `Out` instances and log them from a background thread.
+
+    Lines are formatted and written by the full logging processor chain in batches,
+    off the event loop that pumps data between plugins. The queue is bounded: when
+    it is full, lines are dropped and counted rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_repeats: int | None = None,
+        rate_limit: int | None = None,
+    ):
+        """Instantiate a buffered log sink.
+
+        Args:
+            queue_size: Maximum number of lines waiting to be logged.
+            batch_size: Maximum number of lines logged per batch.
+            max_repeats: Number of consecutive identical lines to log before
+                suppressing further repetitions, or None to log all of them.
+            rate_limit: Maximum number of lines per second to log for each `Out`,
+                or None for no limit.
+        """
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.max_repeats = max_repeats
+        self.rate_limit = rate_limit
+
+        self.dropped = 0
+        self.suppressed = 0
+        self.errors = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._states: dict[Out, _OutState] = {}
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_settings(cls, settings: SettingsService) -> BufferedLogSink | None:
+        """Create a sink configured by the `elt.logs.*` settings.
+
+        Args:
+            settings: The project settings service.
+
+        Returns:
+            A `BufferedLogSink`, or None if buffered logging is disabled.
+        """
+        if not settings.get("elt.logs.buffered"):
+            return None
+
+        return cls(
+            queue_size=settings.get("elt.logs.queue_size") or DEFAULT_QUEUE_SIZE,
+            max_repeats=settings.get("elt.logs.max_repeats"),
+            rate_limit=settings.get("elt.logs.rate_limit"),
+        )
+
+    def write(self, out: Out, line: str) -> None:
+        """Queue a line written to an `Out`, without blocking.
+
+        Args:
+            out: The `Out` the line was written to.
+            line: The line to log.
+        """
+        state = self._states.setdefault(out, _OutState())
+
+        if self.rate_limit and self._rate_limited(out, state):
+            return
+
+        if self.max_repeats is not None:
+            if line == state.last_line:
+                state.repeats += 1
+                if state.repeats > self.max_repeats:
+                    self.suppressed += 1
+                    return
+            else:
+                self._summarize_repeats(out, state)
+                state.last_line = line
+                state.repeats = 1
+
+        self._put(out, line)
+
+    def flush(self) -> None:
+        """Log all queued lines and stop the background thread.
+
+        The thread is started again on the next write.
+        """
+        for out, state in self._states.items():
+            self._summarize_repeats(out, state)
+            self._summarize_rate_limited(out, state)
+        self._states.clear()
+
+        if self._thread is None:
+            return
+
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+        if self.dropped:
+            logger.warning(
+                "Log queue overflowed, some plugin output was not logged",
+                dropped=self.dropped,
+                queue_size=self.queue_size,
+            )
+            self.dropped = 0
+
+    def _put(self, out: Out, line: str) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="meltano-log-sink", daemon=True
+            )
+            self._thread.start()
+
+        try:
+            self._queue.put_nowait((out.logger, out.write_level, line, out.name))
+        except queue.Full:
+            self.dropped += 1
+
+    def _rate_limited(self, out: Out, state: _OutState) -> bool:
+        now = time.monotonic()
+        if now - state.window_start >= 1:
+            self._summarize_rate_limited(out, state)
+            state.window_start = now
+            state.window_count = 0
+
+        state.window_count += 1
+        if state.window_count > self.rate_limit:
+            state.rate_limited += 1
+            self.suppressed += 1
+            return True
+
+        return False
+
+    def _summarize_repeats(self, out: Out, state: _OutState) -> None:
+        if self.max_repeats is None or state.repeats <= self.max_repeats:
+            return
+
+        self._put(
+            out,
+            f"(previous line repeated {state.repeats - self.max_repeats} more times)",
+        )
+        state.repeats = 0
+
+    def _summarize_rate_limited(self, out: Out, state: _OutState) -> None:
+        if not state.rate_limited:
+            return
+
+        self._put(
+            out,
+            f"({state.rate_limited} lines were not logged due to the rate limit of "
+            + f"{self.rate_limit} lines per second)",
+        )
+        state.rate_limited = 0
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            with suppress(queue.Empty):
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                    continue
+
+                bound_logger, level, line, name = item
+                try:
+                    bound_logger.log(level, line, name=name)
+                except Exception:
+                    self.errors += 1
+
+            for _ in batch:
+                self._queue.task_done()
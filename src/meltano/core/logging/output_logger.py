@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import logging.handlers
 import os
 import sys
 from contextlib import (
@@ -16,19 +17,33 @@ from contextlib import (
 import structlog
 
 from .formatters import LEVELED_TIMESTAMPED_PRE_CHAIN
+from .log_sink import BufferedLogSink
 from .utils import capture_subprocess_output
 
 
 class OutputLogger:
     """Output Logger."""
 
-    def __init__(self, file):
+    def __init__(
+        self,
+        file,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        sink: BufferedLogSink | None = None,
+    ):
         """Instantiate an Output Logger.
 
         Args:
             file: A file to output to.
+            max_bytes: Size (in bytes) at which the file is rotated, 0 to disable.
+            backup_count: Number of rotated files to keep.
+            sink: Optional sink to queue written lines to, instead of logging them
+                synchronously.
         """
         self.file = file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.sink = sink
         self.stdout = sys.stdout
         self.stderr = sys.stderr
 
@@ -61,6 +76,11 @@ class OutputLogger:
         self.outs[name] = out
         return out
 
+    def flush(self) -> None:
+        """Log any lines still queued in the sink, if there is one."""
+        if self.sink:
+            self.sink.flush()
+
 
 class LineWriter:
     """Line Writer."""
@@ -159,7 +179,8 @@ class Out:  # noqa: WPS230
         """Configure a logging.Handler suitable for redirecting logs too.
 
         Returns:
-            logging.FileHandler using an uncolorized console formatter
+            logging.FileHandler using an uncolorized console formatter, or a
+            logging.handlers.RotatingFileHandler if rotation is enabled.
         """
         formatter = structlog.stdlib.ProcessorFormatter(
             processor=structlog.dev.ConsoleRenderer(
@@ -167,7 +188,14 @@ class Out:  # noqa: WPS230
             ),
             foreign_pre_chain=LEVELED_TIMESTAMPED_PRE_CHAIN,
         )
-        handler = logging.FileHandler(self.file)
+        if self.output_logger.max_bytes:
+            handler = logging.handlers.RotatingFileHandler(
+                self.file,
+                maxBytes=self.output_logger.max_bytes,
+                backupCount=self.output_logger.backup_count,
+            )
+        else:
+            handler = logging.FileHandler(self.file)
         handler.setFormatter(formatter)
         return handler
 
@@ -191,7 +219,8 @@ class Out:  # noqa: WPS230
             With the side-effect of redirecting logging.
         """  # noqa: DAR401
         logger = logging.getLogger()
-        logger.addHandler(self.redirect_log_handler)
+        handler = self.redirect_log_handler
+        logger.addHandler(handler)
         ignored_errors = (
             KeyboardInterrupt,
             asyncio.CancelledError,
@@ -205,7 +234,9 @@ class Out:  # noqa: WPS230
             logger.error(str(err), exc_info=True)
             raise
         finally:
-            logger.removeHandler(self.redirect_log_handler)
+            self.output_logger.flush()
+            logger.removeHandler(handler)
+            handler.close()
 
     @asynccontextmanager
     async def writer(self):
@@ -256,7 +287,10 @@ class Out:  # noqa: WPS230
             line: A line to write.
         """
         self.last_line = line
-        self.logger.log(self.write_level, line.rstrip(), name=self.name)
+        if self.output_logger.sink:
+            self.output_logger.sink.write(self, line.rstrip())
+        else:
+            self.logger.log(self.write_level, line.rstrip(), name=self.name)
 
     async def _read_from_fd(self, read_fd):
         # Since we're redirecting our own stdout and stderr output,
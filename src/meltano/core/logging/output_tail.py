@@ -0,0 +1,128 @@
+"""Bounded capture of the last lines of the output of a subprocess."""
+
+from __future__ import annotations
+
+from collections import deque
+
+DEFAULT_MAX_LINES = 100
+DEFAULT_MAX_SIZE = 64 * 1024  # 64 KiB
+
+
+class OutputTail:
+    """Keep the last lines written to it, bounded in number and total size.
+
+    Output of a subprocess is often only needed to report why it failed, but
+    can grow very large, e.g. when a plugin logs at debug level. An
+    `OutputTail` can be written to like a text file or a line writer, and
+    keeps only the last `max_lines` lines, up to `max_size` characters in
+    total, while counting everything written to it.
+    """
+
+    def __init__(
+        self, max_lines: int = DEFAULT_MAX_LINES, max_size: int = DEFAULT_MAX_SIZE
+    ):
+        """Create a new output tail.
+
+        Args:
+            max_lines: the maximum number of lines to keep.
+            max_size: the maximum number of characters to keep. Lines longer
+                than this are truncated to their last `max_size` characters.
+        """
+        self.max_lines = max_lines
+        self.max_size = max_size
+
+        self.line_count = 0
+        self.size = 0
+
+        self._lines: deque[str] = deque()
+        self._lines_size = 0
+        self._partial = ""
+
+    def write(self, data: str) -> int:
+        """Write text, which may hold any number of lines or pieces of a line.
+
+        Args:
+            data: the text to write.
+
+        Returns:
+            The number of characters written.
+        """
+        self.size += len(data)
+        lines = (self._partial + data).splitlines(keepends=True)
+        self._partial = ""
+        if lines and not lines[-1].endswith("\n"):
+            # Only the end of an incomplete line would be kept anyway
+            self._partial = lines.pop()[-self.max_size :]  # noqa: WPS362
+        for line in lines:
+            self._append(line)
+        self._trim()
+        return len(data)
+
+    def writeline(self, line: str) -> None:
+        """Write a line, to be usable as a `SubprocessOutputWriter`.
+
+        Args:
+            line: the line to write.
+        """
+        self.write(line)
+
+    def flush(self) -> None:
+        """Do nothing, to be usable as a text file."""
+
+    @property
+    def lines(self) -> list[str]:
+        """Get the lines that were kept, including a trailing incomplete line.
+
+        Returns:
+            The lines, in the order they were written.
+        """
+        if self._partial:
+            return [*self._lines, self._partial]
+        return list(self._lines)
+
+    @property
+    def last_line(self) -> str:
+        """Get the last line written.
+
+        Returns:
+            The last line, or an empty string if nothing was written.
+        """
+        if self._partial:
+            return self._partial
+        return self._lines[-1] if self._lines else ""
+
+    @property
+    def omitted_lines(self) -> int:
+        """Get the number of lines that were written but not kept.
+
+        Returns:
+            The number of omitted lines.
+        """
+        return self.line_count - len(self._lines)
+
+    def getvalue(self) -> str:
+        """Get the text that was kept, noting how many earlier lines were omitted.
+
+        Returns:
+            The text.
+        """
+        text = "".join(self.lines)
+        if self.omitted_lines:
+            return f"[{self.omitted_lines} earlier lines omitted]\n{text}"
+        return text
+
+    def _append(self, line: str) -> None:
+        line = line[-self.max_size :]  # noqa: WPS362
+        self.line_count += 1
+        self._lines.append(line)
+        self._lines_size += len(line)
+        self._trim()
+
+    def _trim(self) -> None:
+        # A trailing incomplete line counts toward both limits
+        partial_lines = 1 if self._partial else 0
+        while self._lines and (
+            len(self._lines) + partial_lines > self.max_lines
+            or self._lines_size + len(self._partial) > self.max_size
+        ):
+            self._lines_size -= len(self._lines.popleft())
@@ -18,7 +18,7 @@ from meltano.core.logging.formatters import (
 )
 from meltano.core.project import Project
 from meltano.core.project_settings_service import ProjectSettingsService
-from meltano.core.utils import get_no_color_flag
+from meltano.core.utils import get_no_color_flag, human_size
 
 try:
     from typing import Protocol  # noqa: WPS433
@@ -34,6 +34,8 @@ LEVELS = {  # noqa: WPS407
     "critical": logging.CRITICAL,
 }
 DEFAULT_LEVEL = "info"
+logger = structlog.get_logger(__name__)
+
 FORMAT = "[%(asctime)s] [%(process)d|%(threadName)10s|%(name)s] [%(levelname)s] %(message)s"  # noqa: WPS323
 
 
@@ -215,8 +217,46 @@ async def _write_line_writer(writer, line):
     return True
 
 
+async def readline(
+    reader: asyncio.StreamReader, max_line_size: int | None = None
+) -> bytes:
+    """Read a line, even when it does not fit in the buffer of the reader.
+
+    Lines longer than the line length limit of the reader are read in chunks
+    of the size of its buffer, instead of raising the limit for every line.
+
+    Args:
+        reader: the StreamReader to read the line from.
+        max_line_size: the size a line may grow to beyond the line length limit
+            of the reader, or None to only allow lines within the limit.
+
+    Returns:
+        The line, including the trailing newline if there is one.
+
+    Raises:
+        ValueError: wrapping a `LimitOverrunError`, like `StreamReader.readline`,
+            if the line is longer than both the limit and `max_line_size`.
+    """
+    chunks = []
+    size = 0
+    while True:
+        try:
+            chunks.append(await reader.readuntil(b"\n"))
+        except asyncio.IncompleteReadError as err:
+            chunks.append(err.partial)
+        except asyncio.LimitOverrunError as err:
+            size += err.consumed
+            if max_line_size is None or size > max_line_size:
+                raise ValueError(err.args[0])
+            chunks.append(await reader.readexactly(err.consumed))
+            continue
+        return b"".join(chunks)
+
+
 async def capture_subprocess_output(
-    reader: asyncio.StreamReader | None, *line_writers: SubprocessOutputWriter
+    reader: asyncio.StreamReader | None,
+    *line_writers: SubprocessOutputWriter,
+    max_line_size: int | None = None,
 ) -> None:
     """Capture in real time the output stream of a suprocess that is run async.
 
@@ -230,13 +270,46 @@ async def capture_subprocess_output(
     Args:
         reader: asyncio.StreamReader object that is the output stream of the subprocess.
         line_writers: any object thats a StreamWriter or has a writelines method accepting a string.
+        max_line_size: the size lines may grow to beyond the line length limit of the
+            reader, or None to only allow lines within the limit.
     """
-    while not reader.at_eof():
-        line = await reader.readline()
-        if not line:
-            continue
+    # Lines that did not fit in the buffer of the reader are reported at the end
+    oversized_lines = 0
+    largest_line_size = 0
+    try:
+        while not reader.at_eof():
+            if max_line_size is not None and isinstance(reader, asyncio.StreamReader):
+                line = await readline(reader, max_line_size)
+            else:
+                line = await reader.readline()
+            if not line:
+                continue
+
+            if max_line_size is not None and len(line) > _reader_limit(reader):
+                oversized_lines += 1
+                largest_line_size = max(largest_line_size, len(line))
+
+            for writer in line_writers:
+                if not await _write_line_writer(writer, line):
+                    # If the destination stream is closed, we can stop capturing output.
+                    return
+    finally:
+        if oversized_lines:
+            logger.info(
+                "Read lines exceeding the stream buffer line length limit",
+                count=oversized_lines,
+                largest_line_size=human_size(largest_line_size),
+                line_length_limit=human_size(_reader_limit(reader)),
+            )
+
+
+def _reader_limit(reader: asyncio.StreamReader) -> int:
+    """Get the line length limit of a StreamReader.
 
-        for writer in line_writers:
-            if not await _write_line_writer(writer, line):
-                # If the destination stream is closed, we can stop capturing output.
-                return
+    Args:
+        reader: the StreamReader.
+
+    Returns:
+        The line length limit, or the asyncio default for other readers.
+    """
+    return getattr(reader, "_limit", 2**16)  # noqa: WPS432 (asyncio default)
@@ -20,6 +20,9 @@ from meltano.migrations import LOCK_PATH, MIGRATION_DIR
 
 SPLAT = "*"
 
+# URLs of the system databases found to be at the locked revision by this process
+_up_to_date_urls: set[str] = set()
+
 
 class MigrationError(Exception):
     """Generic class for migration errors."""
@@ -59,6 +62,41 @@ class MigrationService:
             if rev.revision == target_revision:
                 raise MigrationUneededException
 
+    def is_up_to_date(self) -> bool:
+        """Check whether the system database is at the locked revision.
+
+        Unlike `upgrade`, this does not load the migration scripts: the revision
+        in `alembic_version` is compared to the revision lock in a single query.
+        A database found to be up-to-date is not checked again by this process.
+
+        Returns:
+            True if the database is at the locked revision, False if it needs to
+            be upgraded or could not be checked.
+        """
+        url = str(self.engine.url)
+        if url in _up_to_date_urls:
+            return True
+
+        try:
+            head = LOCK_PATH.read_text().strip()
+        except FileNotFoundError:
+            return False
+
+        try:
+            with closing(self.engine.connect()) as conn:
+                revisions = conn.execute(
+                    sqlalchemy.text("SELECT version_num FROM alembic_version")
+                ).fetchall()
+        except sqlalchemy.exc.SQLAlchemyError:
+            # e.g. the `alembic_version` table does not exist yet
+            return False
+
+        if [revision for (revision,) in revisions] != [head]:
+            return False
+
+        _up_to_date_urls.add(url)
+        return True
+
     def upgrade(  # noqa: WPS213, WPS231 too many expression and too complex
         self, silent: bool = False
     ) -> None:
@@ -4,17 +4,21 @@ from __future__ import annotations
 import configparser
 import logging
 import os
+import shutil
 import subprocess
 
 from packaging.version import Version
 
 from meltano.core.behavior.hookable import hook
 from meltano.core.error import AsyncSubprocessError
+from meltano.core.plugin.init_marker import InitMarker
 from meltano.core.plugin_invoker import PluginInvoker
 from meltano.core.utils import nest
 
 from . import BasePlugin, PluginType
 
+DEFAULT_CONFIG_FILENAME = "airflow.default.cfg"
+
 
 class AirflowInvoker(PluginInvoker):
     """Invoker that prepares env for Airflow."""
@@ -40,6 +44,16 @@ class Airflow(BasePlugin):
 
     invoker_class = AirflowInvoker
 
+    def is_run_dir_relocatable(self) -> bool:
+        """Return whether the run directory of the plugin can be relocated.
+
+        The run directory is the Airflow home, which holds persistent files.
+
+        Returns:
+            False
+        """
+        return False
+
     @property
     def config_files(self):
         """Return the configuration files required by the plugin.
@@ -104,6 +118,10 @@ class Airflow(BasePlugin):
     async def before_configure(self, invoker: AirflowInvoker, session):
         """Generate config file and keep metadata database up-to-date.
 
+        The default config file and the metadata database are only generated
+        again when the installation or the configuration of Airflow changed
+        since the last time, or when initialization is forced.
+
         Args:
             invoker: the active PluginInvoker
             session: metadata database session
@@ -111,6 +129,15 @@ class Airflow(BasePlugin):
         Raises:
             AsyncSubprocessError: if command failed to run
         """
+        init_marker = InitMarker(invoker, invoker.plugin_config_processed)
+        default_cfg_path = invoker.files["config"].with_name(DEFAULT_CONFIG_FILENAME)
+        if init_marker.is_current() and default_cfg_path.exists():
+            shutil.copyfile(default_cfg_path, invoker.files["config"])
+            self.update_config_file(invoker)
+            await invoker.prepare(session)
+            logging.debug("Airflow is already initialized, skipping `airflow initdb`")
+            return
+
         # generate the default `airflow.cfg`
         handle = await invoker.invoke_async(
             "--help",
@@ -124,6 +151,7 @@ class Airflow(BasePlugin):
             raise AsyncSubprocessError(
                 "Command `airflow --help` failed", process=handle
             )
+        shutil.copyfile(invoker.files["config"], default_cfg_path)
 
         # Read and update airflow.cfg
         self.update_config_file(invoker)
@@ -165,6 +193,7 @@ class Airflow(BasePlugin):
                 handle,
             )
 
+        init_marker.record()
         logging.debug("Completed `airflow initdb`")
 
     @hook("before_cleanup")
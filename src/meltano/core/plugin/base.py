@@ -536,6 +536,21 @@ class BasePlugin(HookObject):  # noqa: WPS214
         except AttributeError:
             return getattr(self._variant, attr)
 
+    def _resolution_version(self) -> tuple | None:
+        """Get the versions of the definition and variant attributes are read from.
+
+        Used by the `Canonical` instances falling back to this plugin to tell
+        when the values they resolved through it are outdated.
+
+        Returns:
+            The resolution versions of the plugin definition and the variant.
+        """
+        definition_version = self._plugin_def._resolution_version()  # noqa: WPS437
+        variant_version = self._variant._resolution_version()  # noqa: WPS437
+        if definition_version is None or variant_version is None:
+            return None
+        return (definition_version, variant_version)
+
     @property
     def variant(self) -> str:
         """Return the variant name.
@@ -665,6 +680,18 @@ class BasePlugin(HookObject):  # noqa: WPS214
         """
         return True
 
+    def is_run_dir_relocatable(self) -> bool:
+        """Return whether the run directory of the plugin can be relocated.
+
+        Plugins that keep persistent files in their run directory, instead of
+        files that only live as long as an invocation, can not be relocated to
+        the `run_files_dir`.
+
+        Returns:
+            True if the run directory can be relocated, False otherwise.
+        """
+        return True
+
     def should_add_to_file(self) -> bool:
         """Return whether the plugin should be added to the config file.
 
@@ -0,0 +1,76 @@
+"""Markers recording the initialization of plugins, to skip it when nothing changed."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from meltano.core.plugin_invoker import PluginInvoker
+
+INIT_MARKER_FILENAME = ".meltano_init_marker"
+
+
+class InitMarker:
+    """Marker recording that a plugin was initialized for a given installation and config.
+
+    Initializing a plugin, e.g. creating or upgrading its metadata database, can
+    take a long time while usually changing nothing. The marker holds a hash of
+    the installation of the plugin and the config relevant to the initialization,
+    so the initialization is only run again when either of them changed, or when
+    it is forced with `meltano invoke --force-init`.
+    """
+
+    def __init__(self, invoker: PluginInvoker, config: Any):
+        """Create a marker for the current installation of the plugin of an invoker.
+
+        Args:
+            invoker: the active PluginInvoker
+            config: the JSON-serializable config relevant to the initialization
+        """
+        self.invoker = invoker
+        self.path = invoker.plugin_config_service.run_dir.joinpath(INIT_MARKER_FILENAME)
+        self.digest = hashlib.sha256(
+            json.dumps(
+                {"installation": self._installation(), "config": config},
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+
+    def is_current(self) -> bool:
+        """Return whether the plugin was initialized with the current installation and config.
+
+        Returns:
+            True if the initialization can be skipped, False if it must run.
+        """
+        if self.invoker.force_init:
+            return False
+
+        try:
+            return self.path.read_text() == self.digest
+        except FileNotFoundError:
+            return False
+
+    def record(self) -> None:
+        """Record that the plugin was initialized with the current installation and config."""
+        self.path.write_text(self.digest)
+
+    def _installation(self) -> list:
+        # (Re)installing the plugin rewrites the venv fingerprint, and plugins
+        # without a venv change their executable when they are upgraded.
+        if self.invoker.venv_service:
+            path = self.invoker.venv_service.plugin_fingerprint_path
+        else:
+            path = Path(
+                shutil.which(str(self.invoker.exec_path())) or self.invoker.exec_path()
+            )
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return [str(path), None]
+        return [str(path), stat.st_mtime_ns, stat.st_size]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
@@ -12,8 +13,17 @@ from meltano.core.setting_definition import SettingDefinition, SettingKind
 
 from . import PluginType, SingerPlugin
 
+if TYPE_CHECKING:
+    from meltano.core.plugin.project_plugin import ProjectPlugin
+
 logger = structlog.stdlib.get_logger(__name__)
 
+FUSED_MAPPING_NAME_DELIMITER = "+"
+
+
+class MappingConflictError(Exception):
+    """Occurs when mapping configs can not be composed into a single config."""
+
 
 class SingerMapper(SingerPlugin):
     """A SingerMapper is a singer spec compliant stream mapper."""
@@ -48,7 +58,7 @@ class SingerMapper(SingerPlugin):
 
         config_payload: dict = {}
         with open(config_path, "w") as config_file:
-            config_payload = self._get_mapping_config(invoker.plugin.extra_config)
+            config_payload = self._get_mapping_config(invoker.plugin_config_extras)
             json.dump(config_payload, config_file, indent=2)
 
         logger.debug(
@@ -64,3 +74,62 @@ class SingerMapper(SingerPlugin):
         for mapping in extra_config.get("_mappings", []):
             if mapping.get("name") == extra_config.get("_mapping_name"):
                 return mapping["config"]
+
+
+def compose_mapping_configs(configs: list[dict], path: str = "") -> dict:
+    """Compose the configs of consecutive mappings into a single config.
+
+    Objects are merged key by key and arrays, such as lists of transformations,
+    are concatenated in order. Any other value must be the same in every config.
+
+    Args:
+        configs: The mapping configs, in the order the mappings are run.
+        path: The path of the configs being composed, used in error messages.
+
+    Returns:
+        The composed config.
+
+    Raises:
+        MappingConflictError: If the configs set different values for the same key.
+    """
+    composed: dict[str, Any] = {}
+    for config in configs:
+        for key, value in config.items():
+            key_path = f"{path}.{key}" if path else key
+            if key not in composed:
+                composed[key] = value
+            elif isinstance(composed[key], dict) and isinstance(value, dict):
+                composed[key] = compose_mapping_configs(
+                    [composed[key], value], key_path
+                )
+            elif isinstance(composed[key], list) and isinstance(value, list):
+                composed[key] = [*composed[key], *value]
+            elif composed[key] != value:
+                raise MappingConflictError(f"Conflicting values for '{key_path}'")
+    return composed
+
+
+def fuse_mappings(mappings: list[ProjectPlugin]) -> dict:
+    """Build the settings overrides that run consecutive mappings as one mapping.
+
+    Args:
+        mappings: Mapping plugins of the same mapper, in the order they are run.
+
+    Returns:
+        The `_mapping_name` and `_mappings` extras of the fused mapping.
+
+    Raises:
+        MappingConflictError: If the mapping configs can not be composed.
+    """
+    fused_name = FUSED_MAPPING_NAME_DELIMITER.join(
+        mapping.extra_config.get("_mapping_name") or mapping.name
+        for mapping in mappings
+    )
+    configs = [
+        SingerMapper._get_mapping_config(mapping.extra_config) or {}  # noqa: WPS437
+        for mapping in mappings
+    ]
+    return {
+        "_mapping_name": fused_name,
+        "_mappings": [{"name": fused_name, "config": compose_mapping_configs(configs)}],
+    }
@@ -3,19 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import json
 import logging
 import shutil
 import sys
 from asyncio.streams import StreamReader
-from hashlib import sha1
-from io import StringIO
+from hashlib import sha1, sha256
 from pathlib import Path
 
 import structlog
 from jsonschema import Draft4Validator
 
 from meltano.core.behavior.hookable import hook
+from meltano.core.logging.output_tail import OutputTail
 from meltano.core.plugin.error import PluginExecutionError, PluginLacksCapabilityError
 from meltano.core.plugin_invoker import PluginInvoker
 from meltano.core.setting_definition import SettingDefinition, SettingKind
@@ -35,22 +36,68 @@ from .catalog import (
 
 logger = structlog.getLogger(__name__)
 
+# Extras that determine the catalog rules applied to a discovered catalog
+CATALOG_RULES_EXTRAS = ("_catalog", "_schema", "_select", "_metadata", "_select_filter")
+
+# Size of the chunks in which discovery output is read
+DISCOVERY_CHUNK_SIZE = 2**16  # 64 KiB
+
+
+async def _stream_copy(stream: asyncio.StreamReader, *file_like_objs):
+    """Copy a stream to file like objects in fixed-size chunks.
+
+    Unlike copying line by line, this works regardless of the length of the
+    lines, e.g. for catalogs written as a single line of JSON.
+
+    Args:
+        stream: the stream to copy
+        file_like_objs: the binary file like objects to copy the stream to
+    """
+    while True:
+        chunk = await stream.read(DISCOVERY_CHUNK_SIZE)
+        if not chunk:
+            return
+        for file_like_obj in file_like_objs:
+            file_like_obj.write(chunk)
+
 
 async def _stream_redirect(
     stream: asyncio.StreamReader, *file_like_objs, write_str=False
 ):
-    """Redirect stream to a file like obj.
+    """Redirect stream to a file like obj, line by line.
+
+    The stream is read in fixed-size chunks, and lines longer than a chunk are
+    redirected in pieces of that size instead of failing.
 
     Args:
         stream: the stream to redirect
         file_like_objs: the objects to redirect the stream to
         write_str: if True, stream is written as str
     """
-    encoding = sys.getdefaultencoding()
-    while not stream.at_eof():
-        data = await stream.readline()
-        for file_like_obj in file_like_objs:
-            file_like_obj.write(data.decode(encoding) if write_str else data)
+    decoder = codecs.getincrementaldecoder(sys.getdefaultencoding())()
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(DISCOVERY_CHUNK_SIZE)
+        buffer.extend(chunk)
+        end = buffer.rfind(b"\n") + 1
+        if not chunk or (not end and len(buffer) >= DISCOVERY_CHUNK_SIZE):
+            end = len(buffer)
+
+        start = 0
+        while start < end:
+            stop = buffer.find(b"\n", start, end) + 1 or end
+            data = bytes(buffer[start:stop])
+            if write_str:
+                # Pieces of long lines may end within a multi-byte character
+                data = decoder.decode(data, final=not chunk)
+            if data:
+                for file_like_obj in file_like_objs:
+                    file_like_obj.write(data)
+            start = stop
+        del buffer[:end]
+
+        if not chunk:
+            return
 
 
 def _debug_logging_handler(
@@ -289,7 +336,9 @@ class SingerTap(SingerPlugin):
 
             return
         # the `state.json` is stored in the database
-        state = StateService(elt_context.session).get_state(elt_context.job.job_name)
+        state = StateService(
+            elt_context.session, project=elt_context.project
+        ).get_state(elt_context.job.job_name)
         if state:
             if state.get(SINGER_STATE_KEY):
                 with state_path.open("w") as state_file:
@@ -354,6 +403,10 @@ class SingerTap(SingerPlugin):
         except FileNotFoundError:
             pass
 
+        # Block sets of one `meltano run` invocation sharing the extractor
+        # share a catalog cache, so discovery runs only once for all of them
+        catalog_cache = getattr(plugin_invoker.context, "catalog_cache", None)
+
         custom_catalog_filename = plugin_invoker.plugin_config_extras["_catalog"]
         if custom_catalog_filename:
             custom_catalog_path = plugin_invoker.project.root.joinpath(
@@ -368,6 +421,16 @@ class SingerTap(SingerPlugin):
                     f"Could not find catalog file {custom_catalog_path}"
                 ) from err
         else:
+            discovery_key = (
+                "discovery",
+                plugin_invoker.plugin.name,
+                json.dumps(plugin_invoker.plugin_config, sort_keys=True, default=str),
+            )
+            if catalog_cache is not None and discovery_key in catalog_cache:
+                catalog_path.write_bytes(catalog_cache[discovery_key])
+                logger.debug("Using catalog discovered earlier in this invocation")
+                return
+
             await self.run_discovery(plugin_invoker, catalog_path)
 
         # test for the result to be a valid catalog
@@ -381,6 +444,9 @@ class SingerTap(SingerPlugin):
                 f"Catalog discovery failed: invalid catalog: {err}"
             ) from err
 
+        if not custom_catalog_filename and catalog_cache is not None:
+            catalog_cache[discovery_key] = catalog_path.read_bytes()
+
     async def run_discovery(  # noqa: WPS238
         self, plugin_invoker: PluginInvoker, catalog_path: Path
     ):  # noqa: DAR401
@@ -399,58 +465,54 @@ class SingerTap(SingerPlugin):
             raise PluginLacksCapabilityError(
                 f"Extractor '{self.name}' does not support catalog discovery (the `discover` capability is not advertised)"
             )
-        with StringIO("") as stderr_buff:
-            try:
-                with catalog_path.open(mode="wb") as catalog:
-                    handle = await plugin_invoker.invoke_async(
-                        "--discover",
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                        universal_newlines=False,
-                    )
+        # Only the end of stderr is reported, however much the tap logs
+        stderr_tail = OutputTail()
+        try:
+            with catalog_path.open(mode="wb") as catalog:
+                handle = await plugin_invoker.invoke_async(
+                    "--discover",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    universal_newlines=False,
+                )
 
-                    invoke_futures = [
-                        asyncio.ensure_future(_stream_redirect(handle.stdout, catalog)),
-                        asyncio.ensure_future(handle.wait()),
-                    ]
-                    if logger.isEnabledFor(logging.DEBUG) and handle.stderr:
-                        invoke_futures.append(
-                            _debug_logging_handler(
-                                self.name,
-                                plugin_invoker,
-                                handle.stderr,
-                                stderr_buff,
-                            )
+                invoke_futures = [
+                    asyncio.ensure_future(_stream_copy(handle.stdout, catalog)),
+                    asyncio.ensure_future(handle.wait()),
+                ]
+                if logger.isEnabledFor(logging.DEBUG) and handle.stderr:
+                    invoke_futures.append(
+                        _debug_logging_handler(
+                            self.name,
+                            plugin_invoker,
+                            handle.stderr,
+                            stderr_tail,
                         )
-                    else:
-                        invoke_futures.append(
-                            asyncio.ensure_future(
-                                _stream_redirect(
-                                    handle.stderr, stderr_buff, write_str=True
-                                )
-                            )
+                    )
+                else:
+                    invoke_futures.append(
+                        asyncio.ensure_future(
+                            _stream_redirect(handle.stderr, stderr_tail, write_str=True)
                         )
-                    done, _ = await asyncio.wait(
-                        invoke_futures,
-                        return_when=asyncio.ALL_COMPLETED,
                     )
-                    failed = [
-                        future for future in done if future.exception() is not None
-                    ]
-                    if failed:
-                        failed_future = failed.pop()
-                        raise failed_future.exception()
-                exit_code = handle.returncode
-            except Exception:
-                catalog_path.unlink()
-                raise
-
-            if exit_code != 0:
-                catalog_path.unlink()
-                stderr_buff.seek(0)
-                raise PluginExecutionError(
-                    f"Catalog discovery failed: command {plugin_invoker.exec_args('--discover')} returned {exit_code} with stderr:\n {stderr_buff.read()}"
+                done, _ = await asyncio.wait(
+                    invoke_futures,
+                    return_when=asyncio.ALL_COMPLETED,
                 )
+                failed = [future for future in done if future.exception() is not None]
+                if failed:
+                    failed_future = failed.pop()
+                    raise failed_future.exception()
+            exit_code = handle.returncode
+        except Exception:
+            catalog_path.unlink()
+            raise
+
+        if exit_code != 0:
+            catalog_path.unlink()
+            raise PluginExecutionError(
+                f"Catalog discovery failed: command {plugin_invoker.exec_args('--discover')} returned {exit_code} with stderr:\n {stderr_tail.getvalue()}"
+            )
 
     @hook("before_invoke")
     async def apply_catalog_rules_hook(
@@ -521,19 +583,35 @@ class SingerTap(SingerPlugin):
 
         catalog_path = plugin_invoker.files["catalog"]
         catalog_cache_key_path = plugin_invoker.files["catalog_cache_key"]
+        catalog_cache = getattr(plugin_invoker.context, "catalog_cache", None)
 
         try:
-            with catalog_path.open() as catalog_file:
-                catalog = json.load(catalog_file)
+            catalog_content = catalog_path.read_bytes()
+            rules_key = (
+                "catalog_rules",
+                sha256(catalog_content).hexdigest(),
+                json.dumps(
+                    {extra: config[extra] for extra in CATALOG_RULES_EXTRAS},
+                    sort_keys=True,
+                    default=str,
+                ),
+            )
+            if catalog_cache is not None and rules_key in catalog_cache:
+                catalog_path.write_bytes(catalog_cache[rules_key])
+                logger.debug("Using catalog rules applied earlier in this invocation")
+            else:
+                catalog = json.loads(catalog_content)
 
-            if schema_rules:
-                SchemaExecutor(schema_rules).visit(catalog)
+                if schema_rules:
+                    SchemaExecutor(schema_rules).visit(catalog)
 
-            if metadata_rules:
-                MetadataExecutor(metadata_rules).visit(catalog)
+                if metadata_rules:
+                    MetadataExecutor(metadata_rules).visit(catalog)
 
-            with catalog_path.open("w") as catalog_f:
-                json.dump(catalog, catalog_f, indent=2)
+                catalog_content = json.dumps(catalog, indent=2).encode()
+                catalog_path.write_bytes(catalog_content)
+                if catalog_cache is not None:
+                    catalog_cache[rules_key] = catalog_content
 
             cache_key = self.catalog_cache_key(plugin_invoker)
             if cache_key:
@@ -156,5 +156,12 @@ class SingerTarget(SingerPlugin):
 
         plugin_invoker.add_output_handler(
             plugin_invoker.StdioSource.STDOUT,
-            BookmarkWriter(elt_context.job, elt_context.session, payload_flag),
+            BookmarkWriter(
+                elt_context.job,
+                elt_context.session,
+                payload_flag,
+                state_service=StateService(
+                    elt_context.session, project=elt_context.project
+                ),
+            ),
         )
@@ -9,6 +9,7 @@ import structlog
 from meltano.core.behavior.hookable import hook
 from meltano.core.error import AsyncSubprocessError
 from meltano.core.plugin.error import PluginExecutionError
+from meltano.core.plugin.init_marker import InitMarker
 from meltano.core.plugin_invoker import PluginInvoker
 from meltano.core.setting_definition import SettingDefinition
 
@@ -44,6 +45,16 @@ class Superset(BasePlugin):
 
     EXTRA_SETTINGS = [SettingDefinition(name="_config_path")]
 
+    def is_run_dir_relocatable(self) -> bool:
+        """Return whether the run directory of the plugin can be relocated.
+
+        The run directory is the Superset home, which holds persistent files.
+
+        Returns:
+            False
+        """
+        return False
+
     @property
     def config_files(self):
         """Return the configuration files required by the plugin.
@@ -104,10 +115,39 @@ class Superset(BasePlugin):
             config_file.write("\n".join(config_script_lines))
         logging.debug(f"Created configuration at {config_path}")
 
+    @staticmethod
+    def init_marker(invoker: PluginInvoker) -> InitMarker:
+        """Get the marker recording the initialization of Superset.
+
+        Args:
+            invoker: the active PluginInvoker
+
+        Returns:
+            The marker for the current installation and configuration, including
+            the contents of the custom config file.
+        """
+        custom_config = None
+        custom_config_filename = invoker.plugin_config_extras["_config_path"]
+        if custom_config_filename:
+            custom_config = invoker.project.root.joinpath(
+                custom_config_filename
+            ).read_text()
+
+        return InitMarker(
+            invoker,
+            {
+                "config": invoker.plugin_config_processed,
+                "custom_config": custom_config,
+            },
+        )
+
     @hook("before_invoke")
     async def db_upgrade_hook(self, invoker: PluginInvoker, exec_args: list[str]):
         """Create or upgrade metadata database.
 
+        Skipped when Superset was already initialized with the current
+        installation and configuration.
+
         Args:
             invoker: the active PluginInvoker
             exec_args: the args being passed
@@ -115,6 +155,12 @@ class Superset(BasePlugin):
         Raises:
             AsyncSubprocessError: if command failed to run
         """
+        if self.init_marker(invoker).is_current():
+            logging.debug(
+                "Superset is already initialized, skipping `superset db upgrade`"
+            )
+            return
+
         handle = await invoker.invoke_async(
             "db",
             "upgrade",
@@ -135,6 +181,9 @@ class Superset(BasePlugin):
     async def init_hook(self, invoker: PluginInvoker, exec_args: list[str]):
         """Create default roles and permissions.
 
+        Skipped when Superset was already initialized with the current
+        installation and configuration.
+
         Args:
             invoker: the active PluginInvoker
             exec_args: the args being passed
@@ -142,6 +191,11 @@ class Superset(BasePlugin):
         Raises:
             AsyncSubprocessError: if command failed to run
         """
+        init_marker = self.init_marker(invoker)
+        if init_marker.is_current():
+            logging.debug("Superset is already initialized, skipping `superset init`")
+            return
+
         handle = await invoker.invoke_async(
             "init",
             stdout=subprocess.PIPE,
@@ -155,6 +209,7 @@ class Superset(BasePlugin):
                 handle,
             )
 
+        init_marker.record()
         logging.debug("Completed `superset init`")
 
     @hook("before_cleanup")
@@ -3,26 +3,32 @@
 from __future__ import annotations
 
 import io
+import json
 import logging
+import pickle  # noqa: S403
 import re
+import time
 from abc import ABCMeta, abstractmethod
-from typing import Iterable
+from contextlib import suppress
+from typing import Any, Iterable
 
 import requests
+from atomicwrites import atomic_write
 from ruamel.yaml import YAMLError
+from ruamel.yaml.scalarbool import ScalarBoolean
 
 import meltano
 from meltano.core import bundle
 from meltano.core.behavior.versioned import IncompatibleVersionError, Versioned
 from meltano.core.discovery_file import DiscoveryFile
 from meltano.core.plugin import BasePlugin, PluginDefinition, PluginRef, PluginType
-from meltano.core.plugin.base import StandalonePlugin
 from meltano.core.plugin.error import PluginNotFoundError
 from meltano.core.plugin.factory import base_plugin_factory
 from meltano.core.plugin.project_plugin import ProjectPlugin
+from meltano.core.plugin_lock_service import plugin_lock_index
 from meltano.core.project import Project
 from meltano.core.project_settings_service import ProjectSettingsService
-from meltano.core.utils import NotFound, find_named
+from meltano.core.utils import NotFound, find_named, hash_sha256
 from meltano.core.yaml import yaml
 
 
@@ -38,6 +44,30 @@ class DiscoveryUnavailableError(Exception):
 # See https://docs.meltano.com/contribute/plugins#discoveryyml-version for more information.
 VERSION = 22
 
+# Increment this version number whenever the format of the compiled discovery cache changes.
+COMPILED_DISCOVERY_FORMAT = 1
+
+
+def _to_builtin(obj: Any) -> Any:
+    """Convert a round-trip YAML document to plain Python objects.
+
+    Args:
+        obj: The parsed YAML document, or a node in it.
+
+    Returns:
+        The document as dicts, lists, strings, and numbers, which pickle compactly.
+    """
+    if isinstance(obj, dict):
+        return {_to_builtin(key): _to_builtin(val) for key, val in obj.items()}
+    if isinstance(obj, (list, tuple, set)):
+        return [_to_builtin(val) for val in obj]
+    if isinstance(obj, ScalarBoolean):
+        return bool(obj)
+    for builtin_type in (str, bool, int, float):
+        if isinstance(obj, builtin_type):
+            return builtin_type(obj)
+    return obj
+
 
 class PluginRepository(metaclass=ABCMeta):
     """A generic plugin definition repository."""
@@ -162,6 +192,15 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
         """
         return self.settings_service.get("discovery_url_auth")
 
+    @property
+    def discovery_url_ttl(self) -> int:
+        """Return the `discovery_url_ttl` setting.
+
+        Returns:
+            The number of seconds a downloaded manifest is used without revalidation.
+        """
+        return self.settings_service.get("discovery_url_ttl") or 0
+
     @property
     def discovery(self):
         """Return first compatible discovery manifest from a few locations.
@@ -169,6 +208,7 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
         Locations:
 
         - project local `discovery.yml`
+        - .meltano/cache/discovery.yml, if downloaded within `discovery_url_ttl`
         - `discovery_url` project setting
         - .meltano/cache/discovery.yml
         - meltano.core.bundle
@@ -187,6 +227,10 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
                 self.load_local_discovery,
                 "your project's local `discovery.yml` manifest",
             ),
+            (
+                self.load_fresh_cached_discovery,
+                "the recently downloaded `discovery.yml` manifest",
+            ),
             (
                 self.load_remote_discovery,
                 f"the `discovery.yml` manifest received from {self.discovery_url}",
@@ -234,9 +278,35 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
         except FileNotFoundError:
             pass
 
+    def load_fresh_cached_discovery(self) -> DiscoveryFile | None:
+        """Load the cached `discovery.yml` manifest if it is still fresh.
+
+        The cached manifest is fresh if it was downloaded from the current
+        `discovery_url` less than `discovery_url_ttl` seconds ago.
+
+        Returns:
+            The discovery file, or None if there is no fresh cached manifest.
+        """
+        discovery_url = self.discovery_url
+        if not discovery_url or not self.discovery_url_ttl:
+            return None
+
+        metadata = self.cached_discovery_metadata()
+        if metadata.get("url") != discovery_url:
+            return None
+
+        age = time.time() - metadata.get("fetched_at", 0)
+        if not 0 <= age < self.discovery_url_ttl:
+            return None
+
+        return self.load_cached_discovery()
+
     def load_remote_discovery(self) -> DiscoveryFile | None:
         """Load the remote `discovery.yml` manifest.
 
+        The request is conditional on the cached manifest having changed, using
+        the `ETag` and `Last-Modified` headers received when it was downloaded.
+
         Returns:
             The discovery file.
         """
@@ -256,6 +326,16 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
             headers["X-Project-ID"] = project_id
             params["project_id"] = project_id
 
+        metadata = self.cached_discovery_metadata()
+        revalidate = (
+            metadata.get("url") == discovery_url and self.cached_discovery_file.exists()
+        )
+        if revalidate:
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
         try:
             response = requests.get(discovery_url, headers=headers, params=params)
             response.raise_for_status()
@@ -267,9 +347,31 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
             logging.debug(str(err))
             return None
 
+        if revalidate and response.status_code == 304:
+            logging.debug("Remote `discovery.yml` manifest has not changed.")
+            discovery = self.load_cached_discovery()
+            if discovery:
+                self._refresh_discovery_metadata(
+                    discovery_url, metadata.get("etag"), metadata.get("last_modified")
+                )
+            return discovery
+
         remote_discovery = io.StringIO(response.text)
 
-        return self.load_discovery(remote_discovery, cache=True)
+        discovery = self.load_discovery(remote_discovery, cache=True)
+        self._refresh_discovery_metadata(
+            discovery_url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        return discovery
+
+    def _refresh_discovery_metadata(self, *args):
+        try:
+            self.cache_discovery_metadata(*args)
+        except (OSError, TypeError) as err:
+            # The manifest will be revalidated next time it is needed
+            logging.debug(f"Remote `discovery.yml` metadata could not be cached: {err}")
 
     def load_cached_discovery(self):
         """Load the cached `discovery.yml` manifest.
@@ -297,6 +399,10 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
     def load_discovery(self, discovery_file, cache=False) -> DiscoveryFile:
         """Load the `discovery.yml` manifest.
 
+        Parsing the manifest as YAML is slow, so once a manifest has been parsed
+        and validated it is compiled to `.meltano/cache/discovery.pickle`, which
+        later invocations load instead.
+
         Args:
             discovery_file: The file to load.
             cache: Whether to cache the manifest.
@@ -308,26 +414,156 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
             DiscoveryInvalidError: If the discovery file is invalid.
         """
         try:
-            discovery_yaml = yaml.load(discovery_file)
+            discovery_content = discovery_file.read()
+            cache_key = self.compiled_discovery_key(discovery_content)
+            discovery_yaml = self.load_compiled_discovery(cache_key)
+            compiled = discovery_yaml is not None
+            if not compiled:
+                discovery_yaml = _to_builtin(yaml.load(discovery_content))
+                # Serialized now, since `DiscoveryFile` consumes `discovery_yaml`
+                compiled_discovery = pickle.dumps(
+                    {"key": cache_key, "discovery": discovery_yaml},
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
 
             self._discovery_version = DiscoveryFile.file_version(discovery_yaml)
             self.ensure_compatible()
 
             self._discovery = DiscoveryFile.parse(discovery_yaml)
 
+            if not compiled:
+                # Build every plugin definition so that invalid manifests are
+                # rejected here and never compiled. Compiled manifests are known
+                # to be valid, so their definitions are built lazily per type.
+                self._discovery.materialize()
+                self.compile_discovery(compiled_discovery)
+
             if cache:
-                self.cache_discovery()
+                self.cache_discovery(discovery_content)
 
             return self._discovery
         except (YAMLError, Exception) as err:
             raise DiscoveryInvalidError(str(err))
 
-    def cache_discovery(self):
-        """Cache the `discovery.yml` manifest."""
-        with self.cached_discovery_file.open("w") as cached_discovery:
-            yaml.dump(
-                self._discovery,
-                cached_discovery,
+    @staticmethod
+    def compiled_discovery_key(discovery_content: str) -> tuple:
+        """Return the key identifying the compiled form of a `discovery.yml` manifest.
+
+        Args:
+            discovery_content: The content of the `discovery.yml` manifest.
+
+        Returns:
+            The key of the compiled manifest.
+        """
+        return (
+            COMPILED_DISCOVERY_FORMAT,
+            meltano.__version__,
+            VERSION,
+            hash_sha256(discovery_content),
+        )
+
+    def load_compiled_discovery(self, cache_key: tuple) -> dict | None:
+        """Load the compiled `discovery.yml` manifest.
+
+        Args:
+            cache_key: The key of the manifest to load.
+
+        Returns:
+            The parsed manifest, or None if it was not compiled yet.
+        """
+        try:
+            with self.compiled_discovery_file.open("rb") as compiled_discovery:
+                compiled = pickle.load(compiled_discovery)  # noqa: S301
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            logging.debug(
+                f"Compiled `discovery.yml` manifest could not be loaded: {err}"
+            )
+            return None
+
+        if isinstance(compiled, dict) and compiled.get("key") == cache_key:
+            return compiled["discovery"]
+        return None
+
+    def compile_discovery(self, compiled_discovery: bytes):
+        """Write the compiled `discovery.yml` manifest.
+
+        Args:
+            compiled_discovery: The pickled manifest and its key.
+        """
+        try:
+            with atomic_write(
+                self.compiled_discovery_file, mode="wb", overwrite=True
+            ) as compiled_discovery_file:
+                compiled_discovery_file.write(compiled_discovery)
+        except OSError as err:
+            logging.debug(
+                f"Compiled `discovery.yml` manifest could not be written: {err}"
+            )
+
+    def cache_discovery(self, discovery_content: str | None = None):
+        """Cache the `discovery.yml` manifest.
+
+        Args:
+            discovery_content: The content of the manifest. When not given, the
+                loaded manifest is serialized instead. The cache is only rewritten
+                if the content changed.
+        """
+        if discovery_content is not None:
+            with suppress(FileNotFoundError):
+                if self.cached_discovery_file.read_text() == discovery_content:
+                    return
+
+        # A different manifest is cached, so the download metadata no longer applies
+        with suppress(FileNotFoundError):
+            self.cached_discovery_metadata_file.unlink()
+
+        with atomic_write(
+            self.cached_discovery_file, overwrite=True
+        ) as cached_discovery:
+            if discovery_content is None:
+                yaml.dump(self._discovery, cached_discovery)
+            else:
+                cached_discovery.write(discovery_content)
+
+    def cached_discovery_metadata(self) -> dict:
+        """Return how and when the cached `discovery.yml` manifest was downloaded.
+
+        Returns:
+            The URL, `ETag`, `Last-Modified` header and download timestamp of the
+            cached manifest, or an empty dict if it was not downloaded.
+        """
+        try:
+            with self.cached_discovery_metadata_file.open() as metadata_file:
+                return json.load(metadata_file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def cache_discovery_metadata(
+        self,
+        discovery_url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        """Record that the cached `discovery.yml` manifest was downloaded just now.
+
+        Args:
+            discovery_url: The URL the manifest was downloaded from.
+            etag: The `ETag` header of the response.
+            last_modified: The `Last-Modified` header of the response.
+        """
+        with atomic_write(
+            self.cached_discovery_metadata_file, overwrite=True
+        ) as metadata_file:
+            json.dump(
+                {
+                    "url": discovery_url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "fetched_at": time.time(),
+                },
+                metadata_file,
             )
 
     @property
@@ -339,6 +575,24 @@ class PluginDiscoveryService(  # noqa: WPS214 (too many public methods)
         """
         return self.project.meltano_dir("cache", "discovery.yml")
 
+    @property
+    def cached_discovery_metadata_file(self):
+        """Return the file recording where the cached manifest was downloaded from.
+
+        Returns:
+            The cached `discovery.yml` manifest metadata file.
+        """
+        return self.project.meltano_dir("cache", "discovery.json")
+
+    @property
+    def compiled_discovery_file(self):
+        """Return the compiled `discovery.yml` manifest cache file.
+
+        Returns:
+            The compiled `discovery.yml` manifest cache file.
+        """
+        return self.project.meltano_dir("cache", "discovery.pickle")
+
     def get_plugins_of_type(self, plugin_type):
         """Return the plugins of the given type.
 
@@ -484,9 +738,10 @@ class LockedDefinitionService(PluginRepository):
         Raises:
             PluginNotFoundError: If the plugin definition could not be found.
         """
-        path = self.project.plugin_lock_path(plugin_type, plugin_name, variant_name)
         try:
-            standalone = StandalonePlugin.parse_json_file(path)
+            standalone = plugin_lock_index.find(
+                self.project, plugin_type, plugin_name, variant_name
+            )
         except FileNotFoundError as err:
             raise PluginNotFoundError(PluginRef(plugin_type, plugin_name)) from err
         return PluginDefinition.from_standalone(standalone)
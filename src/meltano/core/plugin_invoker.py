@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import enum
+import hashlib
 import logging
 import os
+import shutil
 import uuid
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
-from typing import Any, Generator
+from typing import IO, Any, AsyncIterator, Generator
 
 from structlog.stdlib import get_logger
 
@@ -30,6 +32,9 @@ from .venv_service import VenvService, VirtualEnv
 
 logger = get_logger(__name__)
 
+# Size of the chunks in which plugin files are dumped
+DUMP_CHUNK_SIZE = 2**16  # 64 KiB
+
 
 def invoker_factory(project, plugin: ProjectPlugin, *args, **kwargs):
     """Instantiate a plugin invoker from a project plugin.
@@ -137,6 +142,7 @@ class PluginInvoker:  # noqa: WPS214, WPS230
         plugins_service: ProjectPluginsService | None = None,
         plugin_config_service: PluginConfigService | None = None,
         plugin_settings_service: PluginSettingsService | None = None,
+        force_init: bool = False,
     ):
         """Create a new plugin invoker.
 
@@ -151,11 +157,14 @@ class PluginInvoker:  # noqa: WPS214, WPS230
             plugins_service: Plugin manager.
             plugin_config_service: Plugin Configuration manager.
             plugin_settings_service: Plugin Settings manager.
+            force_init: Whether to run initialization hooks that are skipped when
+                the plugin was already initialized.
         """
         self.project = project
         self.plugin = plugin
         self.context = context
         self.output_handlers = output_handlers
+        self.force_init = force_init
 
         self.venv_service: VenvService | None = None
         if plugin.pip_url or venv_service:
@@ -164,13 +173,16 @@ class PluginInvoker:  # noqa: WPS214, WPS230
                 name=plugin.venv_name,
                 namespace=plugin.type,
             )
+        self.plugins_service = plugins_service or ProjectPluginsService(project)
+
         self.plugin_config_service = plugin_config_service or PluginConfigService(
             plugin,
             config_dir or self.project.plugin_dir(plugin),
-            run_dir or self.project.run_dir(plugin.name),
+            self._relocate_run_dir(
+                run_dir or self.project.run_dir(plugin.name, make_dirs=False)
+            ),
         )
 
-        self.plugins_service = plugins_service or ProjectPluginsService(project)
         self.settings_service = plugin_settings_service or PluginSettingsService(
             project,
             plugin,
@@ -183,6 +195,35 @@ class PluginInvoker:  # noqa: WPS214, WPS230
         self.plugin_config_extras = {}
         self.plugin_config_env = {}
 
+    def _relocate_run_dir(self, run_dir: Path | str) -> Path:
+        """Move a run directory inside `.meltano/run` to the `run_files_dir`.
+
+        Args:
+            run_dir: The run directory of the invocation.
+
+        Returns:
+            The relocated run directory, or the given one if `run_files_dir` is
+            not set, the plugin can not be relocated or the run directory is not
+            inside `.meltano/run`. In any case, the directory exists.
+        """
+        run_dir = Path(run_dir)
+        run_files_dir = ProjectSettingsService(
+            self.project, config_service=self.plugins_service.config_service
+        ).get("run_files_dir")
+        if run_files_dir and self.plugin.is_run_dir_relocatable():
+            with suppress(ValueError):
+                relative_run_dir = run_dir.relative_to(
+                    self.project.run_dir(make_dirs=False)
+                )
+                # Keep the run files of projects sharing the directory apart
+                project_key = hashlib.sha256(
+                    str(self.project.root).encode()
+                ).hexdigest()[:16]
+                run_dir = Path(run_files_dir, project_key, relative_run_dir)
+
+        run_dir.mkdir(parents=True, exist_ok=True)
+        return run_dir
+
     @property
     def capabilities(self):
         """Get plugin immutable capabilities.
@@ -494,6 +535,33 @@ class PluginInvoker:  # noqa: WPS214, WPS230
 
         Returns:
             File contents.
+        """
+        async with self._dumped(file_id) as path:
+            return path.read_text()
+
+    async def dump_to(self, file_id: str, output: IO[bytes]) -> None:
+        """Dump a plugin file by id to a binary file-like object.
+
+        The file is copied in fixed-size chunks, so dumping e.g. a large catalog
+        does not read it into memory as a whole.
+
+        Args:
+            file_id: Dump this file identifier.
+            output: The binary file-like object to write the file contents to.
+        """
+        async with self._dumped(file_id) as path:
+            with path.open("rb") as dumped_file:
+                shutil.copyfileobj(dumped_file, output, DUMP_CHUNK_SIZE)
+
+    @asynccontextmanager
+    async def _dumped(self, file_id: str) -> AsyncIterator[Path]:
+        """Get the path of a plugin file by id, invoking the plugin hooks if needed.
+
+        Args:
+            file_id: Dump this file identifier.
+
+        Yields:
+            The path of the file.
 
         Raises:
             __cause__: If file is not found.
@@ -501,9 +569,9 @@ class PluginInvoker:  # noqa: WPS214, WPS230
         try:  # noqa: WPS229. Allow try body of length > 1.
             if file_id != "config":
                 async with self._invoke():
-                    return self.files[file_id].read_text()
-
-            return self.files[file_id].read_text()
+                    yield self.files[file_id]
+            else:
+                yield self.files[file_id]
         except ExecutableNotFoundError as err:  # noqa: WPS329. Allow "useless" except.
             # Unwrap FileNotFoundError
             raise err.__cause__  # noqa: WPS609. Allow accessing magic attribute.
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from hashlib import sha256
 from pathlib import Path
 
@@ -31,6 +32,82 @@ class LockfileAlreadyExistsError(Exception):
         super().__init__(message)
 
 
+class PluginLockIndex:
+    """Index of the parsed plugin lock files, shared by all projects of the process.
+
+    Lock files are parsed on first use, and the parsed plugin is reused for as
+    long as the modification time and size of the lock file are unchanged, so
+    resolving the parents of many plugins does not read and parse the same lock
+    files again and again.
+    """
+
+    def __init__(self):
+        """Create a new, empty plugin lock index."""
+        self._lock = threading.Lock()
+        self._entries: dict[Path, tuple[tuple[int, int], StandalonePlugin]] = {}
+
+    def find(
+        self,
+        project: Project,
+        plugin_type: str,
+        plugin_name: str,
+        variant_name: str | None = None,
+    ) -> StandalonePlugin:
+        """Find the locked definition of a plugin in a project.
+
+        Args:
+            project: The project.
+            plugin_type: The plugin type.
+            plugin_name: The plugin name.
+            variant_name: The plugin variant name.
+
+        Returns:
+            The locked plugin definition.
+        """
+        return self.load(
+            project.plugin_lock_path(
+                plugin_type, plugin_name, variant_name, make_dirs=False
+            )
+        )
+
+    def load(self, path: Path) -> StandalonePlugin:
+        """Load a plugin lock file, parsing it only if it changed since last loaded.
+
+        Args:
+            path: The path to the lock file.
+
+        Returns:
+            The locked plugin definition.
+        """
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry and entry[0] == signature:
+            return entry[1]
+
+        plugin = StandalonePlugin.parse_json_file(path)
+        with self._lock:
+            self._entries[path] = (signature, plugin)
+        return plugin
+
+    def discard(self, path: Path) -> None:
+        """Drop a parsed lock file, e.g. after it was written.
+
+        Args:
+            path: The path to the lock file.
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        """Drop all parsed lock files."""
+        with self._lock:
+            self._entries.clear()
+
+
+plugin_lock_index = PluginLockIndex()
+
+
 class PluginLock:
     """Plugin lockfile."""
 
@@ -57,6 +134,8 @@ class PluginLock:
 
         with self.path.open("w") as lockfile:
             json.dump(locked_def.canonical(), lockfile, indent=2)
+        # Rewrites within the resolution of the modification time go unnoticed
+        plugin_lock_index.discard(self.path)
 
     def load(self) -> StandalonePlugin:
         """Load the plugin lockfile.
@@ -64,10 +143,7 @@ class PluginLock:
         Returns:
             The loaded plugin.
         """
-        with self.path.open() as lockfile:
-            locked_def = json.load(lockfile)
-
-        return StandalonePlugin(**locked_def)
+        return plugin_lock_index.load(self.path)
 
     @property
     def sha256_checksum(self) -> str:
@@ -7,6 +7,7 @@ import json
 import logging
 from abc import ABC, abstractmethod
 
+from meltano.core.logging.output_tail import OutputTail
 from meltano.core.plugin.base import PluginType
 from meltano.core.plugin.error import PluginNotSupportedError
 from meltano.core.plugin_invoker import PluginInvoker
@@ -76,13 +77,14 @@ class ExtractorTestService(PluginTestService):
         except Exception as exc:
             return False, str(exc)
 
-        last_line = None
+        # Only the end of the output is reported, however much the extractor logs
+        output = OutputTail()
         while not process.stdout.at_eof():
             data = await process.stdout.readline()
             line = data.decode("ascii").strip()
             if line:
                 logger.debug(line)
-                last_line = line
+                output.writeline(f"{line}\n")
 
             try:
                 message_type = json.loads(line)["type"]
@@ -97,7 +99,8 @@ class ExtractorTestService(PluginTestService):
 
         # considered valid if subprocess is terminated (exit status < 0) on RECORD message received
         # see https://docs.python.org/3/library/subprocess.html#subprocess.CompletedProcess.returncode
-        return (
-            returncode < 0,
-            last_line if returncode else "No RECORD message received",
-        )
+        if returncode < 0:
+            return True, output.last_line.rstrip()
+        if returncode:
+            return False, output.getvalue().rstrip()
+        return False, "No RECORD message received"
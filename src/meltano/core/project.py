@@ -9,7 +9,8 @@ import sys
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 import fasteners
 from cached_property import cached_property
@@ -96,6 +97,8 @@ class Project(Versioned):  # noqa: WPS214
         ).resolve()
         self.readonly = False
         self.active_environment: Environment | None = None
+        # The stat signature of the .env file, and the values parsed from it
+        self._dotenv_cache: tuple[tuple | None, Mapping[str, str | None]] | None = None
 
     @cached_property
     def _meltano_interprocess_lock(self):
@@ -350,13 +353,27 @@ class Project(Versioned):  # noqa: WPS214
         return self.root.joinpath(".env")
 
     @property
-    def dotenv_env(self):
+    def dotenv_env(self) -> Mapping[str, str | None]:
         """Get values from this project's .env file.
 
+        The file is only parsed again once its modification time, size or inode
+        changed, or once it was updated through `dotenv_update`.
+
         Returns:
-            values found in this project's .env file
+            read-only mapping of the values found in this project's .env file
         """
-        return dotenv_values(self.dotenv)
+        try:
+            stat = self.dotenv.stat()
+        except FileNotFoundError:
+            signature = None
+        else:
+            signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        cache = self._dotenv_cache
+        if cache is None or cache[0] != signature:
+            cache = (signature, MappingProxyType(dotenv_values(self.dotenv)))
+            self._dotenv_cache = cache
+        return cache[1]
 
     def activate_environment(self, name: str) -> None:
         """Retrieve an environment configuration.
@@ -386,7 +403,12 @@ class Project(Versioned):  # noqa: WPS214
         if self.readonly:
             raise ProjectReadonly
 
-        yield self.dotenv
+        try:
+            yield self.dotenv
+        finally:
+            # An update within the resolution of the modification time and
+            # keeping the size would not change the stat signature
+            self._dotenv_cache = None
 
     @makedirs
     def meltano_dir(self, *joinpaths, make_dirs: bool = True):
@@ -36,6 +36,9 @@ MULTI_FILE_KEYS = {
 def deep_merge(parent: TMapping, children: list[TMapping]) -> TMapping:
     """Deep merge a list of child dicts with a given parent.
 
+    The mappings of the parent are copied once, when they are first merged into,
+    so the parent mappings are left untouched. Sequences are extended in place.
+
     Args:
         parent: The parent dict.
         children: The child dicts.
@@ -44,17 +47,28 @@ def deep_merge(parent: TMapping, children: list[TMapping]) -> TMapping:
         The merged dict.
     """
     base = copy.copy(parent)
+    # IDs of the mappings of the result that are not shared with the parent
+    owned = {id(base)}
     for child in children:
-        for key, value in child.items():
-            if isinstance(value, Mapping):
-                # get node or create one
-                node = base.setdefault(key, value.__class__())
-                base[key] = deep_merge(node, [value])
-            elif isinstance(value, Sequence):
-                node = base.setdefault(key, value.__class__())
-                node.extend(value)
-            else:
-                base[key] = value
+        stack = [(base, child)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, Mapping):
+                    # get node or create one
+                    if key in target:
+                        node = target[key]
+                        if id(node) not in owned:
+                            node = target[key] = copy.copy(node)
+                    else:
+                        node = target[key] = value.__class__()
+                    owned.add(id(node))
+                    stack.append((node, value))
+                elif isinstance(value, Sequence):
+                    node = target.setdefault(key, value.__class__())
+                    node.extend(value)
+                else:
+                    target[key] = value
     return base
 
 
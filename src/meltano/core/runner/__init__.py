@@ -1,12 +1,50 @@
 from __future__ import annotations
 
+import logging
+
+from meltano.core.utils import human_size
+
 
 class RunnerError(Exception):
-    def __init__(self, message, exitcodes=None):
+    def __init__(self, message, exitcodes=None, stderr=None):
         super().__init__(message)
         self.exitcodes = {} if exitcodes is None else exitcodes
+        self.stderr = {} if stderr is None else stderr
 
 
 class Runner:
     def run(self):
         pass
+
+
+def log_line_length_limit_error(
+    line_length_limit: int, stream_buffer_size: int, max_line_size: int | None = None
+) -> None:
+    """Log why an extractor message could not be read, and how to fix it.
+
+    Args:
+        line_length_limit: the line length limit of the stream reader.
+        stream_buffer_size: the value of the `elt.buffer_size` setting.
+        max_line_size: the value of the `elt.max_line_size` setting.
+    """
+    if max_line_size is not None:
+        logging.error(
+            f"The extractor generated a message exceeding the maximum message size of {human_size(max(line_length_limit, max_line_size))}."
+        )
+        logging.error(
+            "To let this message be processed, increase the 'elt.max_line_size' setting to at least the size of the largest expected message, and try again."
+        )
+        logging.error(
+            "To learn more, visit https://docs.meltano.com/reference/settings#eltmax_line_size"
+        )
+        return
+
+    logging.error(
+        f"The extractor generated a message exceeding the message size limit of {human_size(line_length_limit)} (half the buffer size of {human_size(stream_buffer_size)})."
+    )
+    logging.error(
+        "To let this message be processed, increase the 'elt.buffer_size' setting to at least double the size of the largest expected message, and try again."
+    )
+    logging.error(
+        "To learn more, visit https://docs.meltano.com/reference/settings#eltbuffer_size"
+    )
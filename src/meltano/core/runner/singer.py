@@ -11,9 +11,8 @@ from meltano.core.logging import capture_subprocess_output
 from meltano.core.plugin import PluginType
 from meltano.core.plugin_invoker import PluginInvoker
 from meltano.core.project_settings_service import ProjectSettingsService
-from meltano.core.utils import human_size
 
-from . import Runner, RunnerError
+from . import Runner, RunnerError, log_line_length_limit_error
 
 
 class SingerRunner(Runner):
@@ -54,6 +53,8 @@ class SingerRunner(Runner):
         # - https://github.com/python/cpython/blob/v3.8.7/Lib/asyncio/streams.py#L482
         stream_buffer_size = self.project_settings_service.get("elt.buffer_size")
         line_length_limit = stream_buffer_size // 2
+        # Longer lines are read in chunks, without growing the buffer
+        max_line_size = self.project_settings_service.get("elt.max_line_size")
 
         # Start tap
         try:
@@ -83,7 +84,9 @@ class SingerRunner(Runner):
 
         tap_stdout_future = asyncio.ensure_future(
             # forward subproc stdout to tap_outputs (i.e. targets stdin)
-            capture_subprocess_output(p_tap.stdout, *tap_outputs)
+            capture_subprocess_output(
+                p_tap.stdout, *tap_outputs, max_line_size=max_line_size
+            )
         )
         tap_stderr_future = asyncio.ensure_future(
             capture_subprocess_output(p_tap.stderr, extractor_log)
@@ -98,7 +101,9 @@ class SingerRunner(Runner):
             target_outputs.insert(0, loader_out)
 
         target_stdout_future = asyncio.ensure_future(
-            capture_subprocess_output(p_target.stdout, *target_outputs)
+            capture_subprocess_output(
+                p_target.stdout, *target_outputs, max_line_size=max_line_size
+            )
         )
         target_stderr_future = asyncio.ensure_future(
             capture_subprocess_output(p_target.stderr, loader_log)
@@ -142,6 +147,7 @@ class SingerRunner(Runner):
                         tap_stdout_future.exception(),
                         line_length_limit=line_length_limit,
                         stream_buffer_size=stream_buffer_size,
+                        max_line_size=max_line_size,
                     )
 
                 failed_future = output_futures_failed.pop()
@@ -231,6 +237,7 @@ class SingerRunner(Runner):
         exception,
         line_length_limit,
         stream_buffer_size,
+        max_line_size=None,
     ):
         # StreamReader.readline can raise a ValueError wrapping a LimitOverrunError:
         # https://github.com/python/cpython/blob/v3.8.7/Lib/asyncio/streams.py#L549
@@ -241,13 +248,7 @@ class SingerRunner(Runner):
         if not isinstance(exception, asyncio.LimitOverrunError):
             return
 
-        logging.error(
-            f"The extractor generated a message exceeding the message size limit of {human_size(line_length_limit)} (half the buffer size of {human_size(stream_buffer_size)})."
-        )
-        logging.error(
-            "To let this message be processed, increase the 'elt.buffer_size' setting to at least double the size of the largest expected message, and try again."
-        )
-        logging.error(
-            "To learn more, visit https://docs.meltano.com/reference/settings#eltbuffer_size"
+        log_line_length_limit_error(
+            line_length_limit, stream_buffer_size, max_line_size
         )
         raise RunnerError("Output line length limit exceeded") from exception
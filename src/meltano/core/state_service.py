@@ -8,13 +8,22 @@ from __future__ import annotations
 
 import datetime
 import json
-from typing import Any
+import tempfile
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 
 import structlog
 
 from meltano.core.job import Job, Payload, State
-from meltano.core.job_state import SINGER_STATE_KEY
-from meltano.core.state_store import DBStateStoreManager
+from meltano.core.job_state import SINGER_STATE_KEY, JobState
+from meltano.core.state_store import (
+    STATE_BATCH_SIZE,
+    DBStateStoreManager,
+    StateStoreManager,
+    state_store_manager_from_project_settings,
+)
+
+if TYPE_CHECKING:
+    from meltano.core.project import Project
 
 STATE_ID_COMPONENT_DELIMITER = ":"
 
@@ -31,13 +40,17 @@ class StateService:
     Currently only manages Singer state for Extract and Load jobs.
     """
 
-    def __init__(self, session: object = None):
+    def __init__(self, session: object = None, project: Project | None = None):
         """Create a StateService object.
 
         Args:
             session: the session to use for interacting with the db
+            project: the Meltano project, whose `state_backend.*` settings select
+                where state is stored
         """
         self.session = session
+        self.project = project
+        self._state_store_manager: StateStoreManager | None = None
 
     def list_state(self, state_id_pattern: str | None = None):
         """List all state found in the db.
@@ -48,10 +61,97 @@ class StateService:
         Returns:
             A dict with state_ids as keys and state payloads as values.
         """
-        return {
-            state_id: self.get_state(state_id)
-            for state_id in self.state_store_manager.get_state_ids(state_id_pattern)
-        }
+        return dict(self.state_store_manager.get_many(state_id_pattern))
+
+    def export_state(
+        self, state_id_pattern: str | None = None
+    ) -> Iterator[tuple[str, dict]]:
+        """Stream the state of all matching state_ids.
+
+        Args:
+            state_id_pattern: An optional glob-style pattern of state_ids to export
+
+        Returns:
+            An iterator of tuples of state_id and state.
+        """
+        return self.state_store_manager.get_many(state_id_pattern)
+
+    def import_state(
+        self,
+        states: Iterable[tuple[str, dict[str, Any]]],
+        batch_size: int = STATE_BATCH_SIZE,
+        validate: bool = True,
+    ) -> int:
+        """Set the state of many state_ids in batches.
+
+        Unlike `set_state`, no job is recorded in the run history for each state.
+
+        All states are read, and validated, before the first batch is written,
+        so that an invalid state or an error while reading them leaves the
+        stored state untouched. They are spooled to a temporary file meanwhile,
+        to not hold them all in memory.
+
+        Args:
+            states: tuples of state_id and state, e.g. as produced by `export_state`
+            batch_size: the number of states to write per transaction
+            validate: whether to validate each state
+
+        Returns:
+            The number of states that were imported.
+        """
+        if validate:
+            states = self._validated(states)
+
+        with tempfile.TemporaryFile("w+") as spool:
+            for state_id, state in states:
+                spool.write(json.dumps([state_id, state]))
+                spool.write("\n")
+            spool.seek(0)
+            return self.state_store_manager.set_many(
+                (tuple(json.loads(line)) for line in spool), batch_size=batch_size
+            )
+
+    def compact_state(self, batch_size: int = STATE_BATCH_SIZE) -> int:
+        """Rebuild the current state of all state_ids from the job run history.
+
+        The job run history is read in a single pass, `batch_size` state_ids at
+        a time, and the state of each batch is written in one transaction.
+        State IDs without state in the job run history are left untouched.
+
+        Args:
+            batch_size: the number of state_ids to read and write per batch
+
+        Returns:
+            The number of state_ids whose state was rebuilt.
+        """
+        states = JobState.all_from_job_history(self.session, batch_size)
+        return self.state_store_manager.set_many(
+            self._with_progress(states, batch_size), batch_size=batch_size
+        )
+
+    @staticmethod
+    def _with_progress(
+        states: Iterable[tuple[str, dict[str, Any]]], every: int
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        count = 0
+        for state in states:
+            yield state
+            count += 1
+            if count % every == 0:
+                logger.info("Compacting state", state_ids=count)
+        logger.info("Compacted state", state_ids=count)
+
+    def _validated(
+        self, states: Iterable[tuple[str, dict[str, Any]]]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        for state_id, state in states:
+            try:
+                self.validate_state(state)
+            except InvalidJobStateError as err:
+                raise InvalidJobStateError(
+                    f"Invalid state for '{state_id}': {err}"
+                ) from err
+            yield state_id, state
 
     def _get_or_create_job(self, job: Job | str) -> Job:
         """If Job is passed, return it. If state_id is passed, create new and return.
@@ -75,15 +175,29 @@ class StateService:
         raise TypeError("job must be of type Job or of type str")
 
     @property
-    def state_store_manager(self):
-        """Initialize and return the correct StateStoreManager for the given SettingsService.
+    def state_store_manager(self) -> StateStoreManager:
+        """Initialize and return the correct StateStoreManager for the project settings.
 
-        Defaults to DBStateStoreManager.
+        Defaults to DBStateStoreManager when no project is given.
 
         Returns:
             StateStoreManager instance.
         """
-        return DBStateStoreManager(session=self.session)
+        if self._state_store_manager is None:
+            if self.project is None:
+                self._state_store_manager = DBStateStoreManager(session=self.session)
+            else:
+                # Imported here to avoid a circular import through `meltano.core.plugin`
+                from meltano.core.project_settings_service import (
+                    ProjectSettingsService,
+                )
+
+                self._state_store_manager = state_store_manager_from_project_settings(
+                    self.project,
+                    ProjectSettingsService(self.project),
+                    session=self.session,
+                )
+        return self._state_store_manager
 
     @staticmethod
     def validate_state(state: dict[str, Any]):
@@ -125,11 +239,16 @@ class StateService:
         logger.debug(
             f"Added to state {state_to_add_to.job_name} state payload {new_state_dict}"
         )
-        self.state_store_manager.set(
-            state_id=state_to_add_to.job_name,
-            state=json.dumps(new_state_dict),
-            complete=(payload_flags == Payload.STATE),
-        )
+        state_id = state_to_add_to.job_name
+        self.state_store_manager.acquire_lock(state_id)
+        try:
+            self.state_store_manager.set(
+                state_id=state_id,
+                state=json.dumps(new_state_dict),
+                complete=(payload_flags == Payload.STATE),
+            )
+        finally:
+            self.state_store_manager.release_lock(state_id)
 
     def get_state(self, state_id: str):
         """Get state for the given state_id.
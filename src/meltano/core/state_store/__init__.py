@@ -0,0 +1,87 @@
+"""Storage managers for job state."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+from .base import (
+    STATE_BATCH_SIZE,
+    StateIDLockedError,
+    StateStoreManager,
+    UnsupportedStateBackendError,
+)
+from .db import DBStateStoreManager
+from .filesystem import (
+    BaseFilesystemStateStoreManager,
+    LocalFilesystemStateStoreManager,
+)
+from .s3 import MissingBoto3Error, S3StateStoreManager
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from meltano.core.project import Project
+    from meltano.core.settings_service import SettingsService
+
+SYSTEMDB = "systemdb"
+
+
+def state_store_manager_from_project_settings(
+    project: Project,
+    settings: SettingsService,
+    session: Session | None = None,
+) -> StateStoreManager:
+    """Create the StateStoreManager configured by the `state_backend.*` settings.
+
+    Args:
+        project: the Meltano project
+        settings: the project settings service
+        session: the db session, used by the `systemdb` backend
+
+    Raises:
+        UnsupportedStateBackendError: if the URI scheme is not supported
+
+    Returns:
+        StateStoreManager instance.
+    """
+    uri = settings.get("state_backend.uri") or SYSTEMDB
+    if uri == SYSTEMDB:
+        return DBStateStoreManager(session=session)
+
+    lock_settings = {
+        "lock_timeout_seconds": settings.get("state_backend.lock.timeout_seconds"),
+        "lock_retry_seconds": settings.get("state_backend.lock.retry_seconds"),
+    }
+    scheme = urlparse(uri).scheme
+    if scheme == "file":
+        return LocalFilesystemStateStoreManager(uri, **lock_settings)
+    if scheme == "s3":
+        return S3StateStoreManager(
+            uri,
+            aws_access_key_id=settings.get("state_backend.s3.aws_access_key_id"),
+            aws_secret_access_key=settings.get(
+                "state_backend.s3.aws_secret_access_key"
+            ),
+            endpoint_url=settings.get("state_backend.s3.endpoint_url"),
+            cache_dir=project.meltano_dir("state", "cache"),
+            **lock_settings,
+        )
+
+    raise UnsupportedStateBackendError(
+        f"Unsupported state backend '{uri}': expected '{SYSTEMDB}', "
+        + "a 'file://' URI or an 's3://' URI"
+    )
+
+
+__all__ = [
+    "STATE_BATCH_SIZE",
+    "BaseFilesystemStateStoreManager",
+    "DBStateStoreManager",
+    "LocalFilesystemStateStoreManager",
+    "MissingBoto3Error",
+    "S3StateStoreManager",
+    "StateIDLockedError",
+    "StateStoreManager",
+    "UnsupportedStateBackendError",
+    "state_store_manager_from_project_settings",
+]
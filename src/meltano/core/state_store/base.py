@@ -0,0 +1,127 @@
+"""Base class for storage managers for job state."""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
+
+# Number of states read or written per batch by bulk operations
+STATE_BATCH_SIZE = 500
+
+
+class StateIDLockedError(Exception):
+    """Occurs when a lock for a state ID can not be acquired in time."""
+
+
+class UnsupportedStateBackendError(Exception):
+    """Occurs when the `state_backend.uri` setting uses an unsupported scheme."""
+
+
+class StateStoreManager(ABC):
+    """Base state store manager."""
+
+    def __init__(self, **kwargs):
+        """Initialize state store manager.
+
+        Args:
+            kwargs: additional keyword arguments
+        """
+        ...
+
+    @abstractmethod
+    def set(self, state_id: str, state: str, complete: bool):
+        """Set the job state for the given state_id.
+
+        Args:
+            state_id: the name of the job to set state for.
+            state: the state to set.
+            complete: true if the state being set is for a complete run, false if partial
+
+        Raises:
+            NotImplementedError: always, this is an abstract method
+        """
+        ...
+
+    @abstractmethod
+    def get(self, state_id):
+        """Get the job state for the given state_id.
+
+        Args:
+            state_id: the name of the job to get state for.
+
+        Raises:
+            NotImplementedError: always, this is an abstract method
+        """
+        ...
+
+    @abstractmethod
+    def clear(self, state_id):
+        """Clear state for the given state_id.
+
+        Args:
+            state_id: the state_id to clear state for
+        """
+        ...
+
+    @abstractmethod
+    def get_state_ids(self, pattern=None):
+        """Get all state_ids available in this state store manager.
+
+        Args:
+            pattern: glob-style pattern to filter by
+        """
+        ...
+
+    def get_many(self, pattern: str | None = None) -> Iterator[tuple[str, dict]]:
+        """Get the state for every state_id matching the given pattern.
+
+        Implementations that can read many states at once should override this.
+
+        Args:
+            pattern: glob-style pattern to filter by
+
+        Yields:
+            Tuples of state_id and the current state for it
+        """
+        for state_id in self.get_state_ids(pattern):
+            yield state_id, self.get(state_id)
+
+    def set_many(
+        self,
+        states: Iterable[tuple[str, dict[str, Any]]],
+        batch_size: int = STATE_BATCH_SIZE,
+    ) -> int:
+        """Set the complete state for many state_ids.
+
+        Implementations that can write many states at once should override this.
+
+        Args:
+            states: tuples of state_id and the state to set for it
+            batch_size: the number of states to write per batch
+
+        Returns:
+            The number of states that were set
+        """
+        count = 0
+        for state_id, state in states:
+            self.set(state_id, json.dumps(state), complete=True)
+            count += 1
+        return count
+
+    @abstractmethod
+    def acquire_lock(self, state_id):
+        """Acquire a naive lock for the given job's state.
+
+        Args:
+            state_id: the state_id to lock
+        """
+        ...
+
+    @abstractmethod
+    def release_lock(self, state_id):
+        """Release lock for given job's state.
+
+        Args:
+            state_id: the state_id to unlock
+        """
+        ...
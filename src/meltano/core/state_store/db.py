@@ -1,8 +1,9 @@
-"""Storage managers for job state."""
+"""State store manager for state stored in the system database."""
 from __future__ import annotations
 
 import json
-from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Iterable, Iterator
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -10,79 +11,7 @@ from sqlalchemy.orm import Session
 from meltano.core.job_state import JobState
 from meltano.core.utils import merge
 
-
-class StateStoreManager(ABC):
-    """Base state store manager."""
-
-    def __init__(self, **kwargs):
-        """Initialize state store manager.
-
-        Args:
-            kwargs: additional keyword arguments
-        """
-        ...
-
-    @abstractmethod
-    def set(self, state_id: str, state: str, complete: bool):
-        """Set the job state for the given state_id.
-
-        Args:
-            state_id: the name of the job to set state for.
-            state: the state to set.
-            complete: true if the state being set is for a complete run, false if partial
-
-        Raises:
-            NotImplementedError: always, this is an abstract method
-        """
-        ...
-
-    @abstractmethod
-    def get(self, state_id):
-        """Get the job state for the given state_id.
-
-        Args:
-            state_id: the name of the job to get state for.
-
-        Raises:
-            NotImplementedError: always, this is an abstract method
-        """
-        ...
-
-    @abstractmethod
-    def clear(self, state_id):
-        """Clear state for the given state_id.
-
-        Args:
-            state_id: the state_id to clear state for
-        """
-        ...
-
-    @abstractmethod
-    def get_state_ids(self, pattern=None):
-        """Get all state_ids available in this state store manager.
-
-        Args:
-            pattern: glob-style pattern to filter by
-        """
-        ...
-
-    @abstractmethod
-    def acquire_lock(self, state_id):
-        """Acquire a naive lock for the given job's state.
-
-        Args:
-            state_id: the state_id to lock
-        """
-        ...
-
-    @abstractmethod
-    def release_lock(self, state_id):
-        """Release lock for given job's state.
-
-        Args:
-            state_id: the state_id to unlock
-        """
-        ...
+from .base import STATE_BATCH_SIZE, StateStoreManager
 
 
 class DBStateStoreManager(StateStoreManager):
@@ -114,7 +43,10 @@ class DBStateStoreManager(StateStoreManager):
         completed_state = json.loads(state) if complete else {}
         if existing_job_state:
             if existing_job_state.partial_state and not complete:
-                partial_state = merge(partial_state, existing_job_state.partial_state)
+                # The existing row is replaced, so its state can be merged into
+                partial_state = merge(
+                    partial_state, existing_job_state.partial_state, adopt=True
+                )
             if not complete:
                 completed_state = existing_job_state.completed_state
         new_job_state = JobState(
@@ -139,11 +71,11 @@ class DBStateStoreManager(StateStoreManager):
         job_state: JobState | None = (
             self.session.query(JobState).filter(JobState.state_id == state_id).first()
         )
-        return (
-            merge(job_state.partial_state, job_state.completed_state)
-            if job_state
-            else {}
-        )
+        if not job_state:
+            return {}
+        # Merge into a copy, so that the loaded row is not modified
+        state = merge(job_state.completed_state, {})
+        return merge(job_state.partial_state, state)
 
     def clear(self, state_id):
         """Clear state for the given state_id.
@@ -179,6 +111,62 @@ class DBStateStoreManager(StateStoreManager):
             for record in self.session.execute(select(JobState.state_id)).all()
         )
 
+    def get_many(self, pattern: str | None = None) -> Iterator[tuple[str, dict]]:
+        """Get the state for every state_id matching the given pattern in one query.
+
+        Args:
+            pattern: glob-style pattern to filter by
+
+        Yields:
+            Tuples of state_id and the current state for it
+        """
+        # Query the columns rather than the model, so that no `JobState` instances
+        # are tracked by the session while the results are streamed.
+        query = self.session.query(
+            JobState.state_id, JobState.partial_state, JobState.completed_state
+        )
+        if pattern:
+            query = query.filter(JobState.state_id.like(pattern.replace("*", "%")))
+
+        for state_id, partial_state, completed_state in query.yield_per(
+            STATE_BATCH_SIZE
+        ):
+            yield state_id, merge(
+                partial_state or {}, completed_state or {}, adopt=True
+            )
+
+    def set_many(
+        self,
+        states: Iterable[tuple[str, dict[str, Any]]],
+        batch_size: int = STATE_BATCH_SIZE,
+    ) -> int:
+        """Set the complete state for many state_ids, committing once per batch.
+
+        Args:
+            states: tuples of state_id and the state to set for it
+            batch_size: the number of states to write per transaction
+
+        Returns:
+            The number of states that were set
+        """
+        count = 0
+        states = iter(states)
+        while True:
+            # The last state for a state_id within a batch wins
+            batch = dict(islice(states, batch_size))
+            if not batch:
+                return count
+
+            self.session.query(JobState).filter(
+                JobState.state_id.in_(batch.keys())
+            ).delete(synchronize_session=False)
+            self.session.add_all(
+                JobState(state_id=state_id, partial_state={}, completed_state=state)
+                for state_id, state in batch.items()
+            )
+            self.session.commit()
+            count += len(batch)
+
     def acquire_lock(self, state_id):
         """Acquire a naive lock for the given job's state.
 
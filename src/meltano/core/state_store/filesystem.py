@@ -0,0 +1,340 @@
+"""State store managers for state stored as one JSON file per state ID."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from abc import abstractmethod
+from contextlib import contextmanager, suppress
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterator
+from urllib.parse import quote, unquote, urlparse
+
+import structlog
+from atomicwrites import atomic_write
+
+from meltano.core.utils import merge
+
+from .base import StateIDLockedError, StateStoreManager
+
+logger = structlog.getLogger(__name__)
+
+STATE_FILENAME = "state.json"
+LOCK_FILENAME = "lock"
+
+
+class BaseFilesystemStateStoreManager(StateStoreManager):
+    """Base class for state stored as one JSON file per state ID.
+
+    Each state ID gets its own directory, named after the URL-quoted state ID,
+    holding a `state.json` file with the `completed` and `partial` state and,
+    while the state ID is locked, a `lock` file.
+
+    Subclasses implement the storage primitives.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        lock_timeout_seconds: int = 10,
+        lock_retry_seconds: int = 1,
+        **kwargs,
+    ):
+        """Initialize the state store manager.
+
+        Args:
+            uri: the URI of the state backend
+            lock_timeout_seconds: seconds after which a lock is considered stale,
+                and after which acquiring a lock is given up
+            lock_retry_seconds: seconds to wait between attempts to acquire a lock
+            kwargs: additional keyword args to supply to StateStoreManager
+        """
+        super().__init__(**kwargs)
+        self.uri = uri
+        self.parsed_uri = urlparse(uri)
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.lock_retry_seconds = lock_retry_seconds
+        # Tags of the locks held by this manager, by state ID
+        self._lock_tags: dict[str, str] = {}
+
+    @abstractmethod
+    def _read(self, key: str) -> bytes | None:
+        """Read the content of a file, or None if it does not exist."""
+
+    @abstractmethod
+    def _write(self, key: str, content: bytes) -> None:
+        """Atomically create or replace a file."""
+
+    @abstractmethod
+    def _create_lock(self, key: str, content: bytes) -> str | None:
+        """Create a lock if there is none, returning its tag, or None if there is one."""
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Delete a file if it exists."""
+
+    @abstractmethod
+    def _lock_info(self, key: str) -> tuple[float, str] | None:
+        """Get the modification time and a tag identifying a lock, or None if there is none."""
+
+    @abstractmethod
+    def _replace_lock(self, key: str, tag: str, content: bytes) -> str | None:
+        """Atomically replace a lock if it is still the one with `tag`, returning the new tag, or None if it was not replaced."""
+
+    @abstractmethod
+    def _delete_lock(self, key: str, tag: str) -> bool:
+        """Atomically delete a lock if it is still the one with `tag`, returning whether it was deleted."""
+
+    @abstractmethod
+    def _list_dirs(self) -> Iterator[str]:
+        """List the names of the top-level directories."""
+
+    @staticmethod
+    def _key(state_id: str, filename: str) -> str:
+        return f"{quote(state_id, safe='')}/{filename}"
+
+    def _read_state(self, state_id: str) -> dict:
+        content = self._read(self._key(state_id, STATE_FILENAME))
+        if content is None:
+            return {}
+        return json.loads(content)
+
+    def set(self, state_id: str, state: str, complete: bool):
+        """Set the job state for the given state_id.
+
+        Args:
+            state_id: the name of the job to set state for.
+            state: the state to set.
+            complete: true if the state being set is for a complete run, false if partial
+        """
+        existing = self._read_state(state_id)
+        if complete:
+            new_state = {"completed": json.loads(state), "partial": {}}
+        else:
+            new_state = {
+                "completed": existing.get("completed", {}),
+                "partial": merge(
+                    json.loads(state), existing.get("partial", {}), adopt=True
+                ),
+            }
+        self._write(self._key(state_id, STATE_FILENAME), json.dumps(new_state).encode())
+
+    def get(self, state_id):
+        """Get the job state for the given state_id.
+
+        Args:
+            state_id: the name of the job to get state for
+
+        Returns:
+            The current state for the given job
+        """
+        existing = self._read_state(state_id)
+        return merge(
+            existing.get("partial", {}), existing.get("completed", {}), adopt=True
+        )
+
+    def clear(self, state_id):
+        """Clear state for the given state_id.
+
+        Args:
+            state_id: the state_id to clear state for
+        """
+        self._delete(self._key(state_id, STATE_FILENAME))
+
+    def get_state_ids(self, pattern: str | None = None):
+        """Get all state_ids available in this state store manager.
+
+        Args:
+            pattern: glob-style pattern to filter by
+
+        Returns:
+            Generator yielding names of available jobs
+        """
+        state_ids = (unquote(name) for name in self._list_dirs())
+        if pattern:
+            return (
+                state_id for state_id in state_ids if fnmatchcase(state_id, pattern)
+            )
+        return state_ids
+
+    def get_many(self, pattern: str | None = None) -> Iterator[tuple[str, dict]]:
+        """Get the state for every state_id matching the given pattern.
+
+        Args:
+            pattern: glob-style pattern to filter by
+
+        Yields:
+            Tuples of state_id and the current state for it
+        """
+        for state_id in self.get_state_ids(pattern):
+            existing = self._read_state(state_id)
+            # Directories only holding a lock have no state yet
+            if existing:
+                yield state_id, merge(
+                    existing.get("partial", {}),
+                    existing.get("completed", {}),
+                    adopt=True,
+                )
+
+    def acquire_lock(self, state_id):
+        """Acquire a lock for the given job's state.
+
+        Locks older than `lock_timeout_seconds` are considered stale, and are
+        taken over by replacing them atomically. When several waiters find the
+        same stale lock, only one of them can replace it.
+
+        Args:
+            state_id: the state_id to lock
+
+        Raises:
+            StateIDLockedError: if the lock could not be acquired in time
+        """
+        key = self._key(state_id, LOCK_FILENAME)
+        deadline = time.monotonic() + self.lock_timeout_seconds
+        while True:
+            # Every lock is unique, to tell it apart from the one it replaced
+            content = f"{time.time()} {uuid.uuid4().hex}".encode()
+            tag = self._create_lock(key, content)
+            if tag is not None:
+                self._lock_tags[state_id] = tag
+                return
+            if time.monotonic() >= deadline:
+                raise StateIDLockedError(
+                    f"Could not acquire lock for state ID '{state_id}' "
+                    + f"within {self.lock_timeout_seconds} seconds"
+                )
+            lock_info = self._lock_info(key)
+            if lock_info is not None:
+                modified_at, stale_tag = lock_info
+                if time.time() - modified_at > self.lock_timeout_seconds:
+                    tag = self._replace_lock(key, stale_tag, content)
+                    if tag is not None:
+                        self._lock_tags[state_id] = tag
+                        return
+                    continue
+            time.sleep(self.lock_retry_seconds)
+
+    def release_lock(self, state_id):
+        """Release the lock for the given job's state.
+
+        The lock is only deleted if it is still the one acquired by this
+        manager, so that a lock taken over after it went stale is kept.
+
+        Args:
+            state_id: the state_id to unlock
+        """
+        tag = self._lock_tags.pop(state_id, None)
+        if tag is None or not self._delete_lock(
+            self._key(state_id, LOCK_FILENAME), tag
+        ):
+            logger.warning(
+                "Lock on state ID was taken over before it was released",
+                state_id=state_id,
+                lock_timeout_seconds=self.lock_timeout_seconds,
+            )
+
+
+class LocalFilesystemStateStoreManager(BaseFilesystemStateStoreManager):
+    """State store manager for state stored in a local directory.
+
+    Selected with a `file://` URI, e.g. `file:///var/lib/meltano/state`.
+    """
+
+    def __init__(self, uri: str, **kwargs):
+        """Initialize the state store manager.
+
+        Args:
+            uri: the `file://` URI of the state directory
+            kwargs: additional keyword args to supply to BaseFilesystemStateStoreManager
+        """
+        super().__init__(uri, **kwargs)
+        self.state_dir = Path(unquote(self.parsed_uri.netloc + self.parsed_uri.path))
+
+    def _path(self, key: str) -> Path:
+        return self.state_dir.joinpath(*key.split("/"))
+
+    def _read(self, key: str) -> bytes | None:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, content: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, mode="wb", overwrite=True) as state_file:
+            state_file.write(content)
+
+    def _create_lock(self, key: str, content: bytes) -> str | None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return None
+        with os.fdopen(fd, "wb") as lock_file:
+            lock_file.write(content)
+        return content.decode()
+
+    def _delete(self, key: str) -> None:
+        with suppress(FileNotFoundError):
+            self._path(key).unlink()
+
+    def _lock_info(self, key: str) -> tuple[float, str] | None:
+        # Read the time and the content from the same file, even if it is replaced
+        try:
+            with self._path(key).open("rb") as lock_file:
+                modified_at = os.fstat(lock_file.fileno()).st_mtime
+                return modified_at, lock_file.read().decode()
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _lock_marker(self, key: str, tag: str) -> Iterator[bool]:
+        # Only the holder of the marker for a lock may replace or delete it, and
+        # only while the lock is still the one with `tag`
+        path = self._path(key)
+        marker = path.with_name(
+            f"{path.name}.{hashlib.sha1(tag.encode()).hexdigest()}.break"  # noqa: S303
+        )
+        try:
+            os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            # Another process is replacing the lock, or crashed while doing so
+            with suppress(FileNotFoundError):
+                if time.time() - marker.stat().st_mtime > self.lock_timeout_seconds:
+                    marker.unlink()
+            yield False
+            return
+
+        try:
+            lock_info = self._lock_info(key)
+            yield lock_info is not None and lock_info[1] == tag
+        finally:
+            with suppress(FileNotFoundError):
+                marker.unlink()
+
+    def _replace_lock(self, key: str, tag: str, content: bytes) -> str | None:
+        # As the lock is replaced rather than deleted, no other lock can be
+        # created in the meantime
+        with self._lock_marker(key, tag) as owned:
+            if not owned:
+                return None
+            self._write(key, content)
+            return content.decode()
+
+    def _delete_lock(self, key: str, tag: str) -> bool:
+        with self._lock_marker(key, tag) as owned:
+            if owned:
+                self._delete(key)
+            return owned
+
+    def _list_dirs(self) -> Iterator[str]:
+        if not self.state_dir.exists():
+            return
+        for entry in self.state_dir.iterdir():
+            if entry.joinpath(STATE_FILENAME).exists():
+                yield entry.name
@@ -0,0 +1,237 @@
+"""State store manager for state stored in an S3 bucket."""
+from __future__ import annotations
+
+import hashlib
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Iterator
+
+from atomicwrites import atomic_write
+
+from .filesystem import BaseFilesystemStateStoreManager
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:
+    boto3 = None
+
+    class ClientError(Exception):  # noqa: N818
+        """Stand-in for `botocore.exceptions.ClientError` when boto3 is missing."""
+
+        def __init__(self, error_response: dict, operation_name: str):
+            """Create a new ClientError.
+
+            Args:
+                error_response: the error response, as returned by the S3 API
+                operation_name: the name of the failed operation
+            """
+            super().__init__(error_response, operation_name)
+            self.response = error_response
+            self.operation_name = operation_name
+
+
+class MissingBoto3Error(Exception):
+    """Occurs when an S3 state backend is configured but boto3 is not installed."""
+
+    def __init__(self):
+        """Create a new MissingBoto3Error."""
+        super().__init__(
+            "The S3 state backend requires boto3. Install it with `pip install boto3`."
+        )
+
+
+# Error codes of conditional requests on an object that changed or is missing
+CONDITION_FAILED_CODES = frozenset(
+    ("PreconditionFailed", "ConditionalRequestConflict", "NoSuchKey", "404")
+)
+
+
+def _error_code(err: ClientError) -> str:
+    return str(err.response.get("Error", {}).get("Code", ""))
+
+
+def _status_code(err: ClientError) -> int | None:
+    return err.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+
+
+class S3StateStoreManager(BaseFilesystemStateStoreManager):
+    """State store manager for state stored in an S3 bucket.
+
+    Selected with an `s3://` URI, e.g. `s3://my-bucket/meltano/state`.
+
+    When a cache directory is given, state files that were read before are kept
+    there along with their ETag, and are only downloaded again when they changed.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        aws_access_key_id: str | None = None,
+        aws_secret_access_key: str | None = None,
+        endpoint_url: str | None = None,
+        cache_dir: Path | None = None,
+        client: Any = None,
+        **kwargs,
+    ):
+        """Initialize the state store manager.
+
+        Args:
+            uri: the `s3://` URI of the bucket and prefix to store state in
+            aws_access_key_id: the AWS access key ID, if not using the default credentials
+            aws_secret_access_key: the AWS secret access key
+            endpoint_url: the S3 endpoint URL, for S3-compatible storage such as MinIO
+            cache_dir: directory to cache state files in, or None to disable caching
+            client: an S3 client to use instead of creating one with boto3
+            kwargs: additional keyword args to supply to BaseFilesystemStateStoreManager
+
+        Raises:
+            MissingBoto3Error: if no client is given and boto3 is not installed
+        """
+        super().__init__(uri, **kwargs)
+        self.bucket = self.parsed_uri.netloc
+        self.prefix = self.parsed_uri.path.strip("/")
+        self.cache_dir = cache_dir
+
+        if client is None:
+            if boto3 is None:
+                raise MissingBoto3Error()
+            client = boto3.client(
+                "s3",
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                endpoint_url=endpoint_url,
+            )
+        self.client = client
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def _cache_paths(self, key: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(self._object_key(key).encode()).hexdigest()
+        return (
+            self.cache_dir / f"{digest}.json",
+            self.cache_dir / f"{digest}.etag",
+        )
+
+    def _read_cached(self, key: str) -> tuple[bytes, str] | None:
+        if self.cache_dir is None:
+            return None
+        content_path, etag_path = self._cache_paths(key)
+        try:
+            return content_path.read_bytes(), etag_path.read_text()
+        except FileNotFoundError:
+            return None
+
+    def _write_cached(self, key: str, content: bytes, etag: str) -> None:
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        content_path, etag_path = self._cache_paths(key)
+        with atomic_write(content_path, mode="wb", overwrite=True) as cache_file:
+            cache_file.write(content)
+        with atomic_write(etag_path, overwrite=True) as etag_file:
+            etag_file.write(etag)
+
+    def _delete_cached(self, key: str) -> None:
+        if self.cache_dir is None:
+            return
+        for path in self._cache_paths(key):
+            with suppress(FileNotFoundError):
+                path.unlink()
+
+    def _read(self, key: str) -> bytes | None:
+        cached = self._read_cached(key)
+        request = {"Bucket": self.bucket, "Key": self._object_key(key)}
+        if cached:
+            request["IfNoneMatch"] = cached[1]
+
+        try:
+            response = self.client.get_object(**request)
+        except ClientError as err:
+            if cached and _status_code(err) == 304:
+                return cached[0]
+            if _error_code(err) in {"NoSuchKey", "404"}:
+                self._delete_cached(key)
+                return None
+            raise
+
+        content = response["Body"].read()
+        self._write_cached(key, content, response["ETag"])
+        return content
+
+    def _write(self, key: str, content: bytes) -> None:
+        response = self.client.put_object(
+            Bucket=self.bucket, Key=self._object_key(key), Body=content
+        )
+        if "ETag" in response:
+            self._write_cached(key, content, response["ETag"])
+        else:
+            self._delete_cached(key)
+
+    def _create_lock(self, key: str, content: bytes) -> str | None:
+        try:
+            response = self.client.put_object(
+                Bucket=self.bucket,
+                Key=self._object_key(key),
+                Body=content,
+                IfNoneMatch="*",
+            )
+        except ClientError as err:
+            if _error_code(err) in {"PreconditionFailed", "ConditionalRequestConflict"}:
+                return None
+            raise
+        return response["ETag"]
+
+    def _delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+        self._delete_cached(key)
+
+    def _lock_info(self, key: str) -> tuple[float, str] | None:
+        try:
+            response = self.client.head_object(
+                Bucket=self.bucket, Key=self._object_key(key)
+            )
+        except ClientError as err:
+            if _error_code(err) in {"NoSuchKey", "404"}:
+                return None
+            raise
+        return response["LastModified"].timestamp(), response["ETag"]
+
+    def _replace_lock(self, key: str, tag: str, content: bytes) -> str | None:
+        # The lock is only overwritten if it is still the one with this ETag
+        try:
+            response = self.client.put_object(
+                Bucket=self.bucket,
+                Key=self._object_key(key),
+                Body=content,
+                IfMatch=tag,
+            )
+        except ClientError as err:
+            if _error_code(err) in CONDITION_FAILED_CODES:
+                return None
+            raise
+        return response["ETag"]
+
+    def _delete_lock(self, key: str, tag: str) -> bool:
+        # The lock is only deleted if it is still the one with this ETag
+        try:
+            self.client.delete_object(
+                Bucket=self.bucket, Key=self._object_key(key), IfMatch=tag
+            )
+        except ClientError as err:
+            if _error_code(err) in CONDITION_FAILED_CODES:
+                return False
+            raise
+        return True
+
+    def _list_dirs(self) -> Iterator[str]:
+        prefix = f"{self.prefix}/" if self.prefix else ""
+        request = {"Bucket": self.bucket, "Prefix": prefix, "Delimiter": "/"}
+        while True:
+            response = self.client.list_objects_v2(**request)
+            for common_prefix in response.get("CommonPrefixes", []):
+                yield common_prefix["Prefix"][len(prefix) :].rstrip("/")
+            if not response.get("IsTruncated"):
+                return
+            request["ContinuationToken"] = response["NextContinuationToken"]
@@ -0,0 +1,194 @@
+"""On-disk spool for Snowplow events."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import suppress
+from pathlib import Path
+
+import structlog
+from snowplow_tracker import Emitter, SelfDescribingJson
+from snowplow_tracker.emitters import PAYLOAD_DATA_SCHEMA
+
+logger = structlog.get_logger(__name__)
+
+SPOOL_SUFFIX = ".ndjson"
+SENDING_SUFFIX = ".sending"
+
+# Number of events sent per POST request
+SPOOL_BATCH_SIZE = 50
+
+# Spool files being sent by a process that died are sent again after this many seconds
+STALE_SENDING_SECONDS = 600
+
+# Spooled events are dropped, oldest first, once they are older than this many
+# seconds, or once the spool grows beyond this many bytes
+MAX_SPOOL_AGE_SECONDS = 7 * 24 * 60 * 60  # 7 days
+MAX_SPOOL_SIZE = 10 * 1024 * 1024  # 10 MiB
+
+# Number of spool files sent per flush, oldest first
+MAX_FILES_PER_FLUSH = 20
+
+
+class SpoolingEmitter(Emitter):
+    """Snowplow emitter which writes events to an on-disk spool.
+
+    Tracking an event only appends a line to a spool file, so it never waits on the
+    network. Spooled events, including those left by earlier invocations, are sent in
+    batches from a daemon thread started by `flush_spool`.
+
+    When the events cannot be sent, e.g. without network access to the collector,
+    the spool is bounded by dropping the oldest events once they are too old or the
+    spool grows too large.
+    """
+
+    def __init__(
+        self,
+        spool_dir: Path,
+        endpoint: str,
+        protocol: str = "http",
+        port: int | None = None,
+        request_timeout: float | tuple[float, float] | None = None,
+    ):
+        """Initialize the emitter.
+
+        Args:
+            spool_dir: Directory to spool events to.
+            endpoint: The collector URL, without scheme.
+            protocol: The protocol to use, http or https.
+            port: The collector port to connect to.
+            request_timeout: Timeout for the HTTP requests.
+        """
+        super().__init__(
+            endpoint=endpoint,
+            protocol=protocol,
+            port=port,
+            method="post",
+            buffer_size=SPOOL_BATCH_SIZE,
+            request_timeout=request_timeout,
+        )
+        self.spool_dir = spool_dir
+        self.spool_file = spool_dir / f"{os.getpid()}-{uuid.uuid4().hex}{SPOOL_SUFFIX}"
+        self._sender: threading.Thread | None = None
+
+    def input(self, payload: dict) -> None:
+        """Append an event to the spool file.
+
+        Args:
+            payload: The name-value pairs for the event.
+        """
+        line = json.dumps({key: str(payload[key]) for key in payload})
+        try:
+            with self.spool_file.open("a") as spool_file:
+                spool_file.write(f"{line}\n")
+        except OSError as err:
+            logger.debug("Unable to spool tracking event", err=err)
+
+    def flush_spool(self) -> threading.Thread:
+        """Send spooled events from a daemon thread, which never delays process exit.
+
+        Returns:
+            The thread sending the spooled events.
+        """
+        if self._sender is None or not self._sender.is_alive():
+            self._sender = threading.Thread(
+                target=self.send_spooled, name="meltano-tracking-spool", daemon=True
+            )
+            self._sender.start()
+        return self._sender
+
+    def send_spooled(self) -> int:
+        """Send the oldest spooled events, except those spooled by this process.
+
+        Up to `MAX_FILES_PER_FLUSH` spool files are sent, oldest first, and
+        sending stops at the first file which could not be sent. Each spool file
+        is claimed by renaming it, so that concurrent invocations never send the
+        same events twice. Files which could not be sent are returned to the spool.
+
+        Returns:
+            The number of events that were sent.
+        """
+        sent = 0
+        self._reclaim_stale()
+
+        spooled = [path for path in self._prune() if path != self.spool_file]
+        for path in spooled[:MAX_FILES_PER_FLUSH]:
+
+            claimed = path.with_suffix(SENDING_SUFFIX)
+            try:
+                path.rename(claimed)
+                os.utime(claimed)
+            except OSError:
+                # Claimed by another invocation
+                continue
+
+            try:
+                sent += self._send_file(claimed)
+            except Exception as err:
+                logger.debug("Failed to send spooled tracking events", err=err)
+                with suppress(OSError):
+                    claimed.rename(path)
+                # The collector is most likely unreachable for the other files too
+                break
+            else:
+                claimed.unlink()
+
+        return sent
+
+    def _prune(self) -> list[Path]:
+        """Drop the oldest spool files while the spool is too old or too large.
+
+        Returns:
+            The remaining spool files, oldest first.
+        """
+        spooled = []
+        for path in self.spool_dir.glob(f"*{SPOOL_SUFFIX}"):
+            with suppress(OSError):
+                spooled.append((path.stat(), path))
+        spooled.sort(key=lambda entry: entry[0].st_mtime)
+
+        cutoff = time.time() - MAX_SPOOL_AGE_SECONDS
+        size = sum(stat.st_size for stat, _ in spooled)
+        dropped = 0
+        while spooled and (size > MAX_SPOOL_SIZE or spooled[0][0].st_mtime < cutoff):
+            stat, path = spooled[0]
+            if path == self.spool_file:
+                break
+            with suppress(FileNotFoundError):
+                path.unlink()
+            spooled.pop(0)
+            size -= stat.st_size
+            dropped += 1
+
+        if dropped:
+            logger.debug("Dropped spooled tracking events", files=dropped)
+        return [path for _, path in spooled]
+
+    def _send_file(self, path: Path) -> int:
+        with path.open() as spool_file:
+            events = [json.loads(line) for line in spool_file if line.strip()]
+
+        for start in range(0, len(events), SPOOL_BATCH_SIZE):
+            batch = events[start : start + SPOOL_BATCH_SIZE]
+            Emitter.attach_sent_timestamp(batch)
+            if not self.http_post(
+                SelfDescribingJson(PAYLOAD_DATA_SCHEMA, batch).to_string()
+            ):
+                # Keep the events that were not sent yet
+                with path.open("w") as spool_file:
+                    for event in events[start:]:
+                        spool_file.write(f"{json.dumps(event)}\n")
+                raise ConnectionError(f"Could not send events to {self.endpoint}")
+
+        return len(events)
+
+    def _reclaim_stale(self) -> None:
+        cutoff = time.time() - STALE_SENDING_SECONDS
+        for path in self.spool_dir.glob(f"*{SENDING_SUFFIX}"):
+            with suppress(OSError):
+                if path.stat().st_mtime < cutoff:
+                    path.rename(path.with_suffix(SPOOL_SUFFIX))
@@ -36,7 +36,8 @@ from meltano.core.tracking.schemas import (
     ExitEventSchema,
     TelemetryStateChangeEventSchema,
 )
-from meltano.core.utils import format_exception
+from meltano.core.tracking.spool import SpoolingEmitter
+from meltano.core.utils import format_exception, slugify
 
 URL_REGEX = (
     r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\(\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
@@ -105,20 +106,29 @@ class Tracker:  # noqa: WPS214 - too many methods
 
         endpoints = self.settings_service.get("snowplow.collector_endpoints")
 
+        spool = self.settings_service.get("snowplow.spool")
+
         emitters: list[Emitter] = []
         for endpoint in endpoints:
             if not check_url(endpoint):
                 logger.warning("invalid_snowplow_endpoint", endpoint=endpoint)
                 continue
             parsed_url = urlparse(endpoint)
-            emitters.append(
-                Emitter(
-                    endpoint=parsed_url.hostname + parsed_url.path,
-                    protocol=parsed_url.scheme or "http",
-                    port=parsed_url.port,
-                    request_timeout=request_timeout,
+            emitter_kwargs = {
+                "endpoint": parsed_url.hostname + parsed_url.path,
+                "protocol": parsed_url.scheme or "http",
+                "port": parsed_url.port,
+                "request_timeout": request_timeout,
+            }
+            if spool:
+                emitters.append(
+                    SpoolingEmitter(
+                        self.project.meltano_dir("tracking", slugify(endpoint)),
+                        **emitter_kwargs,
+                    )
                 )
-            )
+            else:
+                emitters.append(Emitter(**emitter_kwargs))
 
         if emitters:
             self.snowplow_tracker = SnowplowTracker(app_id="meltano", emitters=emitters)
@@ -128,6 +138,11 @@ class Tracker:  # noqa: WPS214 - too many methods
         else:
             self.snowplow_tracker = None
 
+        if spool and self.send_anonymous_usage_stats:
+            # Send events spooled by earlier invocations in the background
+            for emitter in emitters:
+                emitter.flush_spool()
+
         stored_telemetry_settings = self.load_saved_telemetry_settings()
         self.client_id = stored_telemetry_settings.client_id or uuid.uuid4()
 
@@ -15,7 +15,7 @@ from collections import OrderedDict
 from copy import deepcopy
 from datetime import date, datetime, time
 from pathlib import Path
-from typing import Any, Callable, Iterable, TypeVar, overload
+from typing import Any, Callable, Iterable, Mapping, TypeVar, overload
 
 import flatten_dict
 from requests.auth import HTTPBasicAuth
@@ -142,13 +142,19 @@ def get_all(keys, d: dict, default=None):
 
 
 # Taken from https://stackoverflow.com/a/20666342
-def merge(src, dest):
+def merge(src, dest, adopt=False):
     """Merge both given dictionaries together at depth, modifying `dest` in-place.
 
+    Nested dictionaries are merged iteratively, so deep trees do not hit the
+    recursion limit.
+
     Args:
         src: A dictionary to merge into `dest`.
         dest: The dictionary that will be updated with the keys and values from
             `src` at depth.
+        adopt: Whether `dest` may take over the nested dictionaries of `src` that
+            it lacks instead of copying them, which is much faster for large
+            trees. Only pass `True` if `src` is not used after the merge.
 
     Examples:
         >>> a = { 'first' : { 'all_rows' : { 'pass' : 'dog', 'number' : '1' } } }
@@ -159,13 +165,22 @@ def merge(src, dest):
     Returns:
         The `dest` dictionary with the keys and values from `src` merged in.
     """
-    for key, value in src.items():
-        if isinstance(value, dict):
-            # get node or create one
-            node = dest.setdefault(key, {})
-            merge(value, node)
-        else:
-            dest[key] = value
+    stack = [(src, dest)]
+    while stack:
+        src_node, dest_node = stack.pop()
+        for key, value in src_node.items():
+            if not isinstance(value, dict):
+                dest_node[key] = value
+                continue
+
+            node = dest_node.get(key)
+            if isinstance(node, dict):
+                stack.append((value, node))
+            elif adopt:
+                dest_node[key] = value
+            else:
+                node = dest_node[key] = {}
+                stack.append((value, node))
 
     return dest
 
@@ -466,8 +481,8 @@ class EnvironmentVariableNotSetError(MeltanoError):
         super().__init__(reason, instruction)
 
 
-def expand_env_vars(raw_value, env: dict, raise_if_missing: bool = False):
-    if isinstance(raw_value, dict):
+def expand_env_vars(raw_value, env: Mapping, raise_if_missing: bool = False):
+    if isinstance(raw_value, Mapping):
         return {
             key: expand_env_vars(val, env, raise_if_missing)
             for key, val in raw_value.items()
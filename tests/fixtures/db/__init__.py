@@ -12,6 +12,7 @@ from sqlalchemy.exc import SAWarning
 from sqlalchemy.orm import close_all_sessions, sessionmaker
 from sqlalchemy.pool import NullPool
 
+from meltano.core import migration_service
 from meltano.core.project import Project
 
 
@@ -48,6 +49,8 @@ def vacuum_db(engine_sessionmaker):
         metadata = MetaData(bind=engine)
         metadata.reflect()
         metadata.drop_all()
+        # The dropped database is no longer up-to-date
+        migration_service._up_to_date_urls.clear()  # noqa: WPS437
 
 
 @pytest.fixture(scope="class")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import pytest
 
 from meltano.api.models import db as _db
+from meltano.api.project_cache import project_cache
 
 
 @pytest.fixture(autouse=True)
@@ -18,3 +19,13 @@ def session(app, connection):
         yield _db.session
     finally:
         _db.session.remove()
+
+
+@pytest.fixture(autouse=True)
+def clear_project_cache():
+    # services cached by an earlier test may have been built with other mocks
+    project_cache.invalidate()
+    try:
+        yield
+    finally:
+        project_cache.invalidate()
@@ -29,7 +29,7 @@ class TestOrchestration:
         monkeypatch.setenv("TAP_MOCK_BOOLEAN", "false")
 
         with mock.patch(
-            "meltano.api.controllers.orchestrations.ProjectPluginsService",
+            "meltano.api.project_cache.ProjectPluginsService",
             return_value=project_plugins_service,
         ), app.test_request_context():
             res = api.get(
@@ -86,7 +86,7 @@ class TestOrchestration:
         )
 
         with mock.patch(
-            "meltano.api.controllers.orchestrations.ProjectPluginsService",
+            "meltano.api.project_cache.ProjectPluginsService",
             return_value=project_plugins_service,
         ), app.test_request_context():
             res = api.put(
@@ -117,7 +117,7 @@ class TestOrchestration:
             assert "hidden" not in config
 
     @mock.patch("meltano.core.plugin_test_service.PluginInvoker.invoke_async")
-    @mock.patch("meltano.api.controllers.orchestrations.ProjectPluginsService")
+    @mock.patch("meltano.api.project_cache.ProjectPluginsService")
     def test_test_plugin_configuration_success(
         self,
         mock_project_plugins_service,
@@ -148,7 +148,7 @@ class TestOrchestration:
         assert res.json["is_success"]
 
     @mock.patch("meltano.core.plugin_test_service.PluginInvoker.invoke_async")
-    @mock.patch("meltano.api.controllers.orchestrations.ProjectPluginsService")
+    @mock.patch("meltano.api.project_cache.ProjectPluginsService")
     def test_test_plugin_configuration_failure(
         self,
         mock_project_plugins_service,
@@ -177,3 +177,56 @@ class TestOrchestration:
 
         assert res.status_code == 200
         assert not res.json["is_success"]
+
+    def test_get_configuration_etag(
+        self,
+        app,
+        api,
+        tap,
+        session,
+        plugin_settings_service_factory,
+        project_plugins_service,
+        monkeypatch,
+    ):
+        with mock.patch(
+            "meltano.api.project_cache.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ), app.test_request_context():
+            url = url_for("orchestrations.get_plugin_configuration", plugin_ref=tap)
+
+            res = api.get(url)
+            assert res.status_code == 200
+            etag = res.headers["ETag"]
+
+            # Unchanged configuration
+            res = api.get(url, headers={"If-None-Match": etag})
+            assert res.status_code == 304
+            assert res.headers["ETag"] == etag
+
+            # Setting changed in the system database
+            plugin_settings_service = plugin_settings_service_factory(tap)
+            plugin_settings_service.set(
+                "protected", "changed", store=SettingValueStore.DB, session=session
+            )
+            res = api.get(url, headers={"If-None-Match": etag})
+            assert res.status_code == 200
+            assert res.headers["ETag"] != etag
+            etag = res.headers["ETag"]
+
+            # Environment variable changed
+            monkeypatch.setenv("TAP_MOCK_BOOLEAN", "true")
+            res = api.get(url, headers={"If-None-Match": etag})
+            assert res.status_code == 200
+            assert res.json["config"]["boolean"] is True
+            assert res.headers["ETag"] != etag
+            etag = res.headers["ETag"]
+
+            # Discovery manifest changed
+            discovery_path = project_plugins_service.project.root_dir("discovery.yml")
+            discovery_path.write_text("version: 1\n")
+            try:
+                res = api.get(url, headers={"If-None-Match": etag})
+            finally:
+                discovery_path.unlink()
+            assert res.status_code == 200
+            assert res.headers["ETag"] != etag
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+
+import pytest
+from flask import url_for
+
+from meltano.api.project_cache import ProjectCache, project_cache
+
+
+class TestProjectCache:
+    def test_services_cached(self, project):
+        cache = ProjectCache()
+
+        assert cache.project is project
+        assert cache.plugins_service() is cache.plugins_service()
+        assert cache.settings_service() is cache.settings_service()
+        assert cache.schedule_service().plugins_service is cache.plugins_service()
+        assert cache.job_logging_service().settings is cache.settings_service()
+
+    def test_meltano_yml_modified(self, project):
+        cache = ProjectCache()
+        plugins_service = cache.plugins_service()
+
+        stat = project.meltanofile.stat()
+        os.utime(project.meltanofile, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+        assert cache.plugins_service() is not plugins_service
+
+    def test_dotenv_modified(self, project):
+        cache = ProjectCache()
+        settings_service = cache.settings_service()
+
+        with project.dotenv.open("a") as dotenv:
+            dotenv.write("\n")
+
+        assert cache.settings_service() is not settings_service
+
+    def test_lock_files_modified(self, project):
+        lock_path = project.plugin_lock_path("extractors", "tap-cached", "meltano")
+        lock_path.write_text("{}")
+        try:
+            cache = ProjectCache()
+            plugins_service = cache.plugins_service()
+            signature = cache.signature
+
+            lock_path.write_text('{"name": "tap-cached"}')
+            assert cache.signature != signature
+            assert cache.plugins_service() is not plugins_service
+            plugins_service = cache.plugins_service()
+
+            # A new lock file is noticed through its directory
+            new_lock_path = lock_path.with_name("tap-new--meltano.lock")
+            new_lock_path.write_text("{}")
+            assert cache.plugins_service() is not plugins_service
+        finally:
+            lock_path.unlink()
+            with suppress(FileNotFoundError):
+                new_lock_path.unlink()
+
+    def test_discovery_yml_modified(self, project):
+        discovery_path = project.root_dir("discovery.yml")
+        cache = ProjectCache()
+        plugins_service = cache.plugins_service()
+
+        discovery_path.write_text("version: 1\n")
+        try:
+            assert cache.plugins_service() is not plugins_service
+        finally:
+            discovery_path.unlink()
+
+    def test_invalidate(self, project):
+        cache = ProjectCache()
+        plugins_service = cache.plugins_service()
+        payloads = cache.configuration_payloads()
+        payloads["key"] = ("etag", {})
+
+        cache.invalidate()
+
+        assert cache.plugins_service() is not plugins_service
+        assert cache.configuration_payloads() == {}
+
+    def test_invalidated_after_write_requests(self, app, api):
+        plugins_service = project_cache.plugins_service()
+
+        with app.test_request_context():
+            api.get(url_for("plugins.installed"))
+            assert project_cache.plugins_service() is plugins_service
+
+            # even a failed write may have modified the project
+            with pytest.raises(KeyError):
+                api.post(url_for("orchestrations.save_pipeline_schedule"), json={})
+            assert project_cache.plugins_service() is not plugins_service
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+
+from mock import mock
+
+from asserts import assert_cli_runner
+from meltano.cli import cli
+from meltano.core.plugin.error import PluginExecutionError
+from meltano.core.plugin.singer import SingerTap
+
+
+class TestCliDiscoverCatalogs:
+    def test_discover_catalogs(self, cli_runner, tap, project_plugins_service):
+        async def mock_discovery(plugin_invoker, catalog_path):
+            catalog_path.write_text(json.dumps({"streams": []}))
+
+        with mock.patch(
+            "meltano.cli.discover_catalogs.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ), mock.patch.object(SingerTap, "run_discovery", side_effect=mock_discovery):
+            result = cli_runner.invoke(
+                cli, ["--no-environment", "discover-catalogs", tap.name]
+            )
+
+        assert_cli_runner(result)
+        assert f"Discovered catalog of extractor '{tap.name}' in" in result.stdout
+        assert "Discovered catalogs of 1 extractors" in result.stdout
+
+    def test_discover_catalogs_failure(
+        self, cli_runner, tap, project_plugins_service, plugin_invoker_factory
+    ):
+        # Discover the catalog again, rather than using the cached one
+        plugin_invoker_factory(tap).files["catalog_cache_key"].unlink()
+
+        with mock.patch(
+            "meltano.cli.discover_catalogs.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ), mock.patch.object(
+            SingerTap,
+            "run_discovery",
+            side_effect=PluginExecutionError("Catalog discovery failed"),
+        ):
+            result = cli_runner.invoke(
+                cli, ["--no-environment", "discover-catalogs", tap.name]
+            )
+
+        assert result.exit_code == 1
+        assert "Catalog discovery failed" in result.stdout
+        assert "Failed to discover the catalogs of 1 of 1 extractors" in str(
+            result.exception
+        )
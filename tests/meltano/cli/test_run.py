@@ -767,6 +767,7 @@ class TestCliRunScratchpadOne:
                 or "RunnerError('Extractor failed')"
             )
             assert completed_events[0].get("exit_codes").get("extractors") == 1
+            assert "tap failure" in completed_events[0].get("stderr").get(tap.name)
 
             tap_stop_event = matcher.find_by_event("tap failure")
             assert len(tap_stop_event) == 1
@@ -785,6 +786,73 @@ class TestCliRunScratchpadOne:
             assert not matcher.event_matches("dbt running")
             assert not matcher.event_matches("dbt done")
 
+    @pytest.mark.backend("sqlite")
+    @mock.patch(
+        "meltano.core.logging.utils.default_config", return_value=test_log_config
+    )
+    def test_run_elb_mapper_failure_before_tap_finished(  # noqa: WPS118
+        self,
+        default_config,
+        cli_runner,
+        project,
+        tap,
+        target,
+        mapper,
+        tap_process,
+        target_process,
+        mapper_process,
+        project_plugins_service,
+        job_logging_service,
+    ):
+        # in this scenario, the mapper fails while the tap and target are still running
+        args = ["run", tap.name, "mock-mapping-0", target.name]
+
+        async def tap_wait_mock():
+            await asyncio.sleep(2)
+            return tap_process.wait.return_value
+
+        tap_process.wait.side_effect = tap_wait_mock
+
+        async def mapper_wait_mock():
+            await asyncio.sleep(0.5)
+            return 1
+
+        mapper_process.wait.side_effect = mapper_wait_mock
+        mapper_process.wait.return_value = 1
+        mapper_process.returncode = 1
+        mapper_process.stderr.readline.side_effect = (
+            b"mapper starting\n",
+            b"mapper running\n",
+            b"mapper failure\n",
+        )
+
+        invoke_async = AsyncMock(
+            side_effect=(tap_process, mapper_process, target_process)
+        )
+
+        with mock.patch.object(
+            PluginInvoker, "invoke_async", new=invoke_async
+        ), mock.patch(
+            "meltano.core.block.parser.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ):
+            result = cli_runner.invoke(cli, args)
+
+            assert "Intermediate block (likely a mapper) failed" in str(
+                result.exception
+            )
+            assert result.exit_code == 1
+
+            matcher = EventMatcher(result.stderr)
+            completed_events = matcher.find_by_event("Block run completed.")
+            assert len(completed_events) == 1
+            assert completed_events[0].get("success") is False
+
+            # Only the stderr of the failed mapper is reported
+            stderr = completed_events[0].get("stderr")
+            assert list(stderr.keys()) == [mapper.name]
+            assert "mapper failure" in stderr[mapper.name]
+
     @pytest.mark.backend("sqlite")
     @mock.patch(
         "meltano.core.logging.utils.default_config", return_value=test_log_config
@@ -1391,6 +1459,57 @@ class TestCliRunScratchpadOne:
             assert not matcher.event_matches("dbt running")
             assert not matcher.event_matches("dbt done")
 
+    @pytest.mark.backend("sqlite")
+    @mock.patch(
+        "meltano.core.logging.utils.default_config", return_value=test_log_config
+    )
+    def test_run_fused_mappers(
+        self,
+        default_config,
+        cli_runner,
+        project,
+        tap,
+        target,
+        mapper,
+        tap_process,
+        target_process,
+        mapper_process,
+        project_plugins_service,
+        job_logging_service,
+        monkeypatch,
+    ):
+        monkeypatch.setenv("MELTANO_ELT_FUSE_MAPPERS", "true")
+        args = ["run", tap.name, "mock-mapping-0", "mock-mapping-1", target.name]
+
+        # A single mapper process runs both mappings
+        invoke_async = AsyncMock(
+            side_effect=(tap_process, mapper_process, target_process)
+        )
+        with mock.patch.object(
+            PluginInvoker, "invoke_async", new=invoke_async
+        ), mock.patch(
+            "meltano.core.block.parser.ProjectPluginsService",
+            return_value=project_plugins_service,
+        ):
+            result = cli_runner.invoke(cli, args, catch_exceptions=True)
+            assert result.exit_code == 0
+
+            assert invoke_async.call_count == 3
+
+            matcher = EventMatcher(result.stderr)
+            fused_events = matcher.find_by_event(
+                "Fusing mappings into a single mapper process"
+            )
+            assert len(fused_events) == 1
+            assert fused_events[0].get("mappings") == [
+                "mock-mapping-0",
+                "mock-mapping-1",
+            ]
+
+            completed_events = matcher.find_by_event("Block run completed.")
+            assert len(completed_events) == 1
+            assert completed_events[0].get("success") is True
+
     @pytest.mark.backend("sqlite")
     @mock.patch(
         "meltano.core.logging.utils.default_config", return_value=test_log_config
@@ -10,6 +10,7 @@ import pytest
 
 from asserts import assert_cli_runner
 from meltano.cli import cli, state
+from meltano.core.job_state import JobState
 from meltano.core.utils import merge
 
 unconventional_state_ids = [
@@ -250,3 +251,131 @@ class TestCliState:
                 assert_cli_runner(result)
                 job_state = state_service.get_state(state_id)
                 assert (not job_state) or (not job_state.get("singer_state"))
+
+    def test_export(self, state_service, cli_runner, state_ids_with_expected_states):
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            result = cli_runner.invoke(cli, ["state", "export"])
+        assert_cli_runner(result)
+        exported = {
+            record["state_id"]: record["state"]
+            for record in map(json.loads, result.stdout.splitlines())
+        }
+        for (state_id, expected_state) in state_ids_with_expected_states:
+            assert exported[state_id] == expected_state
+
+    def test_export_pattern(
+        self, state_service, cli_runner, patterns_with_expected_results
+    ):
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            for (pattern, expected_result) in patterns_with_expected_results:
+                result = cli_runner.invoke(
+                    cli, ["state", "export", "--pattern", pattern]
+                )
+                assert_cli_runner(result)
+                assert {
+                    json.loads(line)["state_id"] for line in result.stdout.splitlines()
+                } == expected_result
+
+    def test_import(self, tmp_path, state_service, cli_runner, payloads):
+        states = {
+            f"imported:tap-{idx}-to-target": payloads.mock_state_payloads[
+                idx % len(payloads.mock_state_payloads)
+            ]
+            for idx in range(7)
+        }
+        filepath = tmp_path / "states.ndjson"
+        with open(filepath, "w") as states_file:
+            for state_id, state_payload in states.items():
+                states_file.write(
+                    json.dumps({"state_id": state_id, "state": state_payload})
+                )
+                states_file.write("\n")
+
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            result = cli_runner.invoke(
+                cli,
+                [
+                    "state",
+                    "import",
+                    "--force",
+                    "--input-file",
+                    str(filepath),
+                    "--batch-size",
+                    "3",
+                ],
+            )
+        assert_cli_runner(result)
+        assert state_service.list_state("imported:*") == states
+
+    def test_import_invalid(self, tmp_path, state_service, cli_runner):
+        filepath = tmp_path / "invalid.ndjson"
+        filepath.write_text(
+            json.dumps({"state_id": "imported:invalid", "state": {"not": "singer"}})
+        )
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            result = cli_runner.invoke(
+                cli, ["state", "import", "--force", "--input-file", str(filepath)]
+            )
+        assert result.exit_code == 1
+        assert "Invalid state for 'imported:invalid'" in str(result.exception)
+        assert not state_service.get_state("imported:invalid")
+
+    @pytest.mark.parametrize(
+        ("invalid_line", "error"),
+        [
+            ("not json", "Invalid state record on line 3"),
+            (
+                json.dumps(
+                    {"state_id": "imported:invalid", "state": {"not": "singer"}}
+                ),
+                "Invalid state for 'imported:invalid'",
+            ),
+        ],
+        ids=["invalid-record", "invalid-state"],
+    )
+    def test_import_invalid_after_first_batch(
+        self, tmp_path, state_service, cli_runner, payloads, invalid_line, error
+    ):
+        filepath = tmp_path / "partly-invalid.ndjson"
+        with open(filepath, "w") as states_file:
+            for idx in range(2):
+                states_file.write(
+                    json.dumps(
+                        {
+                            "state_id": f"imported:tap-{idx}-to-target",
+                            "state": payloads.mock_state_payloads[0],
+                        }
+                    )
+                )
+                states_file.write("\n")
+            states_file.write(f"{invalid_line}\n")
+
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            result = cli_runner.invoke(
+                cli,
+                [
+                    "state",
+                    "import",
+                    "--force",
+                    "--input-file",
+                    str(filepath),
+                    "--batch-size",
+                    "1",
+                ],
+            )
+        assert result.exit_code == 1
+        assert error in str(result.exception)
+
+        # The input is validated as a whole before any batch is written
+        assert state_service.list_state("imported:*") == {}
+
+    def test_compact(self, state_service, cli_runner, state_ids_with_expected_states):
+        state_service.session.query(JobState).delete()
+        state_service.session.commit()
+
+        with mock.patch("meltano.cli.state.StateService", return_value=state_service):
+            result = cli_runner.invoke(
+                cli, ["state", "compact", "--force", "--batch-size", "2"]
+            )
+        assert_cli_runner(result)
+        assert state_service.list_state() == dict(state_ids_with_expected_states)
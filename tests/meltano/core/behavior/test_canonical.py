@@ -3,10 +3,13 @@ from __future__ import annotations
 import io
 from textwrap import dedent
 
+import mock
 import pytest
 from ruamel.yaml.comments import CommentedMap
 
 from meltano.core.behavior.canonical import Canonical
+from meltano.core.plugin.base import BasePlugin, PluginDefinition, PluginType
+from meltano.core.plugin.project_plugin import ProjectPlugin
 from meltano.core.yaml import yaml
 
 definition = {
@@ -135,6 +138,87 @@ class TestCanonical:
         assert subject.known == "value"
         assert subject.canonical()["known"] == "value"
 
+    def test_resolved_attrs_cached(self, subject):
+        calls = []
+
+        def default(_):
+            calls.append(None)
+            return "default"
+
+        subject.known = None
+        subject._defaults["known"] = default
+
+        assert subject.known == "default"
+        assert subject.known == "default"
+        assert len(calls) == 1
+
+    def test_resolved_attrs_invalidated(self, subject):
+        grandparent = Canonical(known="value", unknown="value")
+        parent = Canonical(known=None)
+        parent._fallback_to = grandparent
+        parent._fallbacks.add("known")
+        subject._fallback_to = parent
+        subject.known = None
+        subject._fallbacks.add("known")
+
+        assert subject.known == "value"
+        assert subject.unknown == "value"
+
+        # Modifying any instance along the fallback chain invalidates the cache
+        grandparent.known = "changed"
+        grandparent.update(unknown="changed")
+        assert subject.known == "changed"
+        assert subject.unknown == "changed"
+
+        parent.known = "parent"
+        assert subject.known == "parent"
+
+        subject._fallbacks.discard("known")
+        assert subject.known is None
+
+    def test_resolved_attrs_survive_unrelated_changes(self, subject):
+        calls = []
+
+        def default(_):
+            calls.append(None)
+            return "default"
+
+        parent = Canonical(known="value")
+        subject._fallback_to = parent
+        subject.other = None
+        subject._defaults["other"] = default
+
+        assert subject.known == "value"
+        assert subject.other == "default"
+
+        # Creating and modifying instances off the fallback chain keeps the cache
+        for idx in range(10):
+            unrelated = Canonical(known=idx).with_attrs(other=idx)
+            unrelated.update(known=None)
+            unrelated._fallback_to = Canonical.parse({"known": idx})
+            unrelated._fallbacks.add("known")
+
+        with mock.patch.object(Canonical, "_resolve") as resolve:
+            assert subject.known == "value"
+            assert subject.other == "default"
+            resolve.assert_not_called()
+        assert len(calls) == 1
+
+    def test_resolved_attrs_through_plugin(self):
+        definition = PluginDefinition(PluginType.EXTRACTORS, "tap-test", "tap_test")
+        variant = definition.variants[0]
+        plugin = ProjectPlugin(PluginType.EXTRACTORS, "tap-test")
+        plugin.parent = BasePlugin(definition, variant)
+
+        assert plugin.namespace == "tap_test"
+        assert plugin.executable == "tap-test"
+
+        # Changes to the definition or the variant invalidate the cache
+        definition.namespace = "tap_changed"
+        variant.executable = "tap-changed"
+        assert plugin.namespace == "tap_changed"
+        assert plugin.executable == "tap-changed"
+
     def test_preserve_comments(self):
         contents = """\
             # This is a top-level comment
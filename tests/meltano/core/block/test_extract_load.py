@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -435,6 +436,87 @@ class TestExtractLoadBlocks:
             first_write = target_process.stdin.writeline.call_args_list[0]
             assert "mapper" in first_write[0][0]
 
+    @pytest.mark.asyncio
+    async def test_start_blocks_concurrently(
+        self,
+        session,
+        tap,
+        target,
+        plugin_invoker_factory,
+        elb_context,
+    ):
+        blocks = tuple(
+            SingerBlock(
+                block_ctx=elb_context,
+                project=elb_context.project,
+                plugins_service=elb_context.plugins_service,
+                plugin_invoker=plugin_invoker_factory(plugin),
+                plugin_args=[],
+            )
+            for plugin in (tap, target)
+        )
+        elb = ExtractLoadBlocks(elb_context, blocks)
+
+        starting = []
+        peak = 0
+
+        async def mock_start(block):
+            nonlocal peak
+            starting.append(block)
+            peak = max(peak, len(starting))
+            await asyncio.sleep(0.05)
+            starting.remove(block)
+            block.process_handle = mock.Mock()
+
+        with mock.patch.object(SingerBlock, "pre", new=AsyncMock()), mock.patch.object(
+            SingerBlock, "start", new=mock_start
+        ), mock.patch.object(SingerBlock, "post", new=AsyncMock()):
+            async with elb._start_blocks():
+                assert all(block.process_handle for block in blocks)
+
+        # The start-up of the target overlaps with the start-up of the tap
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_start_blocks_failure(
+        self,
+        session,
+        tap,
+        target,
+        plugin_invoker_factory,
+        elb_context,
+    ):
+        blocks = tuple(
+            SingerBlock(
+                block_ctx=elb_context,
+                project=elb_context.project,
+                plugins_service=elb_context.plugins_service,
+                plugin_invoker=plugin_invoker_factory(plugin),
+                plugin_args=[],
+            )
+            for plugin in (tap, target)
+        )
+        elb = ExtractLoadBlocks(elb_context, blocks)
+
+        async def mock_pre(block, context):
+            if block is blocks[0]:
+                raise RunnerError("Cannot prepare tap")
+
+        with mock.patch.object(SingerBlock, "pre", new=mock_pre), mock.patch.object(
+            SingerBlock, "start", new=AsyncMock()
+        ), mock.patch.object(
+            SingerBlock, "stop", new=AsyncMock()
+        ) as stop, mock.patch.object(
+            SingerBlock, "post", new=AsyncMock()
+        ) as post:
+            with pytest.raises(RunnerError, match="Cannot prepare tap"):
+                async with elb._start_blocks():
+                    pytest.fail("Blocks should not have been started")
+
+        # The blocks that did start are stopped, and all blocks are cleaned up
+        assert stop.call_count == 2
+        assert post.call_count == 2
+
     @pytest.mark.asyncio
     async def test_elb_validation(
         self,
@@ -66,3 +66,32 @@ class TestJobFinder:
         assert job in JobFinder(state_id=job.job_name).stale(session)
 
         assert job not in JobFinder(state_id="other").stale(session)
+
+    def test_latest_for_state_ids(self, session):
+        now = datetime.utcnow()
+
+        def make_job(state_id, state, hours_ago):
+            job = Job(
+                job_name=state_id,
+                state=state,
+                started_at=now - timedelta(hours=hours_ago),
+                ended_at=now - timedelta(hours=hours_ago - 1),
+            )
+            job.save(session)
+            return job
+
+        make_job("both", State.SUCCESS, 5)
+        success = make_job("both", State.SUCCESS, 4)
+        latest = make_job("both", State.FAIL, 2)
+        failed = make_job("failed", State.FAIL, 3)
+        make_job("other", State.SUCCESS, 1)
+
+        latest_jobs = JobFinder.latest_for_state_ids(
+            session, ["both", "failed", "missing"]
+        )
+
+        assert latest_jobs == {"both": (latest, success), "failed": (failed, None)}
+        for state_id, (state_job, state_job_success) in latest_jobs.items():
+            finder = JobFinder(state_id)
+            assert state_job == finder.latest(session)
+            assert state_job_success == finder.latest_success(session)
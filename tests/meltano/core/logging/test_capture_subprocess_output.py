@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from meltano.core.logging.utils import capture_subprocess_output, readline
+
+
+def make_reader(data: bytes, limit: int = 16) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader(limit=limit)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class LineCollector:
+    def __init__(self):
+        self.lines = []
+
+    def writeline(self, line: str):
+        self.lines.append(line)
+
+
+class TestReadline:
+    @pytest.mark.asyncio
+    async def test_readline(self):
+        reader = make_reader(b"short\n" + b"x" * 40 + b"\nlast")
+
+        assert await readline(reader, max_line_size=64) == b"short\n"
+        assert await readline(reader, max_line_size=64) == b"x" * 40 + b"\n"
+        assert await readline(reader, max_line_size=64) == b"last"
+        assert await readline(reader, max_line_size=64) == b""
+
+    @pytest.mark.asyncio
+    async def test_readline_limit(self):
+        reader = make_reader(b"x" * 40 + b"\n")
+
+        # Like `StreamReader.readline`, the `LimitOverrunError` is wrapped
+        with pytest.raises(ValueError) as exc_info:
+            await readline(reader)
+        assert isinstance(exc_info.value.__context__, asyncio.LimitOverrunError)
+
+        reader = make_reader(b"x" * 40 + b"\n")
+        with pytest.raises(ValueError) as exc_info:
+            await readline(reader, max_line_size=24)
+        assert isinstance(exc_info.value.__context__, asyncio.LimitOverrunError)
+
+
+class TestCaptureSubprocessOutput:
+    @pytest.mark.asyncio
+    async def test_max_line_size(self):
+        collector = LineCollector()
+        reader = make_reader(b"short\n" + b"x" * 40 + b"\nlast\n")
+
+        await capture_subprocess_output(reader, collector, max_line_size=64)
+
+        assert collector.lines == ["short\n", "x" * 40 + "\n", "last\n"]
+
+    @pytest.mark.asyncio
+    async def test_line_length_limit(self):
+        collector = LineCollector()
+        reader = make_reader(b"short\n" + b"x" * 40 + b"\n")
+
+        with pytest.raises(ValueError):
+            await capture_subprocess_output(reader, collector)
+
+        assert collector.lines == ["short\n"]
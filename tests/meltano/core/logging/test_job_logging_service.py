@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import gzip
+import os
+import shutil
+import time
+from pathlib import Path
+
+import mock
+import pytest
+
+from meltano.core.logging.job_logging_service import (
+    JobLoggingService,
+    MissingJobLogException,
+)
+from meltano.core.project_settings_service import ProjectSettingsService
+
+
+class TestJobLoggingService:
+    @pytest.fixture
+    def state_id(self):
+        return "dev:tap-mock-to-target-mock"
+
+    @pytest.fixture
+    def config_override(self):
+        return {}
+
+    @pytest.fixture
+    def subject(self, project, config_override, state_id):
+        settings = ProjectSettingsService(project, config_override=config_override)
+        service = JobLoggingService(project, settings=settings)
+        try:
+            yield service
+        finally:
+            shutil.rmtree(service.logs_dir(state_id))
+
+    def write_log(self, subject, state_id, run_id, content):
+        output_logger = subject.output_logger(state_id, run_id)
+        out = output_logger.out("meltano")
+        with out.redirect_logging():
+            out.logger.info(content)
+        return output_logger.file
+
+    def test_get_latest_log(self, subject, state_id):
+        with pytest.raises(MissingJobLogException):
+            subject.get_latest_log(state_id)
+
+        self.write_log(subject, state_id, "run-1", "first run")
+        subject.finalize_logs(state_id, "run-1")
+
+        assert "first run" in subject.get_latest_log(state_id)
+
+    @pytest.mark.parametrize(
+        "config_override",
+        [{"elt.logs.compression": "gzip"}],
+    )
+    def test_compression(self, subject, state_id):
+        log_file = self.write_log(subject, state_id, "run-1", "compressed run")
+        subject.finalize_logs(state_id, "run-1")
+
+        assert not os.path.exists(log_file)
+        latest_log = subject.get_all_logs(state_id)[0]
+        assert latest_log.name == "elt.log.gz"
+
+        with gzip.open(latest_log, "rt") as compressed_log:
+            assert "compressed run" in compressed_log.read()
+
+        assert "compressed run" in subject.get_latest_log(state_id)
+        assert subject.get_downloadable_log(state_id).endswith(".log.gz")
+
+    @pytest.mark.parametrize(
+        "config_override",
+        [{"elt.logs.max_bytes": 256, "elt.logs.backup_count": 2}],
+    )
+    def test_rotation(self, subject, state_id):
+        output_logger = subject.output_logger(state_id, "run-1")
+        out = output_logger.out("meltano")
+        with out.redirect_logging():
+            for idx in range(20):
+                out.logger.info(f"line {idx}")
+
+        log_names = sorted(
+            path.name for path in subject.logs_dir(state_id, "run-1").iterdir()
+        )
+        assert log_names == ["elt.log", "elt.log.1", "elt.log.2"]
+
+        # Rotated backups are listed after the current log of the run
+        all_logs = subject.get_all_logs(state_id)
+        assert [path.name for path in all_logs] == ["elt.log", "elt.log.1", "elt.log.2"]
+        assert "line 19" in subject.get_latest_log(state_id)
+
+    @pytest.mark.parametrize(
+        "config_override",
+        [
+            {
+                "elt.logs.max_bytes": 256,
+                "elt.logs.backup_count": 2,
+                "elt.logs.compression": "gzip",
+            }
+        ],
+    )
+    def test_rotation_compressed(self, subject, state_id):
+        output_logger = subject.output_logger(state_id, "run-1")
+        out = output_logger.out("meltano")
+        with out.redirect_logging():
+            for idx in range(20):
+                out.logger.info(f"line {idx}")
+        subject.finalize_logs(state_id, "run-1")
+
+        all_logs = subject.get_all_logs(state_id)
+        assert [path.name for path in all_logs] == [
+            "elt.log.gz",
+            "elt.log.1.gz",
+            "elt.log.2.gz",
+        ]
+        assert "line 19" in subject.get_latest_log(state_id)
+
+    def test_get_all_logs_by_run(self, subject, state_id):
+        older_log = self.write_log(subject, state_id, "run-1", "older run")
+        newer_log = self.write_log(subject, state_id, "run-2", "newer run")
+        future = time.time() + 60
+        os.utime(subject.logs_dir(state_id, "run-1"), (future, future))
+
+        # Runs are ordered by the modification time of their directory
+        assert subject.get_all_logs(state_id) == [older_log, newer_log]
+        assert "older run" in subject.get_latest_log(state_id)
+
+    def test_get_latest_log_lists_latest_run(self, subject, state_id):
+        for idx in range(3):
+            self.write_log(subject, state_id, f"run-{idx}", f"run {idx}")
+            run_dir = subject.logs_dir(state_id, f"run-{idx}")
+            os.utime(run_dir, (idx, idx))
+
+        with mock.patch.object(
+            Path, "glob", autospec=True, side_effect=Path.glob
+        ) as glob:
+            assert "run 2" in subject.get_latest_log(state_id)
+
+        assert [call.args[0].name for call in glob.call_args_list] == ["run-2"]
+
+    @pytest.mark.parametrize(
+        "config_override",
+        [{"elt.logs.keep_last": 2}],
+    )
+    def test_retention_keep_last(self, subject, state_id):
+        for idx in range(4):
+            self.write_log(subject, state_id, f"run-{idx}", f"run {idx}")
+            run_dir = subject.logs_dir(state_id, f"run-{idx}")
+            os.utime(run_dir, (idx, idx))
+        subject.finalize_logs(state_id, "run-3")
+
+        run_dirs = sorted(path.name for path in subject.logs_dir(state_id).iterdir())
+        assert run_dirs == ["run-2", "run-3"]
+
+    def test_prune_logs_max_age(self, subject, state_id):
+        self.write_log(subject, state_id, "old-run", "old run")
+        self.write_log(subject, state_id, "new-run", "new run")
+
+        two_days_ago = time.time() - 2 * 86400
+        os.utime(subject.logs_dir(state_id, "old-run"), (two_days_ago, two_days_ago))
+
+        assert subject.prune_logs(state_id) == 0
+        assert subject.prune_logs(state_id, max_age=1) == 1
+
+        run_dirs = [path.name for path in subject.logs_dir(state_id).iterdir()]
+        assert run_dirs == ["new-run"]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+import structlog
+from structlog.testing import LogCapture
+
+from meltano.core.logging.log_sink import BufferedLogSink
+from meltano.core.logging.output_logger import OutputLogger
+
+
+class TestBufferedLogSink:
+    @pytest.fixture(name="log_output")
+    def fixture_log_output(self):
+        return LogCapture()
+
+    @pytest.fixture(autouse=True)
+    def fixture_configure_structlog(self, log_output):
+        original_config = structlog.get_config()
+        structlog.configure(
+            processors=[log_output],
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            wrapper_class=structlog.stdlib.BoundLogger,
+        )
+        try:
+            yield
+        finally:
+            structlog.configure(**original_config)
+
+    def events(self, log_output, name):
+        return [
+            entry["event"] for entry in log_output.entries if entry.get("name") == name
+        ]
+
+    def test_lines_logged_on_flush(self, log_output):
+        sink = BufferedLogSink()
+        out = OutputLogger(None, sink=sink).out("tap")
+
+        for idx in range(1000):
+            out.writeline(f"line {idx}\n")
+        assert out.last_line == "line 999\n"
+
+        sink.flush()
+
+        assert self.events(log_output, "tap") == [f"line {idx}" for idx in range(1000)]
+        assert not any(
+            thread.name == "meltano-log-sink" for thread in threading.enumerate()
+        )
+
+    def test_queue_overflow(self, log_output):
+        sink = BufferedLogSink(queue_size=10)
+        out = OutputLogger(None, sink=sink).out("tap")
+
+        # Block the background thread so the queue fills up
+        blocker = threading.Event()
+        sink._put(out, "blocked")  # noqa: WPS437
+        sink._queue.put((_BlockingLogger(blocker), 0, "", "blocker"))  # noqa: WPS437
+        for idx in range(100):
+            out.writeline(f"line {idx}")
+
+        assert sink.dropped > 0
+        dropped = sink.dropped
+
+        blocker.set()
+        sink.flush()
+
+        assert len(self.events(log_output, "tap")) == 101 - dropped
+        assert sink.dropped == 0
+
+    def test_max_repeats(self, log_output):
+        sink = BufferedLogSink(max_repeats=2)
+        out = OutputLogger(None, sink=sink).out("tap")
+
+        for _ in range(10):
+            out.writeline("same")
+        out.writeline("different")
+        for _ in range(5):
+            out.writeline("same")
+        sink.flush()
+
+        assert self.events(log_output, "tap") == [
+            "same",
+            "same",
+            "(previous line repeated 8 more times)",
+            "different",
+            "same",
+            "same",
+            "(previous line repeated 3 more times)",
+        ]
+        assert sink.suppressed == 11
+
+    def test_rate_limit(self, log_output):
+        sink = BufferedLogSink(rate_limit=5)
+        out = OutputLogger(None, sink=sink).out("tap")
+
+        for idx in range(20):
+            out.writeline(f"line {idx}")
+        sink.flush()
+
+        assert self.events(log_output, "tap") == [
+            *(f"line {idx}" for idx in range(5)),
+            "(15 lines were not logged due to the rate limit of 5 lines per second)",
+        ]
+
+
+class _BlockingLogger:
+    def __init__(self, event: threading.Event):
+        self.event = event
+
+    def log(self, *args, **kwargs):
+        self.event.wait()
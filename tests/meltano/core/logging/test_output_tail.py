@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from meltano.core.logging.output_tail import OutputTail
+
+
+class TestOutputTail:
+    def test_keeps_last_lines(self):
+        tail = OutputTail(max_lines=3)
+        for idx in range(10):
+            tail.writeline(f"line {idx}\n")
+
+        assert tail.lines == ["line 7\n", "line 8\n", "line 9\n"]
+        assert tail.line_count == 10
+        assert tail.omitted_lines == 7
+        assert tail.last_line == "line 9\n"
+        assert tail.getvalue() == "[7 earlier lines omitted]\nline 7\nline 8\nline 9\n"
+
+    def test_bounded_size(self):
+        tail = OutputTail(max_lines=100, max_size=20)
+        tail.write("a" * 8 + "\n")
+        tail.write("b" * 8 + "\n")
+        tail.write("c" * 8 + "\n")
+
+        assert tail.lines == ["b" * 8 + "\n", "c" * 8 + "\n"]
+        assert tail.size == 27
+
+        # Lines longer than the maximum size are truncated to their end
+        tail.write("d" * 100 + "\n")
+        assert tail.lines == ["d" * 19 + "\n"]
+        assert tail.omitted_lines == 3
+
+    def test_write_pieces(self):
+        tail = OutputTail()
+        tail.write("first ")
+        tail.write("line\nsecond")
+        assert tail.lines == ["first line\n", "second"]
+        assert tail.last_line == "second"
+
+        tail.write(" line\n")
+        assert tail.lines == ["first line\n", "second line\n"]
+        assert tail.line_count == 2
+        assert tail.getvalue() == "first line\nsecond line\n"
+
+    def test_empty(self):
+        tail = OutputTail()
+        assert tail.lines == []
+        assert tail.last_line == ""
+        assert tail.getvalue() == ""
+
+    def test_partial_line_bounded(self):
+        tail = OutputTail(max_lines=2, max_size=20)
+        tail.write("a" * 8 + "\n")
+        tail.write("b" * 8 + "\n")
+        tail.write("c" * 10)
+
+        # The incomplete line counts toward the maximum number of lines and size
+        assert tail.lines == ["b" * 8 + "\n", "c" * 10]
+        tail.write("c" * 10)
+        assert tail.lines == ["c" * 20]
+        assert sum(len(line) for line in tail.lines) <= tail.max_size
@@ -3,6 +3,11 @@ from __future__ import annotations
 import pytest
 
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.singer.mapper import (
+    MappingConflictError,
+    compose_mapping_configs,
+    fuse_mappings,
+)
 
 
 class TestSingerMapper:
@@ -15,3 +20,52 @@ class TestSingerMapper:
         invoker = plugin_invoker_factory(subject)
         async with invoker.prepared(session):
             assert subject.exec_args(invoker) == ["--config", invoker.files["config"]]
+
+
+class TestFuseMappings:
+    def test_compose_mapping_configs(self):
+        composed = compose_mapping_configs(
+            [
+                {"stream_maps": {"users": {"id": "id"}}, "transformations": [1]},
+                {"stream_maps": {"orders": None}, "transformations": [2]},
+                {"flattening_enabled": True, "transformations": [3]},
+            ]
+        )
+        assert composed == {
+            "stream_maps": {"users": {"id": "id"}, "orders": None},
+            "transformations": [1, 2, 3],
+            "flattening_enabled": True,
+        }
+
+    def test_compose_mapping_configs_conflict(self):
+        with pytest.raises(MappingConflictError, match="'stream_maps.users.id'"):
+            compose_mapping_configs(
+                [
+                    {"stream_maps": {"users": {"id": "id"}}},
+                    {"stream_maps": {"users": {"id": "str(id)"}}},
+                ]
+            )
+
+    def test_fuse_mappings(self, project_plugins_service, mapper):
+        mappings = [
+            project_plugins_service.find_plugins_by_mapping_name("mock-mapping-0")[0],
+            project_plugins_service.find_plugins_by_mapping_name("mock-mapping-1")[0],
+        ]
+        fused = fuse_mappings(mappings)
+
+        assert fused["_mapping_name"] == "mock-mapping-0+mock-mapping-1"
+        assert fused["_mappings"] == [
+            {
+                "name": "mock-mapping-0+mock-mapping-1",
+                "config": {
+                    "transformations": [
+                        *mappings[0].extra_config["_mappings"][0]["config"][
+                            "transformations"
+                        ],
+                        *mappings[1].extra_config["_mappings"][1]["config"][
+                            "transformations"
+                        ],
+                    ]
+                },
+            }
+        ]
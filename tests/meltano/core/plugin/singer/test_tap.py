@@ -11,6 +11,7 @@ import pytest
 from mock import AsyncMock, mock
 
 from meltano.core.job import Job, Payload
+from meltano.core.logging.output_tail import DEFAULT_MAX_SIZE
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.error import PluginExecutionError
 from meltano.core.plugin.singer import SingerTap
@@ -18,6 +19,13 @@ from meltano.core.plugin.singer.catalog import ListSelectedExecutor
 from meltano.core.state_service import InvalidJobStateError, StateService
 
 
+def _stream_reader(data: bytes = b"") -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
 class TestSingerTap:
     @pytest.fixture(scope="class")
     def subject(self, project_add_service):
@@ -236,6 +244,47 @@ class TestSingerTap:
                 assert json.loads(catalog_path.read_text()) == {"discovered": True}
                 assert not catalog_cache_key_path.exists()
 
+    @pytest.mark.asyncio
+    async def test_catalog_invocation_cache(
+        self, session, plugin_invoker_factory, subject
+    ):
+        # Block sets of one invocation share the catalog cache of their contexts
+        context = mock.Mock(catalog_cache={})
+        invoker = plugin_invoker_factory(subject, context=context)
+
+        catalog_path = invoker.files["catalog"]
+
+        def mock_discovery(*args, **kwargs):
+            future = asyncio.Future()
+            future.set_result(catalog_path.write_text('{"streams": []}'))
+            return future
+
+        async with invoker.prepared(session):
+            with mock.patch.object(
+                SingerTap, "run_discovery", side_effect=mock_discovery
+            ) as mocked_run_discovery:
+                await subject.discover_catalog(invoker)
+                assert mocked_run_discovery.call_count == 1
+
+                # Without a cached catalog file, the catalog is discovered once
+                catalog_path.unlink()
+                await subject.discover_catalog(invoker)
+                assert mocked_run_discovery.call_count == 1
+                assert json.loads(catalog_path.read_text()) == {"streams": []}
+
+            with mock.patch(
+                "meltano.core.plugin.singer.tap.MetadataExecutor"
+            ) as mocked_metadata_executor:
+                subject.apply_catalog_rules(invoker)
+                applied_catalog = catalog_path.read_text()
+                assert mocked_metadata_executor.call_count == 1
+
+                # The same rules applied to the same catalog are not applied again
+                catalog_path.write_text('{"streams": []}')
+                subject.apply_catalog_rules(invoker)
+                assert mocked_metadata_executor.call_count == 1
+                assert catalog_path.read_text() == applied_catalog
+
     @pytest.mark.asyncio
     async def test_discover_catalog_custom(
         self, project, session, plugin_invoker_factory, subject, monkeypatch
@@ -711,15 +760,8 @@ class TestSingerTap:
         process_mock.name = subject.name
         process_mock.wait = AsyncMock(return_value=0)
         process_mock.returncode = 0
-        process_mock.sterr.at_eof.side_effect = (
-            True  # no output so return eof immediately
-        )
-
-        process_mock.stdout.at_eof.side_effect = (
-            False,
-            True,
-        )  # first check needs to be false so loop starts read, after 1 line, we'll return true
-        process_mock.stdout.readline = AsyncMock(return_value=b'{"discovered": true}\n')
+        process_mock.stderr = _stream_reader()
+        process_mock.stdout = _stream_reader(b'{"discovered": true}\n')
 
         invoke_async = AsyncMock(return_value=process_mock)
         invoker = plugin_invoker_factory(subject)
@@ -747,10 +789,8 @@ class TestSingerTap:
         process_mock.name = subject.name
         process_mock.wait = AsyncMock(return_value=1)
         process_mock.returncode = 1
-        process_mock.stderr.at_eof.side_effect = (False, True)
-        process_mock.stderr.readline = AsyncMock(return_value=b"stderr mock output")
-        process_mock.stdout.at_eof.side_effect = (True, True)
-        process_mock.stdout.readline = AsyncMock(return_value=b"")
+        process_mock.stderr = _stream_reader(b"stderr mock output")
+        process_mock.stdout = _stream_reader()
 
         invoker = plugin_invoker_factory(subject)
         invoker.invoke_async = AsyncMock(return_value=process_mock)
@@ -776,10 +816,8 @@ class TestSingerTap:
         # we need to exit successfully to not trigger error handling
         process_mock.wait = AsyncMock(return_value=0)
         process_mock.returncode = 0
-        process_mock.stderr.at_eof.side_effect = (False, True)
-        process_mock.stderr.readline = AsyncMock(return_value=b"stderr mock output")
-        process_mock.stdout.at_eof.side_effect = (True, True)
-        process_mock.stdout.readline = AsyncMock(return_value=b"")
+        process_mock.stderr = _stream_reader(b"stderr mock output")
+        process_mock.stdout = _stream_reader()
 
         invoker = plugin_invoker_factory(subject)
         invoker.invoke_async = AsyncMock(return_value=process_mock)
@@ -787,17 +825,25 @@ class TestSingerTap:
 
         with mock.patch(
             "meltano.core.plugin.singer.tap.logger.isEnabledFor", return_value=False
-        ), mock.patch("meltano.core.plugin.singer.tap._stream_redirect") as stream_mock:
+        ), mock.patch(
+            "meltano.core.plugin.singer.tap._stream_copy"
+        ) as copy_mock, mock.patch(
+            "meltano.core.plugin.singer.tap._stream_redirect"
+        ) as stream_mock:
             await subject.run_discovery(invoker, catalog_path)
-            assert stream_mock.call_count == 2
+            assert copy_mock.call_count == 1
+            assert stream_mock.call_count == 1
 
         with mock.patch(
             "meltano.core.plugin.singer.tap.logger.isEnabledFor", return_value=True
         ), mock.patch(
+            "meltano.core.plugin.singer.tap._stream_copy"
+        ) as copy_mock2, mock.patch(
             "meltano.core.plugin.singer.tap._stream_redirect"
         ) as stream_mock2:
             await subject.run_discovery(invoker, catalog_path)
-            assert stream_mock2.call_count == 2
+            assert copy_mock2.call_count == 1
+            assert stream_mock2.call_count == 1
 
         # ensure stderr is redirected to devnull if we don't need it
         discovery_logger = logging.getLogger("meltano.core.plugin.singer.tap")
@@ -806,11 +852,14 @@ class TestSingerTap:
         with mock.patch(
             "meltano.core.plugin.singer.tap.logger.isEnabledFor", return_value=True
         ), mock.patch(
+            "meltano.core.plugin.singer.tap._stream_copy"
+        ) as copy_mock3, mock.patch(
             "meltano.core.plugin.singer.tap._stream_redirect"
         ) as stream_mock3:
             await subject.run_discovery(invoker, catalog_path)
 
-            assert stream_mock3.call_count == 2
+            assert copy_mock3.call_count == 1
+            assert stream_mock3.call_count == 1
             call_kwargs = invoker.invoke_async.call_args_list[0][1]
             assert call_kwargs.get("stderr") is subprocess.PIPE
 
@@ -830,16 +879,16 @@ class TestSingerTap:
         process_mock.name = subject.name
         process_mock.wait = AsyncMock(return_value=0)
         process_mock.returncode = 0
-        process_mock.stderr.at_eof.side_effect = (False, True)
-        process_mock.stderr.readline = AsyncMock(return_value=b"stderr mock output")
-        process_mock.stdout.at_eof.side_effect = (False, True)
-        process_mock.stdout.readline.side_effect = Exception("mock readline exception")
+        process_mock.stderr = _stream_reader(b"stderr mock output")
+        process_mock.stdout.read = AsyncMock(
+            side_effect=Exception("mock read exception")
+        )
 
         invoker = plugin_invoker_factory(subject)
         invoker.invoke_async = AsyncMock(return_value=process_mock)
         catalog_path = invoker.files["catalog"]
 
-        with pytest.raises(Exception, match="mock readline exception"):
+        with pytest.raises(Exception, match="mock read exception"):
             await subject.run_discovery(invoker, catalog_path)
 
         assert not catalog_path.exists(), "Catalog should not be present."
@@ -859,11 +908,9 @@ class TestSingerTap:
         # we need to exit successfully to not trigger error handling
         process_mock.wait = AsyncMock(return_value=0)
         process_mock.returncode = 0
-        process_mock.stderr.at_eof.side_effect = (False, True)
         test_string = "Hello world, Καλημέρα κόσμε, コンニチハ".encode()
-        process_mock.stderr.readline = AsyncMock(return_value=test_string)
-        process_mock.stdout.at_eof.side_effect = (True, True)
-        process_mock.stdout.readline = AsyncMock(return_value=b"")
+        process_mock.stderr = _stream_reader(test_string)
+        process_mock.stdout = _stream_reader()
 
         invoker = plugin_invoker_factory(subject)
         invoker.invoke_async = AsyncMock(return_value=process_mock)
@@ -875,3 +922,51 @@ class TestSingerTap:
             "meltano.core.plugin.singer.tap.logger.isEnabledFor", return_value=True
         ):
             await subject.run_discovery(invoker, catalog_path)
+
+    @pytest.mark.asyncio
+    async def test_run_discovery_long_lines(
+        self,
+        plugin_invoker_factory,
+        session,
+        subject,
+    ):
+        # A catalog written as a single line of JSON, longer than a chunk
+        catalog = {
+            "streams": [
+                {"tap_stream_id": f"stream_{idx}", "schema": {}} for idx in range(10000)
+            ]
+        }
+        stderr_line = "Καλημέρα κόσμε " * 10000
+
+        process_mock = mock.Mock()
+        process_mock.name = subject.name
+        process_mock.wait = AsyncMock(return_value=0)
+        process_mock.returncode = 0
+        process_mock.stdout = _stream_reader(json.dumps(catalog).encode())
+        process_mock.stderr = _stream_reader(stderr_line.encode())
+
+        invoker = plugin_invoker_factory(subject)
+        invoker.invoke_async = AsyncMock(return_value=process_mock)
+        catalog_path = invoker.files["catalog"]
+
+        await subject.run_discovery(invoker, catalog_path)
+        assert json.loads(catalog_path.read_bytes()) == catalog
+
+        # Only the end of stderr is reported when discovery fails
+        stderr = "".join(f"log line {idx}\n" for idx in range(1000)) + stderr_line
+        process_mock.wait = AsyncMock(return_value=1)
+        process_mock.returncode = 1
+        process_mock.stdout = _stream_reader()
+        process_mock.stderr = _stream_reader(stderr.encode())
+
+        with mock.patch(
+            "meltano.core.plugin.singer.tap.logger.isEnabledFor", return_value=False
+        ), pytest.raises(PluginExecutionError) as exc_info:
+            await subject.run_discovery(invoker, catalog_path)
+
+        message = str(exc_info.value)
+        # The incomplete last line takes up the whole maximum size
+        assert "[1000 earlier lines omitted]" in message
+        assert stderr_line[-DEFAULT_MAX_SIZE:] in message
+        assert len(message) < DEFAULT_MAX_SIZE * 2
+        assert not catalog_path.exists()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from configparser import ConfigParser
+from contextlib import suppress
 
 import pytest
 from mock import AsyncMock, mock
 
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.airflow import AirflowInvoker
+from meltano.core.plugin.init_marker import INIT_MARKER_FILENAME
 from meltano.core.plugin_install_service import PluginInstallService
 from meltano.core.plugin_invoker import asyncio
 
@@ -89,6 +91,61 @@ class TestAirflow:
 
             assert not run_dir.joinpath("airflow.cfg").exists()
 
+    @pytest.mark.asyncio  # noqa:  WPS210
+    async def test_before_configure_initialized(  # noqa:  WPS210
+        self, subject, project, session, plugin_invoker_factory, monkeypatch
+    ):
+        run_dir = project.run_dir("airflow")
+        with suppress(FileNotFoundError):
+            run_dir.joinpath(INIT_MARKER_FILENAME).unlink()
+
+        handle_mock = mock.Mock()
+        handle_mock.name = subject.name
+        handle_mock.wait = AsyncMock(return_value=0)
+        handle_mock.returncode = 0
+        handle_mock.communicate = AsyncMock(return_value=(b"2.0.1", None))
+
+        def popen_mock(cmd, *popen_args, **kwargs):
+            if "--help" in popen_args:
+                airflow_cfg = ConfigParser()
+                airflow_cfg["core"] = {"dummy": "dummy"}
+                airflow_cfg["webserver"] = {"dummy": "dummy"}
+                with run_dir.joinpath("airflow.cfg").open("w") as cfg:
+                    airflow_cfg.write(cfg)
+            return handle_mock
+
+        with mock.patch.object(
+            asyncio, "create_subprocess_exec", side_effect=popen_mock
+        ) as popen, mock.patch(
+            "meltano.core.plugin_invoker.PluginConfigService.configure"
+        ):
+            invoker: AirflowInvoker = plugin_invoker_factory(subject)
+            async with invoker.prepared(session):
+                assert popen.call_count == 3
+
+            # The default config is restored, without invoking Airflow
+            popen.reset_mock()
+            async with invoker.prepared(session):
+                assert popen.call_count == 0
+
+                airflow_cfg = ConfigParser()
+                with run_dir.joinpath("airflow.cfg").open() as cfg:
+                    airflow_cfg.read_file(cfg)
+                assert airflow_cfg["core"]["dummy"] == "dummy"
+                assert airflow_cfg["core"]["dags_folder"]
+
+            # Changing the config initializes Airflow again
+            monkeypatch.setitem(
+                invoker.settings_service.config_override, "core.load_examples", True
+            )
+            async with invoker.prepared(session):
+                assert popen.call_count == 3
+
+            popen.reset_mock()
+            invoker.force_init = True
+            async with invoker.prepared(session):
+                assert popen.call_count == 3
+
     @pytest.mark.asyncio
     async def test_before_cleanup(self, subject, plugin_invoker_factory):
         invoker: AirflowInvoker = plugin_invoker_factory(subject)
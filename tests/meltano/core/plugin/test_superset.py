@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import platform
 import sys
+from contextlib import suppress
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 from types import ModuleType
@@ -10,6 +11,7 @@ import pytest
 from mock import AsyncMock, mock
 
 from meltano.core.plugin import PluginType
+from meltano.core.plugin.init_marker import INIT_MARKER_FILENAME
 from meltano.core.plugin.superset import SupersetInvoker
 from meltano.core.plugin_install_service import PluginInstallService
 from meltano.core.plugin_invoker import asyncio
@@ -139,6 +141,45 @@ class TestSuperset:
 
             assert not run_dir.joinpath("superset_config.py").exists()
 
+    @pytest.mark.asyncio
+    async def test_hooks_initialized(
+        self, subject, project, session, plugin_invoker_factory
+    ):
+        with suppress(FileNotFoundError):
+            project.run_dir("superset").joinpath(INIT_MARKER_FILENAME).unlink()
+
+        handle_mock = mock.Mock()
+        handle_mock.name = subject.name
+        handle_mock.wait = AsyncMock(return_value=0)
+        handle_mock.returncode = 0
+
+        with mock.patch.object(
+            asyncio, "create_subprocess_exec", return_value=handle_mock
+        ) as popen, mock.patch(
+            "meltano.core.plugin_invoker.PluginConfigService.configure"
+        ):
+            invoker: SupersetInvoker = plugin_invoker_factory(subject)
+
+            async def invoked_commands():
+                popen.reset_mock()
+                async with invoker.prepared(session):
+                    await invoker.invoke_async("--version")
+                return [popen_args[1:] for _, popen_args, _ in popen.mock_calls]
+
+            assert await invoked_commands() == [
+                ("db", "upgrade"),
+                ("init",),
+                ("--version",),
+            ]
+            assert await invoked_commands() == [("--version",)]
+
+            invoker.force_init = True
+            assert await invoked_commands() == [
+                ("db", "upgrade"),
+                ("init",),
+                ("--version",),
+            ]
+
     @pytest.mark.asyncio
     async def test_before_cleanup(self, subject, plugin_invoker_factory):
         invoker: SupersetInvoker = plugin_invoker_factory(subject)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+from mock import mock
+
+from meltano.core.catalog_discovery_service import (
+    CatalogDiscoveryService,
+    CatalogDiscoveryStatus,
+)
+from meltano.core.plugin.error import PluginExecutionError
+from meltano.core.plugin.singer import SingerTap
+
+
+class TestCatalogDiscoveryService:
+    @pytest.fixture
+    def extractors(self, tap, inherited_tap, plugin_invoker_factory):
+        extractors = [tap, inherited_tap]
+        for extractor in extractors:
+            invoker = plugin_invoker_factory(extractor)
+            for file_id in ("catalog", "catalog_cache_key"):
+                if invoker.files[file_id].exists():
+                    invoker.files[file_id].unlink()
+        return extractors
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("parallelism,max_running", [(1, 1), (2, 2)])
+    async def test_discover_catalogs(
+        self,
+        session,
+        project,
+        project_plugins_service,
+        plugin_invoker_factory,
+        extractors,
+        parallelism,
+        max_running,
+    ):
+        running = []
+        peak = 0
+
+        async def mock_discovery(plugin_invoker, catalog_path):
+            nonlocal peak
+            running.append(plugin_invoker.plugin.name)
+            peak = max(peak, len(running))
+            await asyncio.sleep(0.05)
+            catalog_path.write_text(json.dumps({"streams": []}))
+            running.remove(plugin_invoker.plugin.name)
+
+        subject = CatalogDiscoveryService(
+            project, plugins_service=project_plugins_service, parallelism=parallelism
+        )
+        reported = []
+        with mock.patch.object(SingerTap, "run_discovery", side_effect=mock_discovery):
+            results = await subject.discover_catalogs(
+                session, extractors, status_cb=reported.append
+            )
+
+        assert peak == max_running
+        assert [result.plugin for result in results] == extractors
+        assert {result.plugin.name for result in reported} == {
+            extractor.name for extractor in extractors
+        }
+        for result in results:
+            assert result.status is CatalogDiscoveryStatus.SUCCESS
+            assert result.successful
+            assert result.duration > 0
+
+            # The catalogs are cached for later runs
+            invoker = plugin_invoker_factory(result.plugin)
+            assert json.loads(invoker.files["catalog"].read_text()) == {"streams": []}
+            assert invoker.files["catalog_cache_key"].exists()
+
+    @pytest.mark.asyncio
+    async def test_discover_catalogs_failure(
+        self, session, project, project_plugins_service, extractors
+    ):
+        async def mock_discovery(plugin_invoker, catalog_path):
+            if plugin_invoker.plugin.name == extractors[0].name:
+                raise PluginExecutionError("Catalog discovery failed")
+            catalog_path.write_text(json.dumps({"streams": []}))
+
+        subject = CatalogDiscoveryService(
+            project, plugins_service=project_plugins_service
+        )
+        with mock.patch.object(SingerTap, "run_discovery", side_effect=mock_discovery):
+            failed, succeeded = await subject.discover_catalogs(session, extractors)
+
+        assert failed.status is CatalogDiscoveryStatus.ERROR
+        assert not failed.successful
+        assert failed.message == "Catalog discovery failed"
+        assert succeeded.status is CatalogDiscoveryStatus.SUCCESS
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+import sqlalchemy
+from mock import mock
+
+from meltano.core import migration_service
+from meltano.core.migration_service import MigrationService
+from meltano.migrations import LOCK_PATH
+
+
+class TestMigrationService:
+    @pytest.fixture
+    def subject(self, engine_sessionmaker):
+        engine, _ = engine_sessionmaker
+        migration_service._up_to_date_urls.clear()  # noqa: WPS437
+        return MigrationService(engine)
+
+    def test_is_up_to_date(self, subject, project):
+        # The `project` fixture migrated the system database
+        assert subject.is_up_to_date()
+
+        # The result is cached for the process
+        with mock.patch.object(subject.engine, "connect") as connect:
+            assert subject.is_up_to_date()
+        connect.assert_not_called()
+
+    def test_is_up_to_date_outdated(self, subject, project):
+        with subject.engine.begin() as conn:
+            conn.execute(
+                sqlalchemy.text("UPDATE alembic_version SET version_num = 'outdated'")
+            )
+
+        try:
+            assert not subject.is_up_to_date()
+        finally:
+            with subject.engine.begin() as conn:
+                conn.execute(
+                    sqlalchemy.text("UPDATE alembic_version SET version_num = :head"),
+                    {"head": LOCK_PATH.read_text().strip()},
+                )
+
+    def test_is_up_to_date_not_migrated(self, subject, project):
+        error = sqlalchemy.exc.OperationalError(
+            "SELECT version_num FROM alembic_version", {}, "no such table"
+        )
+        with mock.patch.object(subject.engine, "connect") as connect:
+            connect.return_value.execute.side_effect = error
+            assert not subject.is_up_to_date()
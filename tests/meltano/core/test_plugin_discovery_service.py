@@ -415,3 +415,77 @@ class TestPluginDiscoveryServiceDiscoveryManifest:
         self.assert_discovery_yaml(subject, bundled_discovery)
 
         assert subject.cached_discovery_file.exists()
+
+    @pytest.mark.order(18)
+    def test_compiled_discovery(self, subject, bundled_discovery):
+        subject.load_bundled_discovery()
+        assert subject.compiled_discovery_file.exists()
+
+        # The compiled manifest is used instead of parsing the YAML again
+        with mock.patch(
+            "meltano.core.plugin_discovery_service.yaml.load",
+            side_effect=AssertionError("YAML should not be parsed"),
+        ):
+            subject._discovery = None
+            discovery = subject.load_bundled_discovery()
+        assert len(discovery.extractors) == len(bundled_discovery["extractors"])
+
+        # A changed manifest is parsed and compiled again
+        changed_discovery = self.build_discovery_yaml("changed")
+        with self.use_local_discovery(changed_discovery, subject):
+            self.assert_discovery_yaml(subject, changed_discovery)
+
+    @pytest.mark.order(19)
+    def test_remote_discovery_ttl(self, subject):
+        remote_discovery = self.build_discovery_yaml("ttl")
+        with requests_mock.Mocker() as mocker:
+            buf = io.StringIO()
+            yaml.dump(remote_discovery, buf)
+            mocker.get(
+                subject.discovery_url,
+                text=buf.getvalue(),
+                headers={"ETag": '"ttl"'},
+            )
+
+            self.assert_discovery_yaml(subject, remote_discovery)
+            assert mocker.call_count == 1
+
+            # Within the TTL, the cached manifest is used without a request
+            self.assert_discovery_yaml(subject, remote_discovery)
+            assert mocker.call_count == 1
+
+    @pytest.mark.order(20)
+    def test_remote_discovery_revalidation(self, subject):
+        subject.settings_service.set("discovery_url_ttl", 0)
+        remote_discovery = self.build_discovery_yaml("revalidated")
+        with requests_mock.Mocker() as mocker:
+            buf = io.StringIO()
+            yaml.dump(remote_discovery, buf)
+            mocker.get(
+                subject.discovery_url,
+                [
+                    {
+                        "text": buf.getvalue(),
+                        "headers": {
+                            "ETag": '"v1"',
+                            "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+                        },
+                    },
+                    {"status_code": 304},
+                ],
+            )
+
+            self.assert_discovery_yaml(subject, remote_discovery)
+            cached_mtime = subject.cached_discovery_file.stat().st_mtime_ns
+
+            self.assert_discovery_yaml(subject, remote_discovery)
+            assert mocker.call_count == 2
+            revalidation_headers = mocker.request_history[1].headers
+            assert revalidation_headers["If-None-Match"] == '"v1"'
+            assert (
+                revalidation_headers["If-Modified-Since"]
+                == "Wed, 21 Oct 2015 07:28:00 GMT"
+            )
+
+            # The unchanged manifest is not written to the cache again
+            assert subject.cached_discovery_file.stat().st_mtime_ns == cached_mtime
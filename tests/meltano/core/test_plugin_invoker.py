@@ -169,3 +169,23 @@ class TestPluginInvoker:
 
         assert "VIRTUAL_ENV" not in env
         assert "PYTHONPATH" not in env
+
+    @pytest.mark.asyncio
+    async def test_run_files_dir(
+        self, project, tap, session, plugin_invoker_factory, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("MELTANO_RUN_FILES_DIR", str(tmp_path))
+
+        subject = plugin_invoker_factory(tap)
+        async with subject.prepared(session):
+            config_path = subject.files["config"]
+            assert config_path.exists()
+
+        assert config_path.parent.parent.parent == tmp_path
+        assert config_path.parent.name == tap.name
+        assert not config_path.exists()
+
+        # Run directories outside of `.meltano/run` are left alone
+        run_dir = project.root_dir("custom-run-dir")
+        subject = plugin_invoker_factory(tap, run_dir=run_dir)
+        assert subject.files["config"].parent == run_dir
@@ -10,6 +10,7 @@ from meltano.core.plugin_lock_service import (
     LockfileAlreadyExistsError,
     PluginLock,
     PluginLockService,
+    plugin_lock_index,
 )
 from meltano.core.project import Project
 
@@ -81,6 +82,26 @@ class TestPluginLock:
         assert loaded.variant == plugin.variant.name
         assert loaded.settings == plugin.settings
 
+    def test_load_indexed(self, subject: PluginLock):
+        subject.save()
+        loaded = subject.load()
+        assert subject.load() is loaded
+        assert (
+            plugin_lock_index.find(
+                subject.project,
+                PluginType.EXTRACTORS,
+                "tap-locked",
+                variant_name="meltano",
+            )
+            is loaded
+        )
+
+        # Changed lock files are parsed again
+        locked_def = json.loads(subject.path.read_text())
+        locked_def["namespace"] = "tap_locked_changed"
+        subject.path.write_text(json.dumps(locked_def))
+        assert subject.load().namespace == "tap_locked_changed"
+
 
 class TestPluginLockService:
     @pytest.fixture
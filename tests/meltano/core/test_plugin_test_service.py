@@ -146,6 +146,21 @@ class TestExtractorTestService:
         assert not is_valid
         assert "A subprocess error occurred" in detail
 
+    @pytest.mark.asyncio
+    async def test_validate_failure_output_tail(self):
+        lines = [f"log line {idx}".encode() for idx in range(200)]
+        self.mock_invoke.stdout.at_eof.side_effect = (*(False for _ in lines), True)
+        self.mock_invoke.stdout.readline = AsyncMock(side_effect=lines)
+
+        self.mock_invoke.wait = AsyncMock(return_value=1)
+        self.mock_invoke.returncode = 1
+
+        is_valid, detail = await ExtractorTestService(self.mock_invoker).validate()
+
+        assert not is_valid
+        assert detail.startswith("[100 earlier lines omitted]\nlog line 100\n")
+        assert detail.endswith("log line 199")
+
     @pytest.mark.asyncio
     async def test_validate_failure_plugin_invoke_exception(self):
         mock_exception = Exception("An exception occurred on plugin invocation")
@@ -7,6 +7,7 @@ from multiprocessing import Pool
 from multiprocessing.pool import ThreadPool
 
 import pytest
+from mock import mock
 
 from meltano.core.behavior.versioned import IncompatibleVersionError
 from meltano.core.project import PROJECT_ROOT_ENV, Project, ProjectNotFound
@@ -135,6 +136,31 @@ class TestProject:
         assert contents.startswith("# Please don't delete me :)\n")
         assert "a_new_key: New Key" in contents
 
+    def test_dotenv_env(self, project: Project):
+        project.dotenv.write_text("FOO=bar\n")
+        try:
+            dotenv_env = project.dotenv_env
+            assert dotenv_env == {"FOO": "bar"}
+            # The parsed values are shared, and can not be modified
+            assert project.dotenv_env is dotenv_env
+            with pytest.raises(TypeError):
+                dotenv_env["FOO"] = "baz"
+
+            # Updates through `dotenv_update` are picked up, even if the stat is unchanged
+            with mock.patch("meltano.core.project.dotenv_values") as dotenv_values:
+                dotenv_values.return_value = {"FOO": "baz"}
+                with project.dotenv_update():
+                    pass
+                assert project.dotenv_env == {"FOO": "baz"}
+
+            # Other modifications of the file are picked up once the stat changed
+            project.dotenv.write_text("FOO=bar\nBAR=baz\n")
+            assert project.dotenv_env == {"FOO": "bar", "BAR": "baz"}
+        finally:
+            project.dotenv.unlink()
+
+        assert project.dotenv_env == {}
+
 
 class TestIncompatibleProject:
     def test_incompatible(self, project):
@@ -44,6 +44,21 @@ def test_deep_merge(parent, children, expected):
     assert deep_merge(parent, children) == expected
 
 
+@pytest.mark.order(0)
+def test_deep_merge_nested():
+    parent = {"plugins": {"extractors": {"a": 1}}, "version": 1}
+    children = [
+        {"plugins": {"extractors": {"b": 2}, "loaders": {"c": 3}}},
+        {"plugins": {"extractors": {"a": 4}}},
+    ]
+    assert deep_merge(parent, children) == {
+        "plugins": {"extractors": {"a": 4, "b": 2}, "loaders": {"c": 3}},
+        "version": 1,
+    }
+    # the mappings of the parent are not modified
+    assert parent == {"plugins": {"extractors": {"a": 1}}, "version": 1}
+
+
 class TestProjectFiles:
     @pytest.mark.order(1)
     def test_resolve_subfiles(self, project_files):
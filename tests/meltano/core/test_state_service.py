@@ -5,6 +5,7 @@ import platform
 
 import pytest
 
+from meltano.core.job_state import JobState
 from meltano.core.state_service import InvalidJobStateError
 from meltano.core.utils import merge
 
@@ -86,3 +87,22 @@ class TestStateService:
             state_service.move_state(state_id_src, state_id_dst)
             assert not state_service.get_state(state_id_src)
             assert state_service.get_state(state_id_dst) == state_src
+
+    def test_compact_state(
+        self, job_history_session, state_ids_with_expected_states, state_service
+    ):
+        job_history_session.query(JobState).delete()
+        job_history_session.commit()
+        assert not state_service.list_state()
+
+        assert state_service.compact_state(batch_size=4) == len(
+            state_ids_with_expected_states
+        )
+        for (state_id, expected_state) in state_ids_with_expected_states:
+            assert state_service.get_state(state_id) == expected_state
+            assert (
+                state_service.get_state(state_id)
+                == JobState.from_job_history(
+                    job_history_session, state_id
+                ).partial_state
+            )
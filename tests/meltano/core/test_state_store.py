@@ -1,11 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import multiprocessing
+import os
+import time
+from datetime import datetime, timezone
 
 import pytest
 
 from meltano.core.job_state import JobState
-from meltano.core.state_store import DBStateStoreManager
+from meltano.core.project_settings_service import ProjectSettingsService
+from meltano.core.state_store import (
+    DBStateStoreManager,
+    LocalFilesystemStateStoreManager,
+    S3StateStoreManager,
+    StateIDLockedError,
+    UnsupportedStateBackendError,
+    state_store_manager_from_project_settings,
+)
+from meltano.core.state_store.s3 import ClientError
 from meltano.core.utils import merge
 
 
@@ -77,3 +92,392 @@ class TestDBStateStoreManager:
 
     def test_get_state_ids(self, subject: DBStateStoreManager, state_ids_with_jobs):
         assert set(subject.get_state_ids()) == set(state_ids_with_jobs.keys())
+
+
+class TestLocalFilesystemStateStoreManager:
+    @pytest.fixture
+    def subject(self, tmp_path):
+        return LocalFilesystemStateStoreManager(
+            f"file://{tmp_path}", lock_timeout_seconds=1, lock_retry_seconds=0.01
+        )
+
+    def test_set_state(self, subject):
+        partial_state = {"singer_state": {"partial": 1}}
+        complete_state = {"singer_state": {"complete": 1}}
+        second_partial = {"singer_state": {"partial_2": 2}}
+
+        assert subject.get("dev:tap-to-target") == {}
+
+        subject.set("dev:tap-to-target", json.dumps(complete_state), True)
+        assert subject.get("dev:tap-to-target") == complete_state
+
+        subject.set("dev:tap-to-target", json.dumps(partial_state), False)
+        subject.set("dev:tap-to-target", json.dumps(second_partial), False)
+        assert subject.get("dev:tap-to-target") == merge(
+            merge(second_partial, partial_state), complete_state
+        )
+
+        subject.set("dev:tap-to-target", json.dumps(complete_state), True)
+        assert subject.get("dev:tap-to-target") == complete_state
+
+        subject.clear("dev:tap-to-target")
+        assert subject.get("dev:tap-to-target") == {}
+
+    def test_get_state_ids(self, subject):
+        for state_id in ("dev:tap-a-to-target", "dev:tap-b-to-target", "a/b c"):
+            subject.set(state_id, json.dumps({"singer_state": {}}), True)
+
+        assert set(subject.get_state_ids()) == {
+            "dev:tap-a-to-target",
+            "dev:tap-b-to-target",
+            "a/b c",
+        }
+        assert set(subject.get_state_ids("dev:*")) == {
+            "dev:tap-a-to-target",
+            "dev:tap-b-to-target",
+        }
+        assert dict(subject.get_many("a/*")) == {"a/b c": {"singer_state": {}}}
+
+    def test_lock(self, subject, tmp_path):
+        subject.acquire_lock("dev:tap-to-target")
+
+        impatient = LocalFilesystemStateStoreManager(
+            f"file://{tmp_path}", lock_timeout_seconds=0
+        )
+        with pytest.raises(StateIDLockedError):
+            impatient.acquire_lock("dev:tap-to-target")
+
+        subject.release_lock("dev:tap-to-target")
+        impatient.acquire_lock("dev:tap-to-target")
+        impatient.release_lock("dev:tap-to-target")
+
+    def test_stale_lock(self, subject, tmp_path):
+        subject.acquire_lock("dev:tap-to-target")
+        lock_path = tmp_path / "dev%3Atap-to-target" / "lock"
+        assert lock_path.exists()
+
+        stale = time.time() - 60
+        os.utime(lock_path, (stale, stale))
+
+        subject.acquire_lock("dev:tap-to-target")
+        subject.release_lock("dev:tap-to-target")
+        assert not lock_path.exists()
+
+    def test_stale_lock_released_by_original_holder(self, subject, tmp_path):
+        subject.acquire_lock("dev:tap-to-target")
+        lock_path = tmp_path / "dev%3Atap-to-target" / "lock"
+        stale = time.time() - 60
+        os.utime(lock_path, (stale, stale))
+
+        other = LocalFilesystemStateStoreManager(
+            f"file://{tmp_path}", lock_timeout_seconds=1, lock_retry_seconds=0.01
+        )
+        other.acquire_lock("dev:tap-to-target")
+        taken_over = lock_path.read_bytes()
+
+        # The slow original holder releasing its lock keeps the new owner's lock
+        subject.release_lock("dev:tap-to-target")
+        assert lock_path.read_bytes() == taken_over
+        with pytest.raises(StateIDLockedError):
+            LocalFilesystemStateStoreManager(
+                f"file://{tmp_path}", lock_timeout_seconds=0
+            ).acquire_lock("dev:tap-to-target")
+
+        other.release_lock("dev:tap-to-target")
+        assert os.listdir(tmp_path / "dev%3Atap-to-target") == []
+
+    def test_stale_lock_replaced_once(self, subject, tmp_path):
+        subject.acquire_lock("dev:tap-to-target")
+        key = "dev%3Atap-to-target/lock"
+        _, tag = subject._lock_info(key)
+
+        # Of two waiters finding the same stale lock, only one takes it over
+        other = LocalFilesystemStateStoreManager(f"file://{tmp_path}")
+        assert subject._replace_lock(key, tag, b"first")
+        assert not other._replace_lock(key, tag, b"second")
+        assert subject._lock_info(key)[1] == "first"
+        assert os.listdir(tmp_path / "dev%3Atap-to-target") == ["lock"]
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="Requires forking processes",
+    )
+    def test_stale_lock_contended(self, tmp_path):
+        lock_path = tmp_path / "dev%3Atap-to-target" / "lock"
+        lock_path.parent.mkdir()
+        context = multiprocessing.get_context("fork")
+
+        for round_idx in range(3):
+            lock_path.write_text(f"stale {round_idx}")
+            stale = time.time() - 60
+            os.utime(lock_path, (stale, stale))
+
+            log_path = tmp_path / f"log-{round_idx}"
+            start = context.Event()
+            processes = [
+                context.Process(target=_hold_lock, args=(tmp_path, log_path, start))
+                for _ in range(8)
+            ]
+            for process in processes:
+                process.start()
+            start.set()
+            for process in processes:
+                process.join(timeout=30)
+                assert process.exitcode == 0
+
+            # Every process held the lock, one at a time
+            entries = log_path.read_text().split()
+            assert len(entries) == 2 * len(processes)
+            for idx in range(0, len(entries), 2):
+                pid = entries[idx + 1].split(":")[1]
+                assert entries[idx] == f"enter:{pid}"
+                assert entries[idx + 1] == f"exit:{pid}"
+
+
+def _hold_lock(state_dir, log_path, start):
+    manager = LocalFilesystemStateStoreManager(
+        f"file://{state_dir}", lock_timeout_seconds=5, lock_retry_seconds=0.01
+    )
+    lock_info = manager._lock_info
+
+    def slow_lock_info(key):
+        # Let the other waiters find the same lock stale in the meantime
+        info = lock_info(key)
+        time.sleep(0.05)
+        return info
+
+    manager._lock_info = slow_lock_info
+    start.wait()
+    manager.acquire_lock("dev:tap-to-target")
+    with open(log_path, "a") as log_file:
+        log_file.write(f"enter:{os.getpid()}\n")
+    time.sleep(0.01)
+    with open(log_path, "a") as log_file:
+        log_file.write(f"exit:{os.getpid()}\n")
+    manager.release_lock("dev:tap-to-target")
+
+
+class FakeS3Client:
+    """In-memory stand-in for the subset of the S3 API used by the state backend."""
+
+    def __init__(self):
+        self.objects = {}
+        self.downloads = 0
+
+    def _not_found(self, operation_name):
+        return ClientError(
+            {
+                "Error": {"Code": "NoSuchKey"},
+                "ResponseMetadata": {"HTTPStatusCode": 404},
+            },
+            operation_name,
+        )
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):  # noqa: N803
+        if (Bucket, Key) not in self.objects:
+            raise self._not_found("GetObject")
+        body, etag, _ = self.objects[(Bucket, Key)]
+        if IfNoneMatch == etag:
+            raise ClientError(
+                {
+                    "Error": {"Code": "304"},
+                    "ResponseMetadata": {"HTTPStatusCode": 304},
+                },
+                "GetObject",
+            )
+        self.downloads += 1
+        return {"Body": io.BytesIO(body), "ETag": etag}
+
+    def put_object(  # noqa: N803
+        self, Bucket, Key, Body, IfNoneMatch=None, IfMatch=None
+    ):
+        existing = self.objects.get((Bucket, Key))
+        if IfMatch is not None and existing is None:
+            raise self._not_found("PutObject")
+        if (IfNoneMatch == "*" and existing) or (
+            IfMatch is not None and IfMatch != existing[1]
+        ):
+            raise ClientError(
+                {
+                    "Error": {"Code": "PreconditionFailed"},
+                    "ResponseMetadata": {"HTTPStatusCode": 412},
+                },
+                "PutObject",
+            )
+        etag = f'"{hashlib.md5(Body).hexdigest()}"'  # noqa: S303
+        self.objects[(Bucket, Key)] = (Body, etag, datetime.now(timezone.utc))
+        return {"ETag": etag}
+
+    def delete_object(self, Bucket, Key, IfMatch=None):  # noqa: N803
+        existing = self.objects.get((Bucket, Key))
+        if IfMatch is not None:
+            if existing is None:
+                raise self._not_found("DeleteObject")
+            if IfMatch != existing[1]:
+                raise ClientError(
+                    {
+                        "Error": {"Code": "PreconditionFailed"},
+                        "ResponseMetadata": {"HTTPStatusCode": 412},
+                    },
+                    "DeleteObject",
+                )
+        self.objects.pop((Bucket, Key), None)
+
+    def head_object(self, Bucket, Key):  # noqa: N803
+        if (Bucket, Key) not in self.objects:
+            raise self._not_found("HeadObject")
+        _, etag, last_modified = self.objects[(Bucket, Key)]
+        return {"LastModified": last_modified, "ETag": etag}
+
+    def list_objects_v2(  # noqa: N803
+        self, Bucket, Prefix, Delimiter, ContinuationToken=None
+    ):
+        prefixes = sorted(
+            {
+                Prefix + key[len(Prefix) :].split(Delimiter)[0] + Delimiter
+                for bucket, key in self.objects
+                if bucket == Bucket and key.startswith(Prefix)
+            }
+        )
+        # Return one prefix per page to exercise pagination
+        start = int(ContinuationToken or 0)
+        response = {
+            "CommonPrefixes": [{"Prefix": prefix} for prefix in prefixes[start:][:1]],
+            "IsTruncated": start + 1 < len(prefixes),
+        }
+        if response["IsTruncated"]:
+            response["NextContinuationToken"] = str(start + 1)
+        return response
+
+
+class TestS3StateStoreManager:
+    @pytest.fixture
+    def client(self):
+        return FakeS3Client()
+
+    @pytest.fixture
+    def subject(self, client, tmp_path):
+        return S3StateStoreManager(
+            "s3://meltano/state", cache_dir=tmp_path / "cache", client=client
+        )
+
+    def test_set_state(self, subject, client):
+        complete_state = {"singer_state": {"complete": 1}}
+        partial_state = {"singer_state": {"partial": 1}}
+
+        assert subject.get("dev:tap-to-target") == {}
+
+        subject.set("dev:tap-to-target", json.dumps(complete_state), True)
+        subject.set("dev:tap-to-target", json.dumps(partial_state), False)
+        assert subject.get("dev:tap-to-target") == merge(partial_state, complete_state)
+        assert ("meltano", "state/dev%3Atap-to-target/state.json") in client.objects
+
+        subject.clear("dev:tap-to-target")
+        assert subject.get("dev:tap-to-target") == {}
+
+    def test_cached_reads(self, subject, client, tmp_path):
+        client.put_object(
+            Bucket="meltano",
+            Key="state/dev%3Atap-to-target/state.json",
+            Body=json.dumps({"completed": {"singer_state": {"v": 1}}}).encode(),
+        )
+
+        for _ in range(3):
+            assert subject.get("dev:tap-to-target") == {"singer_state": {"v": 1}}
+        assert client.downloads == 1
+
+        # A change made by another Meltano instance is picked up
+        client.put_object(
+            Bucket="meltano",
+            Key="state/dev%3Atap-to-target/state.json",
+            Body=json.dumps({"completed": {"singer_state": {"v": 2}}}).encode(),
+        )
+        assert subject.get("dev:tap-to-target") == {"singer_state": {"v": 2}}
+        assert client.downloads == 2
+
+    def test_get_state_ids(self, subject):
+        for state_id in ("dev:tap-a-to-target", "dev:tap-b-to-target", "prod:tap"):
+            subject.set(state_id, json.dumps({"singer_state": {}}), True)
+
+        assert list(subject.get_state_ids()) == [
+            "dev:tap-a-to-target",
+            "dev:tap-b-to-target",
+            "prod:tap",
+        ]
+        assert list(subject.get_state_ids("dev:*")) == [
+            "dev:tap-a-to-target",
+            "dev:tap-b-to-target",
+        ]
+
+    def test_lock(self, subject, client):
+        subject.acquire_lock("dev:tap-to-target")
+        with pytest.raises(StateIDLockedError):
+            S3StateStoreManager(
+                "s3://meltano/state", client=client, lock_timeout_seconds=0
+            ).acquire_lock("dev:tap-to-target")
+
+        subject.release_lock("dev:tap-to-target")
+        assert not client.objects
+
+    def test_stale_lock(self, subject, client):
+        key = ("meltano", "state/dev%3Atap-to-target/lock")
+        subject.acquire_lock("dev:tap-to-target")
+        body, etag, _ = client.objects[key]
+        client.objects[key] = (body, etag, datetime.fromtimestamp(0, timezone.utc))
+
+        # Of two waiters finding the same stale lock, only one takes it over
+        other = S3StateStoreManager("s3://meltano/state", client=client)
+        _, tag = subject._lock_info("dev%3Atap-to-target/lock")
+        assert subject._replace_lock("dev%3Atap-to-target/lock", tag, b"first")
+        assert not other._replace_lock("dev%3Atap-to-target/lock", tag, b"second")
+        assert client.objects[key][0] == b"first"
+
+        client.objects[key] = (
+            b"first",
+            client.objects[key][1],
+            datetime.fromtimestamp(0, timezone.utc),
+        )
+        other.acquire_lock("dev:tap-to-target")
+        assert client.objects[key][0] != b"first"
+
+    def test_stale_lock_released_by_original_holder(self, subject, client):
+        key = ("meltano", "state/dev%3Atap-to-target/lock")
+        subject.acquire_lock("dev:tap-to-target")
+        body, etag, _ = client.objects[key]
+        client.objects[key] = (body, etag, datetime.fromtimestamp(0, timezone.utc))
+
+        other = S3StateStoreManager(
+            "s3://meltano/state", client=client, lock_retry_seconds=0
+        )
+        other.acquire_lock("dev:tap-to-target")
+        taken_over = client.objects[key][0]
+
+        # The slow original holder releasing its lock keeps the new owner's lock
+        subject.release_lock("dev:tap-to-target")
+        assert client.objects[key][0] == taken_over
+
+        other.release_lock("dev:tap-to-target")
+        assert key not in client.objects
+
+
+class TestStateStoreManagerFromProjectSettings:
+    @pytest.mark.parametrize(
+        ("uri", "manager_class"),
+        [
+            ("systemdb", DBStateStoreManager),
+            ("file:///tmp/meltano-state", LocalFilesystemStateStoreManager),
+        ],
+    )
+    def test_backend(self, project, uri, manager_class):
+        settings = ProjectSettingsService(
+            project, config_override={"state_backend.uri": uri}
+        )
+        manager = state_store_manager_from_project_settings(project, settings)
+        assert isinstance(manager, manager_class)
+
+    def test_unsupported_backend(self, project):
+        settings = ProjectSettingsService(
+            project, config_override={"state_backend.uri": "ftp://example.com/state"}
+        )
+        with pytest.raises(UnsupportedStateBackendError):
+            state_store_manager_from_project_settings(project, settings)
@@ -2,7 +2,14 @@ from __future__ import annotations
 
 import pytest  # noqa: F401
 
-from meltano.core.utils import expand_env_vars, flatten, nest, pop_at_path, set_at_path
+from meltano.core.utils import (
+    expand_env_vars,
+    flatten,
+    merge,
+    nest,
+    pop_at_path,
+    set_at_path,
+)
 
 
 def test_nest():
@@ -28,6 +35,33 @@ def test_nest():
     assert val == start_value and val is not start_value
 
 
+def test_merge():
+    src = {"a": {"b": {"c": 1}, "d": [1]}, "e": 2}
+    dest = {"a": {"b": {"f": 3}}, "e": {"g": 4}}
+
+    assert merge(src, dest) == {"a": {"b": {"c": 1, "f": 3}, "d": [1]}, "e": 2}
+    # nested dicts of `src` are copied unless adopted
+    dest["a"]["b"]["c"] = 5
+    assert src["a"]["b"] == {"c": 1}
+
+    adopted = merge(src, {}, adopt=True)
+    assert adopted == src
+    assert adopted["a"] is src["a"]
+
+
+def test_merge_deep():
+    depth = 5000
+    src = leaf = {}
+    for _ in range(depth):
+        leaf = leaf.setdefault("child", {})
+    leaf["value"] = 1
+
+    dest = merge(src, {})
+    for _ in range(depth):
+        dest = dest["child"]
+    assert dest == {"value": 1}
+
+
 def test_pop_at_path():
     subject = {}
     pop_at_path(subject, "a.b.c")
@@ -8,7 +8,8 @@ import uuid
 from contextlib import contextmanager, suppress
 from http import server as server_lib
 from threading import Thread
-from time import sleep
+from pathlib import Path
+from time import sleep, time
 from typing import TYPE_CHECKING, Any
 
 import mock
@@ -20,7 +21,9 @@ from meltano.core.project_settings_service import ProjectSettingsService
 from meltano.core.tracking.contexts.cli import CliEvent
 from meltano.core.tracking.contexts.environment import EnvironmentContext
 from meltano.core.tracking.contexts.exception import ExceptionContext
+from meltano.core.tracking import spool
 from meltano.core.tracking.contexts.project import ProjectContext
+from meltano.core.tracking.spool import SpoolingEmitter
 from meltano.core.tracking.tracker import TelemetrySettings, Tracker
 from meltano.core.utils import hash_sha256
 
@@ -383,6 +386,99 @@ class TestTracker:
 
         assert timeout_occured is timeout_should_occur
 
+    def test_spooled_events_sent_by_later_invocation(self, project: Project):
+        received = []
+
+        class HTTPRequestHandler(server_lib.SimpleHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802
+                content_length = int(self.headers["Content-Length"])
+                received.append(json.loads(self.rfile.read(content_length)))
+                self.send_response(200, "OK")
+                self.end_headers()
+
+        server = server_lib.HTTPServer(("localhost", 0), HTTPRequestHandler)
+        server_thread = Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.1}
+        )
+        server_thread.start()
+
+        settings_service = ProjectSettingsService(project)
+        settings_service.set(
+            "snowplow.collector_endpoints",
+            f'["http://localhost:{server.server_port}"]',
+        )
+        settings_service.set("snowplow.spool", True)
+
+        try:
+            tracker = Tracker(project)
+            emitter = tracker.snowplow_tracker.emitters[0]
+            emitter.flush_spool().join()
+
+            tracker.track_command_event(CliEvent.started)
+            assert not received
+            with emitter.spool_file.open() as spool_file:
+                assert len(spool_file.readlines()) == 1
+
+            # A later invocation sends the events spooled by this one
+            later_emitter = Tracker(project).snowplow_tracker.emitters[0]
+            later_emitter.flush_spool().join()
+
+            assert len(received) == 1
+            assert len(received[0]["data"]) == 1
+            assert not emitter.spool_file.exists()
+            assert not list(emitter.spool_dir.iterdir())
+        finally:
+            server.shutdown()
+            server_thread.join()
+            settings_service.unset("snowplow.spool")
+            settings_service.set("snowplow.collector_endpoints", "[]")
+
+    def test_spool_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(spool, "MAX_SPOOL_SIZE", 100)
+        emitter = SpoolingEmitter(tmp_path, "localhost")
+        now = time()
+
+        def spool_events(name: str, size: int, age: float) -> Path:
+            path = tmp_path / f"{name}{spool.SPOOL_SUFFIX}"
+            path.write_text("x" * size)
+            os.utime(path, (now - age, now - age))
+            return path
+
+        expired = spool_events("expired", 10, spool.MAX_SPOOL_AGE_SECONDS + 60)
+        oldest = spool_events("oldest", 40, 300)
+        older = spool_events("older", 40, 200)
+        newer = spool_events("newer", 40, 100)
+
+        with mock.patch.object(
+            emitter, "_send_file", side_effect=ConnectionError
+        ) as send_file:
+            assert emitter.send_spooled() == 0
+
+        # The oldest events are dropped first
+        assert not expired.exists()
+        assert not oldest.exists()
+        assert older.exists()
+        assert newer.exists()
+
+        # Sending stops at the first spool file that could not be sent
+        send_file.assert_called_once()
+        assert send_file.call_args[0][0].stem == "older"
+
+    def test_spool_files_sent_per_flush(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(spool, "MAX_FILES_PER_FLUSH", 2)
+        emitter = SpoolingEmitter(tmp_path, "localhost")
+        now = time()
+        for idx in range(5):
+            path = tmp_path / f"{idx}{spool.SPOOL_SUFFIX}"
+            path.write_text("{}\n")
+            os.utime(path, (now - 100 + idx, now - 100 + idx))
+
+        with mock.patch.object(emitter, "_send_file", return_value=1):
+            assert emitter.send_spooled() == 2
+
+        # The oldest spool files are sent first
+        assert sorted(path.stem for path in tmp_path.iterdir()) == ["2", "3", "4"]
+
     def test_project_context_send_anonymous_usage_stats_source(
         self, project: Project, monkeypatch
     ):